@@ -0,0 +1,7 @@
+"""
+Shared tooling for running, timing and benchmarking the day scripts.
+"""
+
+from aoc.runner import find_day_script, load_day, run_day, run_part
+
+__all__ = ["find_day_script", "load_day", "run_day", "run_part"]
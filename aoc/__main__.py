@@ -0,0 +1,239 @@
+"""
+Command line entry point.
+
+    python -m aoc run 1 4 7 --repeat 10
+    python -m aoc run 7 --variant guided --input day7-inputsample.txt --part 1
+    python -m aoc run 11 --part 2 --profile --hot process_round
+    python -m aoc run 24 --mem --mem-top 10 --max-rss 200
+    python -m aoc generate 8 --scale 100 -o /tmp/day8-big.txt
+    python -m aoc bench scaling 1-9 --scales 1,10,100
+    python -m aoc bench importtime all --max-ms 150
+    python -m aoc bench engines 1 --scales 1,100,10000
+    python -m aoc batch --day 11 inputs/day11/ --workers 8
+"""
+
+import argparse
+import sys
+
+from aoc import runner
+
+
+def parse_days(values):
+    days = []
+    for value in values:
+        if value == "all":
+            days.extend(range(1, 26))
+        elif "-" in value:
+            first, last = value.split("-")
+            days.extend(range(int(first), int(last) + 1))
+        else:
+            days.append(int(value))
+    return days
+
+
+def make_cache(args):
+    if args.no_cache:
+        return None
+    from aoc.cache import ResultCache
+    return ResultCache(args.cache_dir, int(args.cache_size * 1024 * 1024))
+
+
+def add_cache_arguments(parser):
+    from aoc.cache import DEFAULT_DIR, DEFAULT_MAX_BYTES
+    parser.add_argument("--no-cache", action="store_true", help="don't read or write the result cache")
+    parser.add_argument("--cache-dir", default=DEFAULT_DIR, help="where cached results are kept")
+    parser.add_argument("--cache-size", type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        help="MB; least recently used results are dropped past this")
+
+
+def cmd_run(args):
+    days = parse_days(args.days)
+    if args.input and len(days) > 1:
+        print("--input only makes sense for a single day", file=sys.stderr)
+        return 2
+    parts = [args.part] if args.part else runner.PARTS
+    # --repeat, --profile and --mem are asking for measurements, so they always solve afresh
+    cache = None if args.repeat > 1 or args.profile or args.mem else make_cache(args)
+    status = 0
+    for day in days:
+        for part in parts:
+            try:
+                module = runner.load_day(day, args.variant)
+                path = args.input or runner.default_input(day)
+                if args.profile:
+                    from aoc import profiling
+                    result = profiling.profile_part(module, day, path, part, args.profile_dir, args.hot)
+                elif args.mem:
+                    from aoc import memory
+                    series_dir = args.profile_dir if args.mem_series else None
+                    result = memory.measure_part(module, day, path, part, args.mem_top, series_dir)
+                else:
+                    result = runner.run_part(module, path, part, args.repeat, cache)
+            # a missing input, part or optional solver dependency (day 19's pyomo) skips just that part
+            except (FileNotFoundError, NotImplementedError, ImportError) as e:
+                print("day %d part %d: skipped (%s)" % (day, part, e), file=sys.stderr)
+                status = 1
+                continue
+            result["day"] = day
+            print(runner.format_result(result))
+            if args.profile:
+                print("  hot functions: %s" % ", ".join(result["hot"]))
+                for artifact in result["artifacts"]:
+                    print("  wrote %s" % artifact)
+            elif args.mem:
+                print(memory.format_memory(result))
+                if args.max_rss is not None and result["peak_rss"] > args.max_rss * 1024 * 1024:
+                    print("day %d part %d: peak rss over %g MB" % (day, part, args.max_rss), file=sys.stderr)
+                    status = 1
+    return status
+
+
+def parse_scales(value):
+    return [float(x) if "." in x else int(x) for x in value.split(",")]
+
+
+def cmd_generate(args):
+    from aoc import generators
+    if args.output:
+        size = generators.write_input(args.day, args.output, args.scale, args.seed)
+        print("wrote %d bytes to %s" % (size, args.output), file=sys.stderr)
+    else:
+        for line in generators.generate_lines(args.day, args.scale, args.seed):
+            sys.stdout.write(line + "\n")
+    return 0
+
+
+def cmd_batch(args):
+    from aoc import batch
+    if args.manifest:
+        jobs = batch.read_manifest(args.manifest, args.day)
+    else:
+        jobs = []
+    if args.sources:
+        if args.day is None:
+            print("--day is needed for input directories and files", file=sys.stderr)
+            return 2
+        jobs.extend(batch.collect_inputs(args.day, args.sources))
+    if not jobs:
+        print("no inputs given", file=sys.stderr)
+        return 2
+    parts = [args.part] if args.part else runner.PARTS
+    cache = make_cache(args)
+    failed = batch.batch(jobs, parts, args.workers, args.variant, args.output, cache)
+    return 1 if failed else 0
+
+
+def cmd_bench_scaling(args):
+    from aoc import bench
+    parts = [args.part] if args.part else runner.PARTS
+    bench.run_scaling(parse_days(args.days), args.scales, parts, args.seed, args.repeat, args.budget, args.output)
+    return 0
+
+
+def cmd_bench_importtime(args):
+    from aoc import bench
+    over = bench.run_importtime(parse_days(args.days), args.repeat, args.top, args.max_ms, args.variant, args.output)
+    if over:
+        print("over the limit or failed to load: %s" % ", ".join(str(day) for day in over), file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_bench_engines(args):
+    from aoc import bench
+    parts = [args.part] if args.part else runner.PARTS
+    mismatches = bench.run_engines(parse_days(args.days), args.scales, parts, args.seed, args.repeat, args.budget, args.output)
+    if mismatches:
+        print("engines disagree on %d inputs" % len(mismatches), file=sys.stderr)
+        return 1
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="aoc", description="Run and time the Advent of Code day scripts")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve one or more days")
+    run.add_argument("days", nargs="+", help="day numbers, ranges like 1-14, or 'all'")
+    run.add_argument("--input", help="input file (defaults to dayN-input.txt)")
+    run.add_argument("--part", type=int, choices=runner.PARTS, help="only run this part")
+    run.add_argument("--repeat", type=int, default=1, help="run each part this many times and keep the best time")
+    run.add_argument("--variant", help="pick an alternate script, e.g. 'guided' for day 7")
+    run.add_argument("--profile", action="store_true",
+                     help="write cProfile, line profiler and collapsed stack artifacts for each part")
+    run.add_argument("--profile-dir", default="profiles", help="where --profile and --mem-series write their artifacts")
+    run.add_argument("--hot", action="append",
+                     help="function to line profile (repeatable); defaults to the day's slowest functions")
+    run.add_argument("--mem", action="store_true",
+                     help="report peak RSS, tracemalloc peak and the top allocation sites for each part")
+    run.add_argument("--mem-top", type=int, default=10, help="how many allocation sites --mem lists")
+    run.add_argument("--mem-series", action="store_true",
+                     help="with --mem, also write the RSS samples over time as dayN-partP.mem.tsv")
+    run.add_argument("--max-rss", type=float, help="MB; with --mem, exit with status 1 if a part peaks above this")
+    add_cache_arguments(run)
+    run.set_defaults(func=cmd_run)
+
+    generate = commands.add_parser("generate", help="write a synthetic input for a day")
+    generate.add_argument("day", type=int)
+    generate.add_argument("--scale", type=float, default=1, help="size as a multiple of the real input")
+    generate.add_argument("--seed", type=int, default=0)
+    generate.add_argument("-o", "--output", help="file to write (defaults to stdout)")
+    generate.set_defaults(func=cmd_generate)
+
+    batch = commands.add_parser("batch", help="solve many inputs across a process pool")
+    batch.add_argument("sources", nargs="*", help="input files, or directories of them (needs --day)")
+    batch.add_argument("--day", type=int, help="the day the inputs are for")
+    batch.add_argument("--manifest", help="file listing '<day> <path>' (or '<path>' with --day) per line")
+    batch.add_argument("--part", type=int, choices=runner.PARTS, help="only run this part")
+    batch.add_argument("--workers", type=int, help="worker processes (defaults to the CPU count)")
+    batch.add_argument("--variant", help="pick an alternate script, e.g. 'guided' for day 7")
+    batch.add_argument("--output", help="write the JSON lines here instead of stdout")
+    add_cache_arguments(batch)
+    batch.set_defaults(func=cmd_batch)
+
+    bench = commands.add_parser("bench", help="benchmark suites")
+    suites = bench.add_subparsers(dest="suite", required=True)
+
+    scaling = suites.add_parser("scaling", help="time each solver on generated inputs of growing size")
+    scaling.add_argument("days", nargs="+", help="day numbers, ranges like 1-14, or 'all'")
+    scaling.add_argument("--scales", type=parse_scales, default=[1, 10, 100, 1000, 10000],
+                         help="comma separated scales, e.g. 1,10,100")
+    scaling.add_argument("--part", type=int, choices=runner.PARTS, help="only run this part")
+    scaling.add_argument("--seed", type=int, default=0)
+    scaling.add_argument("--repeat", type=int, default=1)
+    scaling.add_argument("--budget", type=float, default=10.0,
+                         help="seconds; a part that takes longer isn't run at larger scales")
+    scaling.add_argument("--output", help="also write results as JSON lines to this file")
+    scaling.set_defaults(func=cmd_bench_scaling)
+
+    importtime = suites.add_parser("importtime", help="time loading each day script in a fresh interpreter")
+    importtime.add_argument("days", nargs="+", help="day numbers, ranges like 1-14, or 'all'")
+    importtime.add_argument("--repeat", type=int, default=1, help="load this many times and keep the best time")
+    importtime.add_argument("--top", type=int, default=5, help="how many of the heaviest imports to list")
+    importtime.add_argument("--max-ms", type=float, help="exit with status 1 if a day takes longer than this to load")
+    importtime.add_argument("--variant", help="pick an alternate script, e.g. 'guided' for day 7")
+    importtime.add_argument("--output", help="also write results as JSON lines to this file")
+    importtime.set_defaults(func=cmd_bench_importtime)
+
+    engines = suites.add_parser("engines", help="time a day's alternate ENGINES against each other")
+    engines.add_argument("days", nargs="+", help="day numbers, ranges like 1-14, or 'all'")
+    engines.add_argument("--scales", type=parse_scales, default=[1, 10, 100, 1000],
+                         help="comma separated scales, e.g. 1,10,100")
+    engines.add_argument("--part", type=int, choices=runner.PARTS, help="only run this part")
+    engines.add_argument("--seed", type=int, default=0)
+    engines.add_argument("--repeat", type=int, default=1)
+    engines.add_argument("--budget", type=float, default=10.0,
+                         help="seconds; an engine that takes longer isn't run at larger scales")
+    engines.add_argument("--output", help="also write results as JSON lines to this file")
+    engines.set_defaults(func=cmd_bench_engines)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
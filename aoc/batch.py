@@ -0,0 +1,139 @@
+"""
+Batch mode: solve many input files across a process pool.
+
+Inputs come from directories (every file in them), single files, or a manifest with
+one input per line, either "<day> <path>" or just "<path>" when --day is given. Paths
+in a manifest are relative to the manifest's directory.
+
+Each worker process loads a day module the first time it sees the day and keeps it
+(runner.load_day caches per process), so a batch of thousands of inputs pays for the
+imports once per worker instead of once per file. Results are written as JSON lines as
+soon as each input finishes, with the wall time the worker spent on it:
+
+    python -m aoc batch --day 11 inputs/day11/ --workers 8 > results.jsonl
+    python -m aoc batch --manifest nightly.txt --output results.jsonl
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc import runner
+
+
+def read_manifest(path, day=None):
+    """
+    (day, input path) pairs from a manifest file. Blank lines and # comments are skipped.
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            fields = line.split(None, 1)
+            if len(fields) == 2 and fields[0].isdigit():
+                job_day, input_path = int(fields[0]), fields[1]
+            elif day is not None:
+                job_day, input_path = day, line
+            else:
+                raise ValueError("%s:%d: expected '<day> <path>', or pass --day" % (path, number))
+            jobs.append((job_day, os.path.join(base, input_path)))
+    return jobs
+
+
+def collect_inputs(day, sources):
+    """
+    (day, input path) pairs for every file in the given directories and files.
+    """
+    jobs = []
+    for source in sources:
+        if os.path.isdir(source):
+            names = sorted(os.listdir(source))
+            jobs.extend((day, os.path.join(source, name)) for name in names
+                        if os.path.isfile(os.path.join(source, name)))
+        else:
+            jobs.append((day, source))
+    return jobs
+
+
+# the worker's own ResultCache, built once by _init_worker so its running size total
+# carries over from one input to the next
+_worker_cache = None
+
+
+def _init_worker(days, variant, cache_dir=None, cache_bytes=None):
+    # pool initializer: import each day's module once, up front, in every worker
+    global _worker_cache
+    for day in days:
+        runner.load_day(day, variant)
+    if cache_dir is not None:
+        from aoc.cache import ResultCache
+        _worker_cache = ResultCache(cache_dir, cache_bytes)
+
+
+def _solve_in_worker(day, path, parts, variant):
+    return solve_input(day, path, parts, variant, _worker_cache)
+
+
+def solve_input(day, path, parts=runner.PARTS, variant=None, cache=None):
+    """
+    Solve the parts of one input in the calling process. Returns a result dict that is
+    safe to dump as JSON; a failure is recorded in it rather than raised.
+    """
+    start = time.perf_counter()
+    result = {"day": day, "input": path, "parts": [], "worker": os.getpid()}
+    try:
+        module = runner.load_day(day, variant)
+        for part in parts:
+            if not hasattr(module, "part%d" % part):
+                continue
+            part_result = runner.run_part(module, path, part, cache=cache)
+            part_result["answer"] = str(part_result["answer"])
+            result["parts"].append(part_result)
+    except Exception as e:
+        result["error"] = "%s: %s" % (type(e).__name__, e)
+    result["wall_time"] = time.perf_counter() - start
+    return result
+
+
+def run_batch(jobs, parts=runner.PARTS, workers=None, variant=None, cache=None):
+    """
+    Fan the (day, path) jobs out over a process pool and yield results as they finish.
+    The cache (aoc.cache.ResultCache) is shared through its directory; each worker
+    opens it once, rather than being sent a fresh copy with every input.
+    """
+    days = sorted(set(day for day, _ in jobs))
+    initargs = (days, variant) if cache is None else (days, variant, cache.directory, cache.max_bytes)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        futures = [pool.submit(_solve_in_worker, day, path, parts, variant) for day, path in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def batch(jobs, parts=runner.PARTS, workers=None, variant=None, output=None, cache=None):
+    """
+    Run a batch, writing JSON lines to output (stdout by default) and a summary to stderr.
+    Returns the number of inputs that failed.
+    """
+    out = open(output, "w") if output else sys.stdout
+    start = time.perf_counter()
+    busy = 0.0
+    failed = 0
+    try:
+        for result in run_batch(jobs, parts, workers, variant, cache):
+            busy += result["wall_time"]
+            if "error" in result:
+                failed += 1
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if output:
+            out.close()
+    elapsed = time.perf_counter() - start
+    print("%d inputs (%d failed) in %.2f s, %.2f s of solving, %.1fx parallel speedup" % (
+        len(jobs), failed, elapsed, busy, busy / elapsed if elapsed else 0), file=sys.stderr)
+    return failed
@@ -0,0 +1,301 @@
+"""
+Benchmark suites built on the runner.
+
+scaling: generate inputs for each day at growing scales (see aoc.generators), solve
+them, and record parse and solve time per scale. Once a part takes longer than the
+time budget it is not run at any larger scale. The summary reports a fitted
+exponent k for time ~ scale**k, so k=1 is linear and k=2 quadratic.
+
+    python -m aoc bench scaling 1-14 --scales 1,10,100,1000 --output bench.jsonl
+
+importtime: load each day script in a fresh interpreter under python -X importtime and
+report how long loading took and which top level imports it paid for. With a limit,
+days that take longer to load are reported as over it, so a heavy import creeping back
+in to a solver's module level gets noticed.
+
+    python -m aoc bench importtime all --repeat 3 --max-ms 150
+
+engines: for days that define alternate implementations in an ENGINES dict (engine name
+to {part: function taking the InputFile}), time every engine on the same generated
+inputs and check they agree. Speedups are relative to the first engine listed.
+
+    python -m aoc bench engines 1 --scales 1,100,10000 --repeat 3
+"""
+
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from aoc import generators, runner
+from aoc.inputs import InputFile
+
+DEFAULT_SCALES = (1, 10, 100, 1000, 10000)
+
+
+def scaling(days, scales=DEFAULT_SCALES, parts=runner.PARTS, seed=0, repeat=1, budget=10.0, workdir=None):
+    """
+    Yield one result dict per (day, part, scale) that was run.
+    """
+    workdir = workdir or tempfile.mkdtemp(prefix="aoc-bench-")
+    for day in days:
+        module = runner.load_day(day)
+        over_budget = set()
+        for scale in scales:
+            todo = [p for p in parts if p not in over_budget and hasattr(module, "part%d" % p)]
+            if not todo:
+                break
+            path = os.path.join(workdir, "day%d-scale%s.txt" % (day, scale))
+            size = generators.write_input(day, path, scale, seed)
+            for part in todo:
+                result = {"day": day, "part": part, "scale": scale, "bytes": size}
+                try:
+                    result.update(runner.run_part(module, path, part, repeat))
+                    result["answer"] = str(result["answer"])
+                except Exception as e:
+                    result["error"] = "%s: %s" % (type(e).__name__, e)
+                    over_budget.add(part)
+                else:
+                    if result["parse_time"] + result["solve_time"] > budget:
+                        over_budget.add(part)
+                yield result
+            os.remove(path)
+
+
+def scaling_exponent(results):
+    """
+    Least squares slope of log(time) against log(scale) for one day/part.
+    """
+    points = [(math.log(r["scale"]), math.log(r["parse_time"] + r["solve_time"]))
+              for r in results if "error" not in r and r["parse_time"] + r["solve_time"] > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def format_scaling(result):
+    if "error" in result:
+        return "day %2d part %d scale %6s: %s" % (result["day"], result["part"], result["scale"], result["error"])
+    return "day %2d part %d scale %6s: %10d bytes  parse %10.3f ms  solve %10.3f ms" % (
+        result["day"], result["part"], result["scale"], result["bytes"],
+        result["parse_time"] * 1000, result["solve_time"] * 1000)
+
+
+def run_scaling(days, scales=DEFAULT_SCALES, parts=runner.PARTS, seed=0, repeat=1, budget=10.0, output=None):
+    """
+    Run the scaling suite, print a table and exponent summary, optionally writing JSON lines.
+    """
+    by_part = {}
+    out = open(output, "w") if output else None
+    try:
+        for result in scaling(days, scales, parts, seed, repeat, budget):
+            print(format_scaling(result), flush=True)
+            by_part.setdefault((result["day"], result["part"]), []).append(result)
+            if out:
+                out.write(json.dumps(result) + "\n")
+    finally:
+        if out:
+            out.close()
+
+    print("--- scaling exponents (time ~ scale**k)")
+    for (day, part), results in sorted(by_part.items()):
+        exponent = scaling_exponent(results)
+        solved = [r["scale"] for r in results if "error" not in r]
+        print("day %2d part %d: k=%s  largest scale solved: %s" % (
+            day, part, "%.2f" % exponent if exponent is not None else "n/a", max(solved) if solved else None))
+    return by_part
+
+
+# Loads one day in the child interpreter. The marker splits the importtime log between
+# the runner's own imports and the day's, and the load time is reported on stdout.
+IMPORTTIME_SCRIPT = """
+import sys, time, json
+from aoc import runner
+sys.stderr.write("%s\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+runner.load_day(%d, %r)
+print(json.dumps(time.perf_counter() - start))
+"""
+
+IMPORTTIME_MARKER = "-- aoc day load --"
+
+
+def parse_importtime(log):
+    """
+    Top level (cumulative microseconds, module) entries from python -X importtime output.
+    Nested imports are already counted in their parent's cumulative time.
+    """
+    entries = []
+    for line in log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            entries.append((int(cumulative), name.strip()))
+    return entries
+
+
+def import_time(day, variant=None, python=sys.executable):
+    """
+    Load a day script in a fresh interpreter. Returns the load time in seconds and the
+    top level modules it imported, heaviest first, as (microseconds, module) pairs.
+    """
+    code = IMPORTTIME_SCRIPT % (IMPORTTIME_MARKER, day, variant)
+    proc = subprocess.run([python, "-X", "importtime", "-c", code], cwd=runner.ROOT,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    log = proc.stderr.split(IMPORTTIME_MARKER, 1)[-1]
+    return json.loads(proc.stdout), sorted(parse_importtime(log), reverse=True)
+
+
+def importtime(days, repeat=1, top=5, variant=None):
+    """
+    Yield one result dict per day, keeping the fastest of `repeat` loads.
+    """
+    for day in days:
+        result = {"day": day}
+        try:
+            runs = [import_time(day, variant) for _ in range(repeat)]
+        except (FileNotFoundError, RuntimeError) as e:
+            result["error"] = str(e)
+        else:
+            load_time, modules = min(runs)
+            result["load_time"] = load_time
+            result["imports"] = [{"module": name, "time": us / 1e6} for us, name in modules[:top]]
+        yield result
+
+
+def format_importtime(result):
+    if "error" in result:
+        return "day %2d: %s" % (result["day"], result["error"])
+    heaviest = ", ".join("%s %.1f ms" % (i["module"], i["time"] * 1000) for i in result["imports"])
+    return "day %2d: load %8.1f ms  %s" % (result["day"], result["load_time"] * 1000, heaviest or "(no new imports)")
+
+
+def run_importtime(days, repeat=1, top=5, max_ms=None, variant=None, output=None):
+    """
+    Run the import time suite and print a line per day. Returns the days that failed to
+    load or took longer than max_ms.
+    """
+    over = []
+    out = open(output, "w") if output else None
+    try:
+        for result in importtime(days, repeat, top, variant):
+            line = format_importtime(result)
+            if "error" in result or (max_ms is not None and result["load_time"] * 1000 > max_ms):
+                over.append(result["day"])
+                if "error" not in result:
+                    line += "  OVER %g ms" % max_ms
+            print(line, flush=True)
+            if out:
+                out.write(json.dumps(result) + "\n")
+    finally:
+        if out:
+            out.close()
+    return over
+
+
+def time_call(function, argument, repeat=1):
+    """
+    Best wall time of `repeat` calls, and the answer from the last one.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        answer = function(argument)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, answer
+
+
+def engines(days, scales=DEFAULT_SCALES, parts=runner.PARTS, seed=0, repeat=1, budget=10.0, workdir=None):
+    """
+    Yield one result dict per (day, part, scale), with the time and answer of each of the
+    day's ENGINES on the same generated input. An engine that goes over the budget isn't
+    run at larger scales.
+    """
+    workdir = workdir or tempfile.mkdtemp(prefix="aoc-bench-")
+    for day in days:
+        module = runner.load_day(day)
+        day_engines = getattr(module, "ENGINES", None)
+        if not day_engines:
+            yield {"day": day, "error": "no ENGINES defined"}
+            continue
+        over_budget = set()
+        for scale in scales:
+            path = os.path.join(workdir, "day%d-scale%s.txt" % (day, scale))
+            size = generators.write_input(day, path, scale, seed)
+            input = InputFile(path)
+            for part in parts:
+                result = {"day": day, "part": part, "scale": scale, "bytes": size, "engines": {}}
+                for name, solvers in day_engines.items():
+                    if part not in solvers or (name, part) in over_budget:
+                        continue
+                    try:
+                        elapsed, answer = time_call(solvers[part], input, repeat)
+                    except Exception as e:
+                        result["engines"][name] = {"error": "%s: %s" % (type(e).__name__, e)}
+                        over_budget.add((name, part))
+                        continue
+                    result["engines"][name] = {"time": elapsed, "answer": str(answer)}
+                    if elapsed > budget:
+                        over_budget.add((name, part))
+                answers = set(e["answer"] for e in result["engines"].values() if "answer" in e)
+                if len(answers) > 1:
+                    result["mismatch"] = True
+                if result["engines"]:
+                    yield result
+            del input
+            os.remove(path)
+
+
+def format_engines(result):
+    if "error" in result and "part" not in result:
+        return "day %2d: %s" % (result["day"], result["error"])
+    timings = []
+    baseline = None
+    for name, engine in result["engines"].items():
+        if "error" in engine:
+            timings.append("%s %s" % (name, engine["error"]))
+            continue
+        if baseline is None:
+            baseline = engine["time"]
+            timings.append("%s %.3f ms" % (name, engine["time"] * 1000))
+        else:
+            timings.append("%s %.3f ms (%.1fx)" % (name, engine["time"] * 1000,
+                                                   baseline / engine["time"] if engine["time"] else float("inf")))
+    line = "day %2d part %d scale %6s %10d bytes: %s" % (
+        result["day"], result["part"], result["scale"], result["bytes"], ", ".join(timings))
+    if result.get("mismatch"):
+        line += "  ANSWERS DIFFER"
+    return line
+
+
+def run_engines(days, scales=DEFAULT_SCALES, parts=runner.PARTS, seed=0, repeat=1, budget=10.0, output=None):
+    """
+    Run the engines suite and print a line per day, part and scale, with each engine's
+    speedup over the first one. Returns the results where the engines' answers differ.
+    """
+    mismatches = []
+    out = open(output, "w") if output else None
+    try:
+        for result in engines(days, scales, parts, seed, repeat, budget):
+            print(format_engines(result), flush=True)
+            if result.get("mismatch"):
+                mismatches.append(result)
+            if out:
+                out.write(json.dumps(result) + "\n")
+    finally:
+        if out:
+            out.close()
+    return mismatches
@@ -0,0 +1,162 @@
+"""
+Content-addressed cache of solved answers.
+
+An entry is keyed on (day script, part, SHA-256 of the input file, SHA-256 of the day
+script's source and the aoc package's), so editing a solver, a shared module it builds
+on (aoc.grid, aoc.inputs, ...) or its input is a miss and anything else is a hit that
+skips parsing and solving altogether. Entries are small JSON files under one
+directory; a hit touches its file, and once the directory goes over its size cap the
+least recently used entries are removed.
+
+The runner consults the cache when run_part is given one; the command line does so
+by default, with --no-cache to solve everything afresh.
+
+    cache = ResultCache()
+    runner.run_part(module, "day11-input.txt", 2, cache=cache)
+"""
+
+import hashlib
+import json
+import os
+
+DEFAULT_DIR = os.environ.get("AOC_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".aoc-cache")
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# source hashes of the loaded day scripts, keyed on path
+_code_hashes = {}
+_package_hash = None
+
+
+def file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def package_hash():
+    """
+    SHA-256 over the source of every module in the aoc package, which the day scripts
+    import their grids, inputs and other shared structures from.
+    """
+    global _package_hash
+    if _package_hash is None:
+        digest = hashlib.sha256()
+        for name in sorted(os.listdir(PACKAGE_DIR)):
+            if name.endswith(".py"):
+                digest.update(name.encode() + b"\0" + file_sha256(os.path.join(PACKAGE_DIR, name)).encode())
+        _package_hash = digest.hexdigest()
+    return _package_hash
+
+
+def code_hash(module):
+    """
+    The solver version of a day module: its own source, and the aoc package's.
+    """
+    path = os.path.abspath(module.__file__)
+    if path not in _code_hashes:
+        _code_hashes[path] = hashlib.sha256((file_sha256(path) + package_hash()).encode()).hexdigest()
+    return _code_hashes[path]
+
+
+def _jsonable(answer):
+    # answers are ints and strs; numpy scalars and anything else are stored as their str
+    if isinstance(answer, (bool, int, float, str)) or answer is None:
+        return answer
+    if hasattr(answer, "item"):
+        return answer.item()
+    return str(answer)
+
+
+class ResultCache:
+    def __init__(self, directory=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # running total of the entry sizes, so a put only walks the directory when it's full
+        self._total = None
+
+    def key(self, module, path, part):
+        name = os.path.basename(module.__file__)
+        fields = (name, str(part), file_sha256(path), code_hash(module))
+        return hashlib.sha256("\0".join(fields).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key):
+        """
+        The stored result for a key, or None. A hit counts as a use for eviction.
+        """
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                result = json.load(f)
+            # another process can evict the entry in between, which is just a miss
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            return None
+        return result
+
+    def put(self, key, result):
+        result = dict(result, answer=_jsonable(result["answer"]))
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write then rename, so a parallel batch never reads half an entry
+        temp = "%s.%d.tmp" % (path, os.getpid())
+        with open(temp, "w") as f:
+            json.dump(result, f)
+        # an entry for the same key (stored by another worker, say) is replaced, not added to
+        size = os.path.getsize(temp)
+        try:
+            replaced = os.path.getsize(path)
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(temp, path)
+        if self._total is None:
+            self._total = self.size()
+        else:
+            self._total += size - replaced
+        if self._total > self.max_bytes:
+            self.evict()
+
+    def entries(self):
+        """
+        (last used, size, path) for every entry, least recently used first.
+        """
+        entries = []
+        for dirpath, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                if filename.endswith(".json"):
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """
+        Remove least recently used entries until the cache fits in max_bytes.
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total = total
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.remove(path)
+        self._total = 0
@@ -0,0 +1,231 @@
+"""
+Directory tree index for day 7's "$ cd"/"$ ls" transcripts, shared by both day 7 scripts.
+
+A DirTree is built in one pass over the transcript. Every directory gets an integer id
+(the root / is 0), with its parent's id, its children by name, and its cumulative size in
+flat lists indexed by id. A file line adds its size to the current directory and each of
+its ancestors by following the parent ids up, which is O(depth) with no path strings:
+
+    tree = DirTree.from_lines(input.text)
+    tree.sizes[DirTree.ROOT]                  # the used space
+    tree.total_at_most(100000)                # part 1
+    tree.smallest_at_least(8381165)           # part 2
+    [tree.path(node) for node in tree.at_most(100000)]
+
+Size queries go through the directory sizes in sorted order, built the first time one is
+asked. The order is kept as a list of sorted buckets of about BUCKET_SIZE directories, each
+with the sum of its sizes, so a query is a bisect for the bucket and then within it.
+
+The tree can keep taking lines after it has been queried, for a transcript that is still
+being written: feed() carries on from the current directory, and each directory remembers
+its files, so listing a directory again only adds files that are new to it (or the change
+in size of one that grew). Once the sorted order exists, the directories whose sizes change
+are noted, and the next query moves just those to their new place in their buckets,
+rather than sorting every directory again.
+"""
+
+import bisect
+
+BUCKET_SIZE = 1000
+
+
+class SizeIndex:
+    """
+    Directory sizes in ascending order, (directories of the same size in order of id), as
+    a list of buckets: sizes[b] and nodes[b] are bucket b's sizes and directory ids, and
+    totals[b] the sum of its sizes. Adding or removing a directory is a bisect and a list
+    insert or delete within one bucket.
+    """
+    def __init__(self, sizes):
+        order = sorted(range(len(sizes)), key=sizes.__getitem__)
+        self.nodes = [order[i:i + BUCKET_SIZE] for i in range(0, len(order), BUCKET_SIZE)] or [[]]
+        self.sizes = [[sizes[node] for node in nodes] for nodes in self.nodes]
+        self.totals = [sum(bucket) for bucket in self.sizes]
+        self._firsts()
+
+    def _firsts(self):
+        # the first (size, id) of each bucket but the first, for finding the bucket an entry goes in
+        self.firsts = [(sizes[0], nodes[0]) for sizes, nodes in zip(self.sizes[1:], self.nodes[1:])]
+
+    def _find(self, size, node):
+        bucket = bisect.bisect_right(self.firsts, (size, node))
+        sizes = self.sizes[bucket]
+        start = bisect.bisect_left(sizes, size)
+        stop = bisect.bisect_right(sizes, size, start)
+        return bucket, bisect.bisect_left(self.nodes[bucket], node, start, stop)
+
+    def add(self, size, node):
+        bucket, index = self._find(size, node)
+        sizes, nodes = self.sizes[bucket], self.nodes[bucket]
+        sizes.insert(index, size)
+        nodes.insert(index, node)
+        self.totals[bucket] += size
+        if len(sizes) > 2 * BUCKET_SIZE:
+            self.sizes[bucket:bucket + 1] = [sizes[:BUCKET_SIZE], sizes[BUCKET_SIZE:]]
+            self.nodes[bucket:bucket + 1] = [nodes[:BUCKET_SIZE], nodes[BUCKET_SIZE:]]
+            self.totals[bucket:bucket + 1] = [sum(sizes[:BUCKET_SIZE]), sum(sizes[BUCKET_SIZE:])]
+            self._firsts()
+        elif index == 0 and bucket > 0:
+            self.firsts[bucket - 1] = (size, node)
+
+    def remove(self, size, node):
+        bucket, index = self._find(size, node)
+        sizes, nodes = self.sizes[bucket], self.nodes[bucket]
+        del sizes[index]
+        del nodes[index]
+        self.totals[bucket] -= size
+        if not sizes and len(self.sizes) > 1:
+            del self.sizes[bucket], self.nodes[bucket], self.totals[bucket]
+            self._firsts()
+        elif index == 0 and bucket > 0:
+            self.firsts[bucket - 1] = (sizes[0], nodes[0])
+
+    # the bucket holding the last size of at most limit, and the index just after it
+    def _end(self, limit):
+        bucket = bisect.bisect_right(self.firsts, (limit, float("inf")))
+        return bucket, bisect.bisect_right(self.sizes[bucket], limit)
+
+    def at_most(self, limit):
+        bucket, index = self._end(limit)
+        return [node for nodes in self.nodes[:bucket] for node in nodes] + self.nodes[bucket][:index]
+
+    def total_at_most(self, limit):
+        bucket, index = self._end(limit)
+        return sum(self.totals[:bucket]) + sum(self.sizes[bucket][:index])
+
+    def smallest_at_least(self, minimum):
+        bucket = bisect.bisect_left(self.firsts, (minimum, -1))
+        for sizes in self.sizes[bucket:]:
+            index = bisect.bisect_left(sizes, minimum)
+            if index < len(sizes):
+                return sizes[index]
+        return None
+
+
+class DirTree:
+    ROOT = 0
+
+    def __init__(self):
+        self.names = ["/"]
+        self.parents = [-1]
+        self.children = [{}]
+        self.files = [{}]
+        self.sizes = [0]
+        self.cwd = DirTree.ROOT
+        # the sorted order for size queries, and the sizes the directories that changed since
+        # then had in it (None for directories that are new since)
+        self._index = None
+        self._changed = {}
+
+    @classmethod
+    def from_lines(cls, lines):
+        tree = cls()
+        tree.feed(lines)
+        return tree
+
+    def __len__(self):
+        return len(self.names)
+
+    def directory(self, parent, name):
+        """
+        The id of the directory name in parent, added to the tree if it's new.
+        """
+        children = self.children[parent]
+        node = children.get(name)
+        if node is None:
+            node = len(self.names)
+            children[name] = node
+            self.names.append(name)
+            self.parents.append(parent)
+            self.children.append({})
+            self.files.append({})
+            self.sizes.append(0)
+            if self._index is not None:
+                self._changed[node] = None
+        return node
+
+    def add_file(self, size, name=None, node=None):
+        """
+        Add a file of size bytes to node (the current directory by default) and its
+        ancestors. A named file that node already has is only counted again for the
+        difference in size.
+        """
+        node = self.cwd if node is None else node
+        if name is not None:
+            files = self.files[node]
+            size, files[name] = size - files.get(name, 0), size
+            if not size:
+                return
+        sizes = self.sizes
+        parents = self.parents
+        changed = self._changed if self._index is not None else None
+        while node >= 0:
+            if changed is not None and node not in changed:
+                changed[node] = sizes[node]
+            sizes[node] += size
+            node = parents[node]
+
+    def feed(self, lines):
+        """
+        Read transcript lines (str, with or without their newlines), carrying on from
+        wherever the last lines left the current directory.
+        """
+        for line in lines:
+            words = line.split()
+            if not words:
+                continue
+            if words[0] == "$":
+                if words[1] == "cd":
+                    target = words[2]
+                    if target == "/":
+                        self.cwd = DirTree.ROOT
+                    elif target == "..":
+                        # cd .. at the root stays there
+                        self.cwd = max(self.parents[self.cwd], DirTree.ROOT)
+                    else:
+                        self.cwd = self.directory(self.cwd, target)
+            elif words[0] == "dir":
+                self.directory(self.cwd, words[1])
+            else:
+                self.add_file(int(words[0]), words[1] if len(words) > 1 else None)
+        return self
+
+    def path(self, node):
+        names = []
+        while node > DirTree.ROOT:
+            names.append(self.names[node])
+            node = self.parents[node]
+        return "/" + "/".join(reversed(names))
+
+    def _sorted(self):
+        """
+        The SizeIndex of the directories, brought up to date with any changes since the last query.
+        """
+        changed = self._changed
+        if self._index is None or len(changed) * 8 > len(self.sizes):
+            self._index = SizeIndex(self.sizes)
+        else:
+            for node, size in changed.items():
+                if size is not None:
+                    self._index.remove(size, node)
+                self._index.add(self.sizes[node], node)
+        changed.clear()
+        return self._index
+
+    def at_most(self, limit):
+        """
+        The ids of the directories with a total size of at most limit, smallest first.
+        """
+        return self._sorted().at_most(limit)
+
+    def total_at_most(self, limit):
+        """
+        The sum of the sizes of the directories with a total size of at most limit.
+        """
+        return self._sorted().total_at_most(limit)
+
+    def smallest_at_least(self, minimum):
+        """
+        The size of the smallest directory with a total size of at least minimum, or None.
+        """
+        return self._sorted().smallest_at_least(minimum)
@@ -0,0 +1,435 @@
+"""
+Synthetic, seedable input generators for every day.
+
+Each generator yields the lines of an input in the same format as dayN-input.txt.
+`scale` is a multiple of the size of the real input: scale=1 is roughly the size of
+the bundled input, scale=10000 is ten thousand times that. Grid days grow both
+dimensions by sqrt(scale) so the area (and file size) grows by scale.
+
+The inputs follow each day's format and the constraints the solvers rely on (valid
+crate moves, a single zero on day 20, one humn on day 21, a route from S to E on
+day 12, ...), but they don't promise the hand-picked properties of the real puzzles,
+such as a unique uncovered beacon position on day 15.
+
+    python -m aoc generate 8 --scale 100 --seed 1 -o /tmp/day8-big.txt
+"""
+
+import math
+import random
+import string
+
+SNAFU_DIGITS = "=-012"
+
+
+def _side(base, scale):
+    return max(2, int(round(base * math.sqrt(scale))))
+
+
+def _names(rng, count, length, alphabet=string.ascii_lowercase):
+    """
+    Pick `count` unique random names of `length` letters.
+    """
+    if count > len(alphabet) ** length:
+        raise ValueError("can't make %d unique names of length %d" % (count, length))
+    names = set()
+    while len(names) < count:
+        names.add("".join(rng.choice(alphabet) for _ in range(length)))
+    names = list(names)
+    rng.shuffle(names)
+    return names
+
+
+# Day 1: blocks of calorie counts separated by blank lines
+def day1(rng, scale):
+    lines = int(2268 * scale)
+    written = 0
+    while written < lines:
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 70000))
+            written += 1
+        yield ""
+        written += 1
+
+
+# Day 2: rounds of "A X"
+def day2(rng, scale):
+    for _ in range(int(2500 * scale)):
+        yield "%s %s" % (rng.choice("ABC"), rng.choice("XYZ"))
+
+
+# Day 3: rucksacks with exactly one item shared between halves and one badge per group of three
+def day3(rng, scale):
+    letters = string.ascii_letters
+    for _ in range(max(1, int(100 * scale))):
+        badge = rng.choice(letters)
+        pool = [c for c in letters if c != badge]
+        rng.shuffle(pool)
+        for elf in range(3):
+            elf_pool = pool[elf * 17:(elf + 1) * 17]
+            shared = elf_pool[0]
+            left_pool = elf_pool[1:9]
+            right_pool = elf_pool[9:]
+            half = rng.randint(6, 24)
+            left = [shared, badge] + [rng.choice(left_pool) for _ in range(half - 2)]
+            right = [shared] + [rng.choice(right_pool) for _ in range(half - 1)]
+            rng.shuffle(left)
+            rng.shuffle(right)
+            yield "".join(left) + "".join(right)
+
+
+# Day 4: pairs of section assignments "2-4,6-8"
+def day4(rng, scale):
+    for _ in range(int(1000 * scale)):
+        a = sorted(rng.randint(1, 99) for _ in range(2))
+        b = sorted(rng.randint(1, 99) for _ in range(2))
+        yield "%d-%d,%d-%d" % (a[0], a[1], b[0], b[1])
+
+
+# Day 5: a drawing of 9 crate stacks and a list of valid "move N from A to B" steps
+def day5(rng, scale, stack_count=9):
+    heights = [rng.randint(2, max(2, int(8 * scale))) for _ in range(stack_count)]
+    stacks = [[rng.choice(string.ascii_uppercase) for _ in range(h)] for h in heights]
+    for row in range(max(heights) - 1, -1, -1):
+        cells = ["[%s]" % s[row] if row < len(s) else "   " for s in stacks]
+        yield " ".join(cells)
+    yield " " + "   ".join(str(i + 1) for i in range(stack_count)) + " "
+    yield ""
+    # every stack keeps at least one crate so there is always a top crate to report
+    for _ in range(int(500 * scale)):
+        source = rng.choice([i for i in range(stack_count) if heights[i] > 1])
+        dest = rng.choice([i for i in range(stack_count) if i != source])
+        count = rng.randint(1, min(heights[source] - 1, 40))
+        heights[source] -= count
+        heights[dest] += count
+        yield "move %d from %d to %d" % (count, source + 1, dest + 1)
+
+
+# Day 6: one long datastream whose markers only show up near the end
+def day6(rng, scale):
+    length = int(4096 * scale)
+    # no 4 distinct characters in the first half, no 14 in the second
+    first = [rng.choice("abc") for _ in range(length // 2)]
+    second = [rng.choice("abcdefghijklm") for _ in range(length - length // 2 - 14)]
+    marker = list(string.ascii_lowercase)
+    rng.shuffle(marker)
+    yield "".join(first + second + marker[:14])
+
+
+# Day 7: a "$ cd"/"$ ls" transcript of a random directory tree, each directory listed once
+def day7(rng, scale):
+    count = max(1, int(180 * scale))
+    # attach each new directory to a random earlier one (a random recursive tree)
+    children = [[] for _ in range(count)]
+    for i in range(1, count):
+        children[rng.randrange(i)].append(i)
+
+    def walk(node):
+        yield "$ ls"
+        for child in children[node]:
+            yield "dir d%d" % child
+        for i in range(rng.randint(0, 5)):
+            yield "%d f%d.%s" % (rng.randint(1000, 300000), i, rng.choice(["txt", "dat", "log", "lst"]))
+        for child in children[node]:
+            yield "$ cd d%d" % child
+            yield from walk(child)
+            yield "$ cd .."
+
+    yield "$ cd /"
+    yield from walk(0)
+
+
+# Day 8: a square grid of tree heights
+def day8(rng, scale):
+    side = _side(99, scale)
+    for _ in range(side):
+        yield "".join(rng.choice("0123456789") for _ in range(side))
+
+
+# Day 9: rope motions "R 4"
+def day9(rng, scale):
+    for _ in range(int(2000 * scale)):
+        yield "%s %d" % (rng.choice("RLUD"), rng.randint(1, 20))
+
+
+# Day 10: a CPU program of addx/noop
+def day10(rng, scale):
+    for _ in range(int(142 * scale)):
+        if rng.random() < 0.3:
+            yield "noop"
+        else:
+            yield "addx %d" % rng.randint(-20, 20)
+
+
+# Day 11: monkey specs throwing items between each other
+def day11(rng, scale):
+    count = max(2, int(8 * scale))
+    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23]
+    for monkey in range(count):
+        others = [m for m in range(count) if m != monkey]
+        if_true, if_false = rng.sample(others, 2) if len(others) > 1 else (others[0], others[0])
+        operation = rng.choice(["old * %d" % rng.randint(2, 19), "old + %d" % rng.randint(1, 8), "old * old"])
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        yield "Monkey %d:" % monkey
+        yield "  Starting items: " + items
+        yield "  Operation: new = " + operation
+        yield "  Test: divisible by %d" % rng.choice(primes)
+        yield "    If true: throw to monkey %d" % if_true
+        yield "    If false: throw to monkey %d" % if_false
+        yield ""
+
+
+# Day 12: a height map that ramps up from S on the left to E on the right
+def day12(rng, scale):
+    height = _side(41, scale)
+    width = _side(83, scale)
+    mid = height // 2
+    for y in range(height):
+        row = []
+        for x in range(width):
+            level = min(25, 26 * x // width)
+            # random dips can always be stepped down into; the middle row stays clear
+            if y != mid and rng.random() < 0.15:
+                level = rng.randint(0, level)
+            row.append(chr(ord("a") + level))
+        if y == mid:
+            row[0] = "S"
+            row[-1] = "E"
+        yield "".join(row)
+
+
+def _packet(rng, depth):
+    items = []
+    for _ in range(rng.randint(0, 7)):
+        if depth < 4 and rng.random() < 0.4:
+            items.append(_packet(rng, depth + 1))
+        else:
+            items.append(str(rng.randint(0, 10)))
+    return "[" + ",".join(items) + "]"
+
+
+# Day 13: pairs of nested packet lists separated by blank lines
+def day13(rng, scale):
+    for i in range(int(150 * scale)):
+        if i:
+            yield ""
+        yield _packet(rng, 0)
+        yield _packet(rng, 0)
+
+
+# Day 14: rock paths made of horizontal and vertical segments below the sand source
+def day14(rng, scale):
+    width = _side(100, scale)
+    depth = _side(170, scale)
+    for _ in range(int(168 * scale)):
+        x = rng.randint(500 - width // 2, 500 + width // 2)
+        y = rng.randint(10, depth)
+        points = ["%d,%d" % (x, y)]
+        for i in range(rng.randint(1, 20)):
+            if i % 2 == 0:
+                x = min(500 + width // 2, max(500 - width // 2, x + rng.randint(-6, 6)))
+            else:
+                y = min(depth, max(10, y + rng.randint(-6, 6)))
+            points.append("%d,%d" % (x, y))
+        yield " -> ".join(points)
+
+
+# Day 15: sensors and the closest beacon they see
+def day15(rng, scale):
+    for _ in range(int(32 * scale)):
+        sx, sy = rng.randint(0, 4000000), rng.randint(0, 4000000)
+        reach = rng.randint(100000, 1000000)
+        dx = rng.randint(-reach, reach)
+        dy = (reach - abs(dx)) * rng.choice([-1, 1])
+        yield "Sensor at x=%d, y=%d: closest beacon is at x=%d, y=%d" % (sx, sy, sx + dx, sy + dy)
+
+
+# Day 16: a connected graph of valves, about a quarter of them with a flow rate
+def day16(rng, scale):
+    count = max(2, int(59 * scale))
+    length = 2
+    while 26 ** length < count:
+        length += 1
+    names = ["AA"] + [n for n in _names(rng, count, length, string.ascii_uppercase) if n != "AA"][:count - 1]
+    tunnels = {name: set() for name in names}
+    # a random spanning tree keeps the graph connected, then a few extra tunnels
+    for i in range(1, count):
+        other = names[rng.randrange(i)]
+        tunnels[names[i]].add(other)
+        tunnels[other].add(names[i])
+    for _ in range(count // 4):
+        a, b = rng.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+    for name in names:
+        rate = 0 if name == "AA" or rng.random() > 0.25 else rng.randint(2, 25)
+        leads = sorted(tunnels[name])
+        if len(leads) == 1:
+            yield "Valve %s has flow rate=%d; tunnel leads to valve %s" % (name, rate, leads[0])
+        else:
+            yield "Valve %s has flow rate=%d; tunnels lead to valves %s" % (name, rate, ", ".join(leads))
+
+
+# Day 17: one line of jet pushes
+def day17(rng, scale):
+    yield "".join(rng.choice("<>") for _ in range(int(10091 * scale)))
+
+
+# Day 18: a lumpy droplet of unit cubes
+def day18(rng, scale):
+    count = int(2830 * scale)
+    radius = 10 * scale ** (1 / 3)
+    center = int(radius) + 1
+    cubes = set()
+    while len(cubes) < count:
+        x, y, z = (rng.randint(0, 2 * center) for _ in range(3))
+        if (x - center) ** 2 + (y - center) ** 2 + (z - center) ** 2 <= radius ** 2 and rng.random() < 0.8:
+            cubes.add((x, y, z))
+    for cube in cubes:
+        yield "%d,%d,%d" % cube
+
+
+# Day 19: robot factory blueprints
+def day19(rng, scale):
+    for i in range(1, int(29 * scale) + 1):
+        yield ("Blueprint %d: Each ore robot costs %d ore. Each clay robot costs %d ore. "
+               "Each obsidian robot costs %d ore and %d clay. Each geode robot costs %d ore and %d obsidian."
+               % (i, rng.randint(2, 4), rng.randint(2, 4), rng.randint(2, 4), rng.randint(5, 20),
+                  rng.randint(2, 4), rng.randint(5, 20)))
+
+
+# Day 20: an encrypted list of numbers with exactly one zero
+def day20(rng, scale):
+    count = int(5000 * scale)
+    zero = rng.randrange(count)
+    for i in range(count):
+        if i == zero:
+            yield "0"
+        else:
+            yield str(rng.choice([-1, 1]) * rng.randint(1, 10000))
+
+
+# Day 21: yelling monkeys forming one expression tree under root, with a single humn leaf
+def day21(rng, scale):
+    # names are four letters, so the tree can't be bigger than that name space
+    leaves = min(max(2, int(1834 * scale) // 2), 26 ** 4 // 2 - 2)
+    names = [n for n in _names(rng, 2 * leaves, 4) if n not in ("root", "humn")]
+    # leaves first: (name, value, has_humn)
+    nodes = []
+    for i in range(leaves):
+        name = "humn" if i == 0 else names.pop()
+        value = rng.randint(1, 20)
+        nodes.append((name, value, i == 0))
+        yield "%s: %d" % (name, value)
+    rng.shuffle(nodes)
+    # combine two subtrees at a time until only the two halves of root are left
+    while len(nodes) > 2:
+        (left, lv, lh), (right, rv, rh) = nodes.pop(), nodes.pop()
+        ops = ["+", "-"]
+        if abs(lv * rv) < 10 ** 12:
+            ops.append("*")
+        # humn never ends up in a divisor, and divisions are exact
+        if rv != 0 and not rh and lv % rv == 0:
+            ops.append("/")
+        op = rng.choice(ops)
+        value = {"+": lv + rv, "-": lv - rv, "*": lv * rv, "/": lv // rv if rv else 0}[op]
+        name = names.pop()
+        yield "%s: %s %s %s" % (name, left, op, right)
+        nodes.insert(rng.randrange(len(nodes) + 1), (name, value, lh or rh))
+    yield "root: %s + %s" % (nodes[0][0], nodes[1][0])
+
+
+# Day 22: the cube net from the real input (faces _12/_3_/45_/6__), its face map and edge pairings
+DAY22_LAYOUT = [" 12", " 3 ", "45 ", "6  "]
+DAY22_EDGES = ["1 ^ 6 <", "1 < 4 <", "2 ^ 6 v", "2 v 3 >", "2 > 5 >", "3 < 4 ^", "5 v 6 >"]
+
+
+def day22(rng, scale):
+    side = _side(50, scale)
+    for layout_row in DAY22_LAYOUT:
+        for _ in range(side):
+            row = []
+            for face in layout_row.rstrip():
+                if face == " ":
+                    row.append(" " * side)
+                else:
+                    row.append("".join("#" if rng.random() < 0.05 else "." for _ in range(side)))
+            yield "".join(row)
+    yield ""
+    moves = []
+    for _ in range(int(2000 * scale)):
+        moves.append(str(rng.randint(1, 50)))
+        moves.append(rng.choice("LR"))
+    moves.append(str(rng.randint(1, 50)))
+    yield "".join(moves)
+    yield ""
+    for layout_row in DAY22_LAYOUT:
+        for _ in range(side):
+            yield "".join(" " * side if face == " " else face * side for face in layout_row.rstrip())
+    yield ""
+    yield from DAY22_EDGES
+
+
+# Day 23: a patch of elves
+def day23(rng, scale):
+    side = _side(71, scale)
+    for _ in range(side):
+        yield "".join("#" if rng.random() < 0.5 else "." for _ in range(side))
+
+
+# Day 24: a walled valley of blizzards with clear entrance and exit columns
+def day24(rng, scale):
+    height = _side(20, scale)
+    width = _side(150, scale)
+    yield "#." + "#" * width
+    for _ in range(height):
+        row = []
+        for x in range(width):
+            choices = "<>" if x in (0, width - 1) else "<>^v"
+            row.append(rng.choice(choices) if rng.random() < 0.75 else ".")
+        yield "#" + "".join(row) + "#"
+    yield "#" * width + ".#"
+
+
+def to_snafu(value):
+    digits = []
+    while value:
+        value, remainder = divmod(value + 2, 5)
+        digits.append(SNAFU_DIGITS[remainder])
+    return "".join(reversed(digits)) or "0"
+
+
+# Day 25: SNAFU numbers
+def day25(rng, scale):
+    for _ in range(int(114 * scale)):
+        yield to_snafu(rng.randint(1, 10 ** rng.randint(1, 15)))
+
+
+GENERATORS = {day: globals()["day%d" % day] for day in range(1, 26)}
+
+
+def generate_lines(day, scale=1, seed=None):
+    """
+    Yield the lines of a synthetic input for a day.
+    """
+    if day not in GENERATORS:
+        raise ValueError("no generator for day %d" % day)
+    rng = random.Random(seed)
+    return GENERATORS[day](rng, scale)
+
+
+def generate(day, scale=1, seed=None):
+    """
+    Return a synthetic input for a day as a string.
+    """
+    return "\n".join(generate_lines(day, scale, seed)) + "\n"
+
+
+def write_input(day, path, scale=1, seed=None):
+    """
+    Stream a synthetic input for a day to a file, returning the number of bytes written.
+    """
+    written = 0
+    with open(path, "w") as f:
+        for line in generate_lines(day, scale, seed):
+            written += f.write(line + "\n")
+    return written
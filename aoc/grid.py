@@ -0,0 +1,182 @@
+"""
+Numpy-backed grid shared by the map days.
+
+A Grid is a contiguous 2d numpy array plus the (row, col) coordinate of its top left
+cell, so puzzles can keep their own coordinates (day 14's sand enters at column 500,
+day 15's sensors sit at negative positions) while the storage stays a plain array:
+
+    grid = Grid.from_input(input)              # the puzzle's bytes, one uint8 per cell
+    grid = Grid.full((11, 10), ord('.'), origin=(0, 494))
+    grid[0, 500] = ord('+')                    # puzzle coordinates, checked against the bounds
+    for position in grid.neighbors((3, 498)):  # the in-bounds 4 (or 8) neighbors
+    north = grid.shift(1, 0)                   # whole-array moves instead of per-cell loops
+
+Indexing with two ints is bounds checked, and raises IndexError outside the grid rather
+than wrapping around like a negative numpy index would. Slices are in puzzle coordinates
+too, and the underlying array is always there as grid.cells for vectorized work.
+"""
+
+import numpy
+
+ORTHOGONAL = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONAL = ((-1, -1), (-1, 1), (1, 1), (1, -1))
+
+
+def shift(array, drow, dcol, fill=0):
+    """
+    A copy of a 2d array with its contents moved drow rows down and dcol columns right.
+    Cells moved off the edge are dropped, and the cells left behind are set to fill.
+    """
+    result = numpy.full_like(array, fill)
+    rows, cols = array.shape
+    if abs(drow) >= rows or abs(dcol) >= cols:
+        return result
+    result[max(drow, 0):rows + min(drow, 0), max(dcol, 0):cols + min(dcol, 0)] = \
+        array[max(-drow, 0):rows + min(-drow, 0), max(-dcol, 0):cols + min(-dcol, 0)]
+    return result
+
+
+class Grid:
+    def __init__(self, cells, origin=(0, 0)):
+        self.cells = numpy.asarray(cells)
+        self.origin = (int(origin[0]), int(origin[1]))
+
+    @classmethod
+    def full(cls, shape, fill, dtype=numpy.uint8, origin=(0, 0)):
+        return cls(numpy.full(shape, fill, dtype=dtype), origin)
+
+    @classmethod
+    def from_bytes(cls, data, fill=b" ", origin=(0, 0)):
+        """
+        Parse text into a uint8 grid of its bytes. data is bytes (split on newlines) or an
+        iterable of lines, bytes or str. Short lines are padded with fill, and blank lines
+        at the end are dropped.
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data).splitlines()
+        lines = [line.encode() if isinstance(line, str) else bytes(line) for line in data]
+        lines = [line.rstrip(b"\r\n") for line in lines]
+        while lines and not lines[-1].strip():
+            lines.pop()
+        width = max((len(line) for line in lines), default=0)
+        if all(len(line) == width for line in lines):
+            cells = numpy.frombuffer(b"".join(lines), dtype=numpy.uint8).reshape(len(lines), width).copy()
+        else:
+            cells = numpy.full((len(lines), width), ord(fill), dtype=numpy.uint8)
+            for row, line in enumerate(lines):
+                cells[row, :len(line)] = numpy.frombuffer(line, dtype=numpy.uint8)
+        return cls(cells, origin)
+
+    @classmethod
+    def from_input(cls, input, origin=(0, 0)):
+        """
+        A rectangular puzzle input (aoc.inputs.InputFile) copied out of the mapping.
+        """
+        return cls(numpy.ascontiguousarray(input.grid()), origin)
+
+    @property
+    def shape(self):
+        return self.cells.shape
+
+    @property
+    def rows(self):
+        return range(self.origin[0], self.origin[0] + self.cells.shape[0])
+
+    @property
+    def cols(self):
+        return range(self.origin[1], self.origin[1] + self.cells.shape[1])
+
+    def __contains__(self, position):
+        row, col = position[0] - self.origin[0], position[1] - self.origin[1]
+        return 0 <= row < self.cells.shape[0] and 0 <= col < self.cells.shape[1]
+
+    def _axis_index(self, value, offset, size):
+        if isinstance(value, slice):
+            return slice(None if value.start is None else max(value.start - offset, 0),
+                         None if value.stop is None else max(value.stop - offset, 0),
+                         value.step)
+        index = value - offset
+        if not 0 <= index < size:
+            raise IndexError("%d is outside %d..%d" % (value, offset, offset + size - 1))
+        return index
+
+    def index(self, position):
+        """
+        The numpy index for a (row, col) position; either part can also be a slice.
+        """
+        return (self._axis_index(position[0], self.origin[0], self.cells.shape[0]),
+                self._axis_index(position[1], self.origin[1], self.cells.shape[1]))
+
+    def position(self, index):
+        """
+        The (row, col) position of a numpy index, the inverse of index().
+        """
+        return (int(index[0]) + self.origin[0], int(index[1]) + self.origin[1])
+
+    def __getitem__(self, position):
+        return self.cells[self.index(position)]
+
+    def __setitem__(self, position, value):
+        self.cells[self.index(position)] = value
+
+    def find(self, value):
+        """
+        Positions of every cell equal to value, in row major order.
+        """
+        return [self.position(index) for index in numpy.argwhere(self.cells == value)]
+
+    def coordinates(self):
+        """
+        Open (rows, 1) and (1, cols) arrays of the row and column coordinates, which
+        broadcast against the cells.
+        """
+        rows, cols = numpy.ogrid[0:self.cells.shape[0], 0:self.cells.shape[1]]
+        return rows + self.origin[0], cols + self.origin[1]
+
+    def neighbors(self, position, diagonal=False):
+        """
+        The in-bounds positions next to position: up, right, down, left, then the
+        diagonals if asked for.
+        """
+        row, col = position
+        offsets = ORTHOGONAL + DIAGONAL if diagonal else ORTHOGONAL
+        for drow, dcol in offsets:
+            neighbor = (row + drow, col + dcol)
+            if neighbor in self:
+                yield neighbor
+
+    def shift(self, drow, dcol, fill=0):
+        """
+        The cells moved drow rows down and dcol columns right, as an array the same shape
+        as the grid. shift(1, 0)[r, c] is the cell above (r, c).
+        """
+        return shift(self.cells, drow, dcol, fill)
+
+    def roll(self, drow, dcol):
+        """
+        Like shift, but cells moved off one edge come back on the other.
+        """
+        return numpy.roll(self.cells, (drow, dcol), axis=(0, 1))
+
+    def grow(self, top=0, bottom=0, left=0, right=0, fill=0):
+        """
+        A new grid with extra rows and columns of fill around the edges. The existing
+        cells keep their coordinates.
+        """
+        cells = numpy.pad(self.cells, ((top, bottom), (left, right)), constant_values=fill)
+        return Grid(cells, (self.origin[0] - top, self.origin[1] - left))
+
+    def copy(self):
+        return Grid(self.cells.copy(), self.origin)
+
+    def render(self, symbols=None):
+        """
+        The grid as text, one line per row. Cells are looked up in symbols, or else taken
+        to be bytes.
+        """
+        if symbols is not None:
+            return "\n".join("".join(symbols.get(value, "?") for value in row) for row in self.cells.tolist())
+        return "\n".join(row.tobytes().decode("latin-1") for row in self.cells.astype(numpy.uint8))
+
+    def __repr__(self):
+        return "Grid(%dx%d at %s)" % (self.cells.shape[0], self.cells.shape[1], self.origin)
@@ -0,0 +1,124 @@
+"""
+Memory-mapped input loader shared by the day scripts.
+
+The old pattern, f.readlines() followed by [x.strip() for x in content], keeps two
+full copies of the input as Python strings before any work starts. InputFile maps
+the file instead and hands out one line at a time, so the only full copy is the
+page cache's:
+
+    data = InputFile("day8-input.txt")
+    for line in data:        # bytes, one line at a time, newline stripped
+    for line in data.text:   # the same lines decoded to str
+    for view in data.views():  # memoryview slices of the mapping, no copying at all
+    data.grid()              # numpy uint8 (rows, cols) view of a rectangular grid
+
+Iterating is repeatable, so a parse() can hand the InputFile (or .text) straight to
+a solver that walks it more than once. Lines come back like readlines() would give
+them, minus the line ending: a trailing newline doesn't produce an extra empty line.
+"""
+
+import mmap
+import os
+
+
+class TextLines:
+    """
+    Re-iterable str view of an InputFile's lines.
+    """
+
+    def __init__(self, input_file, encoding="utf-8"):
+        self.input_file = input_file
+        self.encoding = encoding
+
+    def __iter__(self):
+        for line in self.input_file:
+            yield line.decode(self.encoding)
+
+
+class InputFile:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap can't map an empty file
+                self._map = b""
+            else:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self._map)
+
+    def __len__(self):
+        return len(self._map)
+
+    def _spans(self):
+        data = self._map
+        end = len(data)
+        start = 0
+        while start < end:
+            newline = data.find(b"\n", start)
+            if newline == -1:
+                newline = end
+            stop = newline
+            if stop > start and data[stop - 1] == 13:  # \r\n
+                stop -= 1
+            yield start, stop
+            start = newline + 1
+
+    def __iter__(self):
+        data = self._map
+        for start, stop in self._spans():
+            yield data[start:stop]
+
+    def views(self):
+        """
+        memoryview slices of each line; nothing is copied.
+        """
+        for start, stop in self._spans():
+            yield self.buffer[start:stop]
+
+    @property
+    def text(self):
+        return TextLines(self)
+
+    def first_line(self):
+        """
+        memoryview of the first line, for single line inputs like day 6's datastream.
+        """
+        for view in self.views():
+            return view
+        return self.buffer[0:0]
+
+    def grid(self):
+        """
+        A (rows, cols) numpy uint8 array over the mapped bytes of a rectangular grid,
+        stepping over the newline (\n or \r\n) at the end of each row. Read-only, and nothing is
+        copied until the caller does arithmetic on it.
+        """
+        import numpy
+
+        data = self._map
+        width = data.find(b"\n")
+        if width == -1:
+            width = len(data)
+        # rows end in \n, or in \r\n, which is two bytes to step over
+        newline = 2 if width > 0 and data[width - 1:width] == b"\r" else 1
+        width -= newline - 1
+        stride = width + newline
+        # the last row may or may not end with a newline
+        rows = (len(data) + newline) // stride
+        while rows and data[(rows - 1) * stride:(rows - 1) * stride + width].strip() == b"":
+            rows -= 1
+        return numpy.ndarray((rows, width), dtype=numpy.uint8, buffer=self.buffer, strides=(stride, 1))
+
+    def close(self):
+        """
+        Unmap the file. Fails with BufferError while views or grids of it are still alive.
+        """
+        self.buffer.release()
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,193 @@
+"""
+Memory mode for the runner.
+
+For one day and part this measures, from two separate runs so tracemalloc's overhead
+doesn't inflate the RSS figures:
+
+    peak RSS            the most resident memory seen while the part ran, and how far
+                        that is above where it started (sampled from /proc/self/statm)
+    tracemalloc peak    the most memory Python objects held at once
+    top allocators      the source lines holding the most memory at that peak
+
+With --mem-series it also writes the RSS samples (seconds since start, bytes) as a two
+column TSV in --profile-dir, to see when memory grows rather than only how far:
+
+    python -m aoc run 24 --mem --mem-top 10 --mem-series
+"""
+
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+
+from aoc import runner
+
+_page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss():
+    """
+    Resident set size of this process in bytes, or None where /proc isn't available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _page_size
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def max_rss():
+    """
+    The process's lifetime high water mark for RSS, in bytes.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RssSampler:
+    """
+    Records (seconds, RSS bytes) every `interval` seconds from a background thread.
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = None
+        self._start = None
+
+    def _sample(self):
+        rss = current_rss()
+        if rss is not None:
+            self.samples.append((time.perf_counter() - self._start, rss))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+    def write(self, path):
+        with open(path, "w") as f:
+            f.write("seconds\trss_bytes\n")
+            for seconds, rss in self.samples:
+                f.write("%.6f\t%d\n" % (seconds, rss))
+
+
+class PeakSnapshotter:
+    """
+    While tracemalloc is tracing, takes a snapshot each time traced memory climbs more
+    than `growth` above the last snapshot, so the one kept is close to the peak.
+    """
+
+    def __init__(self, interval=0.005, growth=1.1):
+        self.interval = interval
+        self.growth = growth
+        self.snapshot = None
+        self.snapshot_size = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def check(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size * self.growth or self.snapshot is None:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def top_allocators(snapshot, count=10):
+    """
+    (bytes, blocks, "file:line") for the source lines holding the most memory.
+    """
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    sites = []
+    for stat in snapshot.statistics("lineno")[:count]:
+        frame = stat.traceback[0]
+        filename = frame.filename
+        if filename.startswith(runner.ROOT + os.sep):
+            filename = os.path.relpath(filename, runner.ROOT)
+        sites.append((stat.size, stat.count, "%s:%d" % (filename, frame.lineno)))
+    return sites
+
+
+def measure_part(module, day, path, part, top=10, series_dir=None, interval=0.005):
+    """
+    Measure one part's memory use. Returns the result of the RSS run with the
+    measurements added.
+    """
+    start_rss = current_rss()
+    with RssSampler(interval) as sampler:
+        result = runner.run_part(module, path, part)
+    if sampler.samples:
+        peak = max(rss for _, rss in sampler.samples)
+        result["peak_rss"] = peak
+        result["rss_growth"] = peak - start_rss
+    else:
+        result["peak_rss"] = max_rss()
+        result["rss_growth"] = None
+
+    tracemalloc.start()
+    try:
+        with PeakSnapshotter(interval) as snapshotter:
+            runner.run_part(module, path, part)
+        _, traced_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    result["tracemalloc_peak"] = traced_peak
+    result["top_allocators"] = top_allocators(snapshotter.snapshot, top) if snapshotter.snapshot else []
+
+    if series_dir:
+        os.makedirs(series_dir, exist_ok=True)
+        series_path = os.path.join(series_dir, "day%d-part%d.mem.tsv" % (day, part))
+        sampler.write(series_path)
+        result["series"] = series_path
+    return result
+
+
+def megabytes(size):
+    return size / (1024 * 1024)
+
+
+def format_memory(result):
+    lines = []
+    growth = result["rss_growth"]
+    lines.append("  peak rss %.1f MB%s, tracemalloc peak %.1f MB" % (
+        megabytes(result["peak_rss"]),
+        " (+%.1f MB)" % megabytes(growth) if growth is not None else "",
+        megabytes(result["tracemalloc_peak"])))
+    for size, blocks, site in result["top_allocators"]:
+        lines.append("    %9.3f MB %8d blocks  %s" % (megabytes(size), blocks, site))
+    if "series" in result:
+        lines.append("  wrote %s" % result["series"])
+    return "\n".join(lines)
@@ -0,0 +1,157 @@
+"""
+Profiling mode for the runner.
+
+For one day and part this writes three artifacts, without touching the day's source:
+
+    dayN-partP.pstats       cProfile stats (open with pstats, snakeviz, ...)
+    dayN-partP.lprof.txt    line-by-line timings of the hot functions (needs line_profiler)
+    dayN-partP.collapsed    sampled stacks in collapsed format for flamegraph.pl / speedscope
+
+Hot functions are the ones named with --hot, or else the day script's own functions
+that spent the most time in the cProfile run. Each artifact comes from a separate
+run so one profiler's overhead doesn't skew the others.
+
+    python -m aoc run 11 --part 2 --profile --hot process_round
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+from aoc import runner
+
+
+class StackSampler:
+    """
+    Samples the main thread's stack every `interval` seconds from a background thread
+    and counts each distinct stack, outermost frame first. Frames above `root` (the
+    runner and CLI plumbing) are left out, as are samples that don't reach it at all.
+
+    The sampling thread can only run when the main thread hands over the GIL, which by
+    default it does every 5 ms, so the switch interval is lowered to a quarter of the
+    sampling interval while sampling, and put back afterwards.
+    """
+
+    def __init__(self, interval=0.001, root=runner.run_part.__code__):
+        self.interval = interval
+        self.root = root
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._target = threading.main_thread().ident
+        self._thread = None
+        self._switch_interval = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            reached_root = self.root is None
+            while frame is not None:
+                code = frame.f_code
+                stack.append("%s (%s:%d)" % (code.co_name, os.path.basename(code.co_filename), code.co_firstlineno))
+                if code is self.root:
+                    reached_root = True
+                    break
+                frame = frame.f_back
+            # samples taken outside the solver (before run_part starts, or while the
+            # runner is stopping the sampler) are only the runner's own frames
+            if stack and reached_root:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self):
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval / 4))
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def write(self, path):
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write("%s %d\n" % (stack, count))
+
+
+def hottest_functions(stats, module, count=3):
+    """
+    Names of the day script's functions with the most time spent in their own bodies.
+    """
+    own_file = os.path.abspath(module.__file__)
+    timings = []
+    for (filename, _, name), (_, _, own_time, _, _) in stats.stats.items():
+        if os.path.abspath(filename) == own_file and callable(getattr(module, name, None)):
+            timings.append((own_time, name))
+    return [name for _, name in sorted(timings, reverse=True)[:count]]
+
+
+def resolve_function(module, name):
+    """
+    Look up a module level function or a Class.method by name.
+    """
+    target = module
+    for attr in name.split("."):
+        target = getattr(target, attr)
+    return target
+
+
+def profile_part(module, day, path, part, out_dir="profiles", hot=None, interval=0.001, sample_time=0.5):
+    """
+    Profile one part and write the artifacts. Returns the result of the cProfile run
+    with the paths of the artifacts that were written. The stack sampler solves the
+    part again and again until sample_time seconds have gone by, so quick parts still
+    get enough samples to draw.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    base = os.path.join(out_dir, "day%d-part%d" % (day, part))
+    artifacts = []
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = runner.run_part(module, path, part)
+    finally:
+        profiler.disable()
+    profiler.dump_stats(base + ".pstats")
+    artifacts.append(base + ".pstats")
+
+    sampler = StackSampler(interval)
+    with sampler:
+        deadline = time.perf_counter() + sample_time
+        runner.run_part(module, path, part)
+        while time.perf_counter() < deadline:
+            runner.run_part(module, path, part)
+    if not sampler.stacks:
+        print("day %d part %d: no stacks sampled in %g ms intervals, the .collapsed file is empty"
+              % (day, part, interval * 1000), file=sys.stderr)
+    sampler.write(base + ".collapsed")
+    artifacts.append(base + ".collapsed")
+
+    hot = hot or hottest_functions(pstats.Stats(profiler), module)
+    try:
+        from line_profiler import LineProfiler
+    except ImportError:
+        print("line_profiler isn't installed, skipping the line report", file=sys.stderr)
+    else:
+        line_profiler = LineProfiler()
+        for name in hot:
+            line_profiler.add_function(resolve_function(module, name))
+        line_profiler.enable_by_count()
+        try:
+            runner.run_part(module, path, part)
+        finally:
+            line_profiler.disable_by_count()
+        with open(base + ".lprof.txt", "w") as f:
+            line_profiler.print_stats(stream=f)
+        artifacts.append(base + ".lprof.txt")
+
+    result["hot"] = hot
+    result["artifacts"] = artifacts
+    return result
@@ -0,0 +1,140 @@
+"""
+Unified runner for the day scripts.
+
+Every day script exposes the same interface:
+
+    parse(input) -> data    turn the memory-mapped input (aoc.inputs.InputFile) into
+                            whatever the solver wants
+    part1(data)  -> answer
+    part2(data)  -> answer
+
+The runner finds the script for a day (day1-calories.py, day7-largedirs.py, ...),
+loads it once, and calls parse/part1/part2 with timing around each step, so the
+solvers can be timed and reused without paying for their own file reads and prints.
+"""
+
+import glob
+import importlib.util
+import os
+import sys
+import time
+
+from aoc.inputs import InputFile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PARTS = (1, 2)
+
+# loaded day modules, keyed on script path
+_modules = {}
+
+
+def find_day_script(day, variant=None, root=ROOT):
+    """
+    Find the script for a day. When there is more than one (day 7 has a guided version),
+    the variant picks the one whose name contains it, otherwise the shortest name wins.
+    """
+    candidates = sorted(glob.glob(os.path.join(root, "day%d-*.py" % day)))
+    if variant:
+        candidates = [c for c in candidates if variant in os.path.basename(c)]
+    if not candidates:
+        raise FileNotFoundError("no script found for day %d" % day)
+    return min(candidates, key=lambda c: len(os.path.basename(c)))
+
+
+def load_day(day, variant=None, root=ROOT):
+    """
+    Import a day script by path (the file names aren't valid module names) and cache it.
+    """
+    path = find_day_script(day, variant, root)
+    if path not in _modules:
+        name = "aoc_" + os.path.splitext(os.path.basename(path))[0].replace("-", "_")
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        _modules[path] = module
+    return _modules[path]
+
+
+def default_input(day, root=ROOT):
+    return os.path.join(root, "day%d-input.txt" % day)
+
+
+def parse_input(module, path):
+    data = InputFile(path)
+    parse = getattr(module, "parse", None)
+    if parse is None:
+        return data
+    return parse(data)
+
+
+def run_part(module, path, part, repeat=1, cache=None):
+    """
+    Parse and solve one part `repeat` times, re-parsing each time so solvers that
+    mutate their input (day 11's monkeys, day 14's sand) always start clean.
+    Returns a result dict with the answer and the parse/solve times in seconds.
+
+    With a cache (aoc.cache.ResultCache), a stored result for the same input and
+    solver source is returned instead, marked "cached", with the times it took when
+    it was solved.
+    """
+    solver = getattr(module, "part%d" % part, None)
+    if solver is None:
+        raise NotImplementedError("%s has no part%d" % (module.__name__, part))
+    if cache is not None:
+        key = cache.key(module, path, part)
+        result = cache.get(key)
+        if result is not None:
+            result["cached"] = True
+            return result
+
+    parse_times = []
+    solve_times = []
+    answer = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = parse_input(module, path)
+        parsed = time.perf_counter()
+        answer = solver(data)
+        solved = time.perf_counter()
+        parse_times.append(parsed - start)
+        solve_times.append(solved - parsed)
+
+    result = {
+        "part": part,
+        "answer": answer,
+        "parse_time": min(parse_times),
+        "solve_time": min(solve_times),
+        "repeat": repeat,
+    }
+    if cache is not None:
+        cache.put(key, result)
+    return result
+
+
+def run_day(day, input_path=None, parts=PARTS, repeat=1, variant=None, cache=None):
+    """
+    Run the requested parts of a day and return a list of result dicts.
+    """
+    module = load_day(day, variant)
+    path = input_path or default_input(day)
+    results = []
+    for part in parts:
+        result = run_part(module, path, part, repeat, cache)
+        result["day"] = day
+        result["input"] = path
+        results.append(result)
+    return results
+
+
+def format_result(result):
+    timing = "parse %.3f ms, solve %.3f ms, best of %d" % (
+        result["parse_time"] * 1000, result["solve_time"] * 1000, result["repeat"])
+    if result.get("cached"):
+        timing = "cached, " + timing
+    answer = result["answer"]
+    # multi-line answers (day 10's CRT image) go below the header
+    if isinstance(answer, str) and "\n" in answer:
+        return "day %d part %d (%s):\n%s" % (result["day"], result["part"], timing, answer)
+    return "day %d part %d: %s  (%s)" % (result["day"], result["part"], answer, timing)
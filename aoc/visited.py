@@ -0,0 +1,268 @@
+"""
+Sets of visited (x, y) cells kept as bits, for day 9's ropes.
+
+A set of tuples costs over 100 bytes a cell, which is what runs out first on long motion
+logs. VisitedCells keeps one bit per cell instead, in packbits order (the first cell of
+each byte in its high bit) over a box around everything visited so far:
+
+    visited = VisitedCells()
+    visited.add(3, -2)
+    visited.add_line(0, 0, 1, 0, 5)     # (0, 0) to (4, 0)
+    len(visited)                        # cells visited at least once
+    visited.bounds()                    # (min x, min y, max x, max y)
+    print(visited.render())             # rows from the top (largest y) down, '#' visited
+
+The box starts at INITIAL_SIZE cells a side, centred on (0, 0). A cell outside it doubles
+the box's width or height, towards the cell, until it fits, and the rows are copied over
+to the new box. The box can only grow, so a rope that wanders far in a thin line would
+leave most of the box empty. Once a grown box would be over DENSE_BYTES and fewer than 1
+in SPARSE_RATIO of its cells are visited, the cells move to a dict of CHUNK_SIZE square
+bitmaps instead, keyed by (x // CHUNK_SIZE, y // CHUNK_SIZE), and only the chunks
+something visited are stored.
+
+Adding cells is plain bytearray work, so numpy is only imported by bounds() and render().
+"""
+
+INITIAL_SIZE = 64
+DENSE_BYTES = 1 << 20
+SPARSE_RATIO = 64
+CHUNK_SIZE = 64
+
+CHUNK_STRIDE = CHUNK_SIZE >> 3
+CHUNK_BYTES = CHUNK_STRIDE * CHUNK_SIZE
+
+
+def packed_bounds(packed):
+    """
+    The (first col, first row, last col, last row) of the set bits of a 2d array of packed
+    uint8 rows, or None if none are set.
+    """
+    import numpy
+
+    rows = numpy.flatnonzero(packed.any(axis=1))
+    if not len(rows):
+        return None
+    cols = numpy.flatnonzero(numpy.unpackbits(numpy.bitwise_or.reduce(packed, axis=0)))
+    return int(cols[0]), int(rows[0]), int(cols[-1]), int(rows[-1])
+
+
+class VisitedCells:
+    def __init__(self, size=INITIAL_SIZE):
+        size = max(8, (size + 7) & ~7)
+        # the dense box: bit (row, col) is cell (left + col, bottom + row)
+        self.left = self.bottom = -(size // 2)
+        self.width = self.height = size
+        self.stride = size >> 3
+        self.bits = bytearray(self.stride * size)
+        # the chunks, once the cells are sparse
+        self.chunks = None
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def sparse(self):
+        return self.chunks is not None
+
+    def add(self, x, y):
+        """
+        Mark (x, y) as visited.
+        """
+        if self.chunks is not None:
+            self._add_sparse(x, y)
+            return
+        col = x - self.left
+        row = y - self.bottom
+        if not (0 <= col < self.width and 0 <= row < self.height):
+            self._grow(x, y)
+            self.add(x, y)
+            return
+        index = row * self.stride + (col >> 3)
+        byte = self.bits[index]
+        mask = 0x80 >> (col & 7)
+        if not byte & mask:
+            self.bits[index] = byte | mask
+            self.count += 1
+
+    def add_line(self, x, y, dx, dy, count):
+        """
+        Mark count cells from (x, y), each a step of (dx, dy) on from the last.
+        """
+        if count > 0:
+            # growing up front to the far end keeps the bounds check out of the loop
+            self.add(x + dx * (count - 1), y + dy * (count - 1))
+            self.add(x, y)
+        if self.chunks is not None:
+            self._add_line_sparse(x, y, dx, dy, count)
+            return
+        bits = self.bits
+        stride = self.stride
+        col = x - self.left
+        row = y - self.bottom
+        added = 0
+        for _ in range(count):
+            index = row * stride + (col >> 3)
+            byte = bits[index]
+            mask = 0x80 >> (col & 7)
+            if not byte & mask:
+                bits[index] = byte | mask
+                added += 1
+            col += dx
+            row += dy
+        self.count += added
+
+    def __contains__(self, cell):
+        x, y = cell
+        if self.chunks is not None:
+            chunk = self.chunks.get((x // CHUNK_SIZE, y // CHUNK_SIZE))
+            col = x % CHUNK_SIZE
+            return chunk is not None and bool(chunk[(y % CHUNK_SIZE) * CHUNK_STRIDE + (col >> 3)] & (0x80 >> (col & 7)))
+        col = x - self.left
+        row = y - self.bottom
+        if not (0 <= col < self.width and 0 <= row < self.height):
+            return False
+        return bool(self.bits[row * self.stride + (col >> 3)] & (0x80 >> (col & 7)))
+
+    def _add_sparse(self, x, y):
+        key = (x // CHUNK_SIZE, y // CHUNK_SIZE)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = bytearray(CHUNK_BYTES)
+        col = x % CHUNK_SIZE
+        index = (y % CHUNK_SIZE) * CHUNK_STRIDE + (col >> 3)
+        byte = chunk[index]
+        mask = 0x80 >> (col & 7)
+        if not byte & mask:
+            chunk[index] = byte | mask
+            self.count += 1
+
+    def _add_line_sparse(self, x, y, dx, dy, count):
+        # a line only looks up its chunk again when it crosses into the next one
+        chunks = self.chunks
+        key = chunk = None
+        added = 0
+        for _ in range(count):
+            if (x // CHUNK_SIZE, y // CHUNK_SIZE) != key:
+                key = (x // CHUNK_SIZE, y // CHUNK_SIZE)
+                chunk = chunks.get(key)
+                if chunk is None:
+                    chunk = chunks[key] = bytearray(CHUNK_BYTES)
+            col = x % CHUNK_SIZE
+            index = (y % CHUNK_SIZE) * CHUNK_STRIDE + (col >> 3)
+            byte = chunk[index]
+            mask = 0x80 >> (col & 7)
+            if not byte & mask:
+                chunk[index] = byte | mask
+                added += 1
+            x += dx
+            y += dy
+        self.count += added
+
+    def _grow(self, x, y):
+        """
+        Double the box towards (x, y) until it holds it, or move to chunks if that box
+        would be big and mostly empty.
+        """
+        left, bottom, width, height = self.left, self.bottom, self.width, self.height
+        while x < left:
+            left -= width
+            width *= 2
+        while x >= left + width:
+            width *= 2
+        while y < bottom:
+            bottom -= height
+            height *= 2
+        while y >= bottom + height:
+            height *= 2
+        if (width >> 3) * height > DENSE_BYTES and self.count * SPARSE_RATIO < width * height:
+            self._to_sparse()
+            return
+        # left moves by whole multiples of the old width, which is a multiple of 8, so the
+        # old rows land on byte boundaries
+        stride = width >> 3
+        bits = bytearray(stride * height)
+        offset = (self.bottom - bottom) * stride + ((self.left - left) >> 3)
+        for row in range(self.height):
+            start = row * self.stride
+            bits[offset + row * stride:offset + row * stride + self.stride] = self.bits[start:start + self.stride]
+        self.left, self.bottom, self.width, self.height = left, bottom, width, height
+        self.stride = stride
+        self.bits = bits
+
+    def _to_sparse(self):
+        import numpy
+
+        packed = numpy.frombuffer(self.bits, dtype=numpy.uint8).reshape(self.height, self.stride)
+        # unpack only the bytes with something in them
+        rows, byte_cols = numpy.nonzero(packed)
+        row_bits = numpy.unpackbits(packed[rows, byte_cols][:, None], axis=1)
+        which, bit = numpy.nonzero(row_bits)
+        xs = byte_cols[which] * 8 + bit + self.left
+        ys = rows[which] + self.bottom
+        # sort the cells into their chunks and pack each chunk's bits
+        first_x, first_y = self.left // CHUNK_SIZE, self.bottom // CHUNK_SIZE
+        span = self.height // CHUNK_SIZE + 2
+        keys, chunk = numpy.unique((xs // CHUNK_SIZE - first_x) * span + (ys // CHUNK_SIZE - first_y),
+                                   return_inverse=True)
+        cells = numpy.zeros((len(keys), CHUNK_SIZE, CHUNK_SIZE), dtype=bool)
+        cells[chunk, ys % CHUNK_SIZE, xs % CHUNK_SIZE] = True
+        packed_chunks = numpy.packbits(cells, axis=2)
+        self.chunks = {(int(key) // span + first_x, int(key) % span + first_y): bytearray(bits.tobytes())
+                       for key, bits in zip(keys, packed_chunks)}
+        self.bits = bytearray()
+
+    def bounds(self):
+        """
+        (min x, min y, max x, max y) of the visited cells, or None if there aren't any.
+        """
+        import numpy
+
+        if self.chunks is None:
+            packed = numpy.frombuffer(self.bits, dtype=numpy.uint8).reshape(self.height, self.stride)
+            box = packed_bounds(packed)
+            if box is None:
+                return None
+            return box[0] + self.left, box[1] + self.bottom, box[2] + self.left, box[3] + self.bottom
+        boxes = []
+        for (chunk_x, chunk_y), chunk in self.chunks.items():
+            box = packed_bounds(numpy.frombuffer(chunk, dtype=numpy.uint8).reshape(CHUNK_SIZE, CHUNK_STRIDE))
+            if box is not None:
+                left, bottom = chunk_x * CHUNK_SIZE, chunk_y * CHUNK_SIZE
+                boxes.append((box[0] + left, box[1] + bottom, box[2] + left, box[3] + bottom))
+        if not boxes:
+            return None
+        return (min(box[0] for box in boxes), min(box[1] for box in boxes),
+                max(box[2] for box in boxes), max(box[3] for box in boxes))
+
+    def cells(self):
+        """
+        The visited cells as a 2d bool numpy array over bounds(), row 0 at the smallest y.
+        """
+        import numpy
+
+        box = self.bounds()
+        if box is None:
+            return numpy.zeros((0, 0), dtype=bool)
+        min_x, min_y, max_x, max_y = box
+        if self.chunks is None:
+            packed = numpy.frombuffer(self.bits, dtype=numpy.uint8).reshape(self.height, self.stride)
+            unpacked = numpy.unpackbits(packed[min_y - self.bottom:max_y - self.bottom + 1], axis=1)
+            return unpacked[:, min_x - self.left:max_x - self.left + 1].astype(bool)
+        cells = numpy.zeros((max_y - min_y + 1, max_x - min_x + 1), dtype=bool)
+        for (chunk_x, chunk_y), chunk in self.chunks.items():
+            unpacked = numpy.unpackbits(numpy.frombuffer(chunk, dtype=numpy.uint8).reshape(CHUNK_SIZE, CHUNK_STRIDE), axis=1)
+            rows, cols = numpy.nonzero(unpacked)
+            cells[rows + chunk_y * CHUNK_SIZE - min_y, cols + chunk_x * CHUNK_SIZE - min_x] = True
+        return cells
+
+    def render(self, mark='#', blank='.'):
+        """
+        The visited cells over bounds() as lines of text, largest y first, like the
+        puzzle's drawings.
+        """
+        import numpy
+
+        cells = self.cells()[::-1]
+        text = numpy.where(cells, ord(mark), ord(blank)).astype(numpy.uint8)
+        return "\n".join(row.tobytes().decode() for row in text)
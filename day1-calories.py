@@ -18,17 +18,24 @@ Given a list of this format:
 ---
 Sum each block of numbers and return the block with the largest total.
 """
+
+import heapq
+import sys
+
+from aoc.inputs import InputFile
+
 def maximum_block(list):
     max_block = 0
     current_block = 0
     for i in list:
-        if i == '':
+        if not i:
             if current_block > max_block:
                 max_block = current_block
             current_block = 0
         else:
             current_block += int(i)
-    return max_block
+    # the last block has no blank line after it when the file doesn't end with one
+    return max(max_block, current_block)
 
 """
 Given the same list, return the sum of the 'count' largest blocks
@@ -37,18 +44,211 @@ def maximum_blocks(list, count):
     max_blocks = []
     current_block = 0
     for i in list:
-        if i == '':
-            max_blocks.append(current_block)
-            max_blocks.sort()
+        if not i:
+            # keep the 'count' largest blocks in a min-heap, so the smallest is the one to drop
+            heapq.heappush(max_blocks, current_block)
             if len(max_blocks) > count:
-                max_blocks.pop(0)
+                heapq.heappop(max_blocks)
             current_block = 0
         else:
             current_block += int(i)
+    if current_block:
+        heapq.heappush(max_blocks, current_block)
+        if len(max_blocks) > count:
+            heapq.heappop(max_blocks)
     return sum(max_blocks)
 
-with open("day1-input.txt") as f:
-    content = f.readlines()
-content = [x.strip() for x in content]
-print(maximum_block(content))
-print(maximum_blocks(content, 3))
\ No newline at end of file
+"""
+Streaming version, for inputs too big to hold (or arriving down a pipe): read the bytes in
+large chunks, split whole blocks out of each chunk, and keep only the 'count' largest.
+
+    cat elves-*.txt | python3 day1-calories.py - 10
+"""
+
+# Read a binary stream (a file opened 'rb', sys.stdin.buffer) in chunks of chunk_size bytes
+def read_chunks(stream, chunk_size=1 << 20):
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+BLANK_LINES = (b"\n\n", b"\n\r\n")
+
+# Where the last blank line in chunk ends, or None. tail is the last 2 bytes before the
+# chunk, for a blank line that starts in the previous chunk.
+def blank_line_end(tail, chunk):
+    ends = [chunk.rfind(blank) + len(blank) for blank in BLANK_LINES if blank in chunk]
+    if not ends:
+        head = tail + chunk[:2]
+        ends = [head.rfind(blank) + len(blank) - len(tail) for blank in BLANK_LINES if blank in head]
+    return max(ends) if ends else None
+
+# Yield the sum of each block in a stream of byte chunks. A block can straddle chunks, so
+# the pieces after the last blank line are kept until a chunk with a blank line in it
+# comes along, and only then joined, once.
+def block_sums(chunks):
+    pieces = []
+    tail = b""
+    for chunk in chunks:
+        chunk = bytes(chunk)
+        end = blank_line_end(tail, chunk)
+        if end is None:
+            pieces.append(chunk)
+        else:
+            pieces.append(chunk[:end])
+            for block in b"".join(pieces).replace(b"\r\n", b"\n").split(b"\n\n"):
+                if block.strip():
+                    yield sum(map(int, block.split()))
+            pieces = [chunk[end:]]
+        tail = (tail + chunk[-2:])[-2:]
+    carry = b"".join(pieces)
+    if carry.strip():
+        yield sum(map(int, carry.split()))
+
+# The 'count' largest blocks in one pass, keeping a heap of at most 'count' of them.
+# Returns (sums, indices, total): the sums largest first, the index of each of those blocks
+# in the input (counting from 0), and their total. Ties go to the earlier block.
+def top_blocks(sums, count):
+    heap = []
+    for index, block in enumerate(sums):
+        entry = (block, -index)
+        if len(heap) < count:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    heap.sort(reverse=True)
+    top_sums = [block for block, _ in heap]
+    return top_sums, [-index for _, index in heap], sum(top_sums)
+
+# The mapped file in chunks, for running the streaming path over an InputFile
+def input_chunks(input, chunk_size=1 << 20):
+    for start in range(0, len(input), chunk_size):
+        yield input.buffer[start:start + chunk_size]
+
+"""
+Vectorized version: parse every number in a large piece of the file at once with numpy, then
+sum the blocks with np.add.reduceat and pick the largest with np.partition. No Python work
+per line. Lines hold nothing but digits (and an optional \r).
+"""
+
+# The block sums of one piece of the input that starts and ends on a block boundary. Lines
+# are parsed right to left a digit column at a time: column j of every line is the byte j+1
+# before its newline, masked off for lines shorter than that.
+def numpy_piece_sums(piece):
+    import numpy as np
+
+    newlines = np.flatnonzero(piece == ord('\n'))
+    if len(piece) and piece[-1] != ord('\n'):
+        newlines = np.append(newlines, len(piece))
+    if len(newlines) == 0:
+        return np.zeros(0, dtype=np.int64)
+    starts = np.empty_like(newlines)
+    starts[0] = 0
+    starts[1:] = newlines[:-1] + 1
+    lengths = newlines - starts
+    values = np.zeros(len(newlines), dtype=np.int64)
+    place = 1
+    for column in range(int(lengths.max())):
+        digits = piece[newlines - (column + 1)] - np.uint8(ord('0'))
+        digits[lengths <= column] = 0
+        values += digits * np.int64(place)
+        place *= 10
+    # blank lines separate the blocks
+    filled = lengths > 0
+    blocks = np.cumsum(~filled)[filled]
+    if len(blocks) == 0:
+        return np.zeros(0, dtype=np.int64)
+    block_starts = np.ones(len(blocks), dtype=bool)
+    block_starts[1:] = blocks[1:] != blocks[:-1]
+    return np.add.reduceat(values[filled], np.flatnonzero(block_starts))
+
+# All the block sums of a bytes-like input, as an int64 array in input order. The input is
+# parsed a piece of about chunk_size bytes at a time, each cut just after a blank line, so
+# the temporary arrays stay small however large the input is.
+def numpy_block_sums(data, chunk_size=1 << 18):
+    import numpy as np
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    sums = []
+    start = 0
+    while start < len(raw):
+        stop = min(start + chunk_size, len(raw))
+        piece = raw[start:stop]
+        if stop < len(raw):
+            # cut after the last blank line in the piece, looking back through its tail first
+            # and the whole piece if need be, and growing the piece if there isn't one
+            tail = piece[-4096:].tobytes()
+            cut = max(tail.rfind(b"\n\n"), tail.rfind(b"\n\r\n"))
+            if cut != -1:
+                cut += len(piece) - len(tail)
+            else:
+                whole = piece.tobytes()
+                cut = max(whole.rfind(b"\n\n"), whole.rfind(b"\n\r\n"))
+            if cut == -1:
+                chunk_size *= 2
+                continue
+            # keep the blank line's newline(s) with this piece
+            stop = start + cut + (2 if piece[cut + 1] == ord('\n') else 3)
+            piece = raw[start:stop]
+        if ord('\r') in piece:
+            piece = piece[piece != ord('\r')]
+        sums.append(numpy_piece_sums(piece))
+        start = stop
+    return np.concatenate(sums) if sums else np.zeros(0, dtype=np.int64)
+
+# Like top_blocks, from an array of block sums
+def numpy_top_blocks(sums, count):
+    import numpy as np
+
+    count = min(count, len(sums))
+    if count == 0:
+        return [], [], 0
+    # everything above the count-th largest sum, then the earliest blocks equal to it, so
+    # ties go to the earlier block like they do in top_blocks
+    threshold = np.partition(sums, len(sums) - count)[len(sums) - count]
+    above = np.flatnonzero(sums > threshold)
+    indices = np.concatenate((above, np.flatnonzero(sums == threshold)[:count - len(above)]))
+    indices = indices[np.lexsort((indices, -sums[indices]))]
+    top_sums = sums[indices].tolist()
+    return top_sums, indices.tolist(), sum(top_sums)
+
+# Alternate engines for each part, timed against each other by `python -m aoc bench engines 1`.
+# Each one takes the InputFile and does its own parsing.
+ENGINES = {
+    'loop': {
+        1: lambda input: maximum_block(input),
+        2: lambda input: maximum_blocks(input, 3),
+    },
+    'stream': {
+        1: lambda input: top_blocks(block_sums(input_chunks(input)), 1)[2],
+        2: lambda input: top_blocks(block_sums(input_chunks(input)), 3)[2],
+    },
+    'numpy': {
+        1: lambda input: numpy_top_blocks(numpy_block_sums(input.buffer), 1)[2],
+        2: lambda input: numpy_top_blocks(numpy_block_sums(input.buffer), 3)[2],
+    },
+}
+
+# The solvers walk the memory-mapped lines (bytes) directly, int() takes them as they are
+def parse(input):
+    return input
+
+def part1(content):
+    return maximum_block(content)
+
+def part2(content):
+    return maximum_blocks(content, 3)
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '-':
+        # stream from stdin: print the top 'count' blocks and their total
+        count = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+        sums, indices, total = top_blocks(block_sums(read_chunks(sys.stdin.buffer)), count)
+        for block, index in zip(sums, indices):
+            print("block %d: %d" % (index, block))
+        print(total)
+    else:
+        content = parse(InputFile(sys.argv[1] if len(sys.argv) > 1 else "day1-input.txt"))
+        print(part1(content))
+        print(part2(content))
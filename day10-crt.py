@@ -184,8 +184,10 @@ During the 220th cycle, register X has the value 18, so the signal strength is 2
 
 import sys
 
+from aoc.inputs import InputFile
+
 # Find the signal strength during the 20th, 60th, 100th, 140th, 180th, and 220th cycles. What is the sum of these six signal strengths?
-def part1(lines, record_points):
+def part1(lines, record_points=(20, 60, 100, 140, 180, 220)):
     currentCycle = 1
     x = 1
     sum_at_record_points = 0
@@ -197,11 +199,11 @@ def part1(lines, record_points):
             currentCycle += 1
         elif line.startswith("addx"):        
             if currentCycle + 1 in record_points:
-                print("+1", currentCycle + 1, (currentCycle + 1) * x)
+                # print("+1", currentCycle + 1, (currentCycle + 1) * x)
                 sum_at_record_points += (currentCycle + 1) * x
             currentCycle += 2
             x += int(line[5:])
-        print (currentCycle, x, currentCycle * x)
+        # print (currentCycle, x, currentCycle * x)
         
     return sum_at_record_points
 
@@ -331,19 +333,20 @@ Allowing the program to run to completion causes the CRT to produce the followin
 #######.......#######.......#######.....
 """
 
-# Render the image given by lines
+# Render the image given by lines, returned as a string with one line per CRT row
 def part2(lines):
     current_cycle = 0
     x = 1
+    screen = []
 
     def print_cycle(cycle, x):
         if cycle > 0 and cycle % 40 == 0:
-            print()
+            screen.append("\n")
         if x - 1 <= (cycle % 40) <= x + 1:
             to_print = "#"
         else:
             to_print = "."
-        print(to_print, end="")
+        screen.append(to_print)
         if cycle > 0 and cycle % 40 == 0:
             return 0
         return cycle
@@ -357,13 +360,17 @@ def part2(lines):
             current_cycle += 1
             x += int(line[5:])
 
+    return "".join(screen)
+
+def parse(input):
+    return input.text
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
         print("Usage: python3 %s <input>" % sys.argv[0])
         sys.exit(1)
 
-    with open(sys.argv[1]) as f:
-        lines = f.readlines()
+    lines = parse(InputFile(sys.argv[1]))
 
-    # print(part1(lines, [20, 60, 100, 140, 180, 220]))
-    part2(lines)
\ No newline at end of file
+    print(part1(lines))
+    print(part2(lines))
\ No newline at end of file
@@ -203,6 +203,8 @@ from functools import reduce
 import json
 import sys
 
+from aoc.inputs import InputFile
+
 def parse_monkeys(lines):
     monkeys = {}
     monkey = None
@@ -261,22 +263,37 @@ def process_round(monkeys, round_count, reduce_worry_level=True):
             # the monkey threw all their items, so clear the list
             this_monkey['items'] = []
 
+    return monkeys
+
+def print_monkeys(monkeys, round_count):
     print('---')
     print('After round %d, the monkeys are holding items with these worry levels:' % round_count)
     for monkey in monkeys:
         print('Monkey %d. inspected %d, items: %s' % (monkey, monkeys[monkey]['inspect_count'], monkeys[monkey]['items']))
         # print('Monkey %d. inspected %d' % (monkey, monkeys[monkey]['inspect_count']))
-    return monkeys
+
+# the level of monkey business is the product of the two highest inspect counts
+def monkey_business(monkeys):
+    most_active = sorted(monkeys, key=lambda x: monkeys[x]['inspect_count'], reverse=True)[:2]
+    return monkeys[most_active[0]]['inspect_count'] * monkeys[most_active[1]]['inspect_count']
+
+def parse(input):
+    return parse_monkeys(input.text)
+
+# 20 rounds, worry level divided by 3 after each inspection
+def part1(monkeys):
+    return monkey_business(process_round(copy.deepcopy(monkeys), 20))
+
+# 10000 rounds, worry level is never reduced
+def part2(monkeys):
+    return monkey_business(process_round(copy.deepcopy(monkeys), 10000, reduce_worry_level=False))
 
 if __name__ == '__main__':
     if len(sys.argv) < 2:
         print("Usage: python3 %s <input>" % sys.argv[0])
         sys.exit(1)
 
-    with open(sys.argv[1]) as f:
-        lines = f.readlines()
-
-    monkeys = parse_monkeys(lines)
+    monkeys = parse(InputFile(sys.argv[1]))
 
     if len(sys.argv) > 2: 
         count = int(sys.argv[2])
@@ -285,6 +302,7 @@ if __name__ == '__main__':
 
     # monkeys = process_round(monkeys, count)
     monkeys = process_round(monkeys, count, reduce_worry_level=False)
+    print_monkeys(monkeys, count)
 
     # find the two most active monkeys
     most_active = sorted(monkeys, key=lambda x: monkeys[x]['inspect_count'], reverse=True)[:2]
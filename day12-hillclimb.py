@@ -37,6 +37,11 @@ v..v<<<<
 """
 
 import sys
+from collections import deque
+
+import numpy
+
+from aoc.grid import Grid
 
 # Recursive function to find the path 
 def next_step(map_array, position, end_position, current_path, visited, result_paths):
@@ -74,35 +79,58 @@ def next_step(map_array, position, end_position, current_path, visited, result_p
 def possible_neighbors(map_array, position):
     """Return a list of possible neighbors to move to."""
     (x, y) = position
+    limit = map_array[y, x] + 1
     neighbors = []
-    if x > 0 and map_array[y][x-1] <= (map_array[y][x] + 1):
-        neighbors.append((map_array[y][x-1] ,(x-1, y)))
-    if x < len(map_array[0]) - 1 and map_array[y][x+1] <= (map_array[y][x] + 1):
-        neighbors.append((map_array[y][x+1], (x+1, y)))
-    if y > 0 and map_array[y-1][x] <= (map_array[y][x] + 1):
-        neighbors.append((map_array[y-1][x], (x, y-1)))
-    if y < len(map_array) - 1 and map_array[y+1][x] <= (map_array[y][x] + 1):
-        neighbors.append((map_array[y+1][x], (x, y+1)))
+    for (row, col) in map_array.neighbors((y, x)):
+        height = map_array[row, col]
+        if height <= limit:
+            neighbors.append((height, (col, row)))
     neighbors.sort(key=lambda x: x[0], reverse=True) # prefer to climb over plateau
     return [x[1] for x in neighbors]
 
+def heights(grid):
+    """Turn a Grid of letters into a Grid of heights, with the S and E positions as (x, y)."""
+    ((y, x),) = grid.find(ord('S'))
+    start = (x, y)
+    ((y, x),) = grid.find(ord('E'))
+    end = (x, y)
+    height_map = Grid(grid.cells.astype(numpy.int16) - ord('a'))
+    height_map[start[1], start[0]] = 0
+    height_map[end[1], end[0]] = 25
+    return (height_map, start, end)
+
 def map_height(input_grid):
-    """Return a grid with the path from S to E marked with arrows."""
-    # Find the start and end positions
-    map_grid = input_grid[:]
-    for y, row in enumerate(map_grid):
-        for x, c in enumerate(row):
-            if c == 'S':
-                start = (x, y)
-                map_grid[y][x] = 0
-            elif c == 'E':
-                end = (x, y)
-                map_grid[y][x] = 25
-            else:
-                map_grid[y][x] = ord(c) - ord('a')
+    """Return a Grid of heights from rows of letters, with the S and E positions."""
+    return heights(Grid.from_bytes("".join(row) for row in input_grid))
+
+# Breadth-first search from every start position at once, returning the fewest steps to end_position
+def shortest_path_length(map_array, starts, end_position):
+    steps = {start: 0 for start in starts}
+    queue = deque(starts)
+    while queue:
+        position = queue.popleft()
+        if position == end_position:
+            return steps[position]
+        for neighbor in possible_neighbors(map_array, position):
+            if neighbor not in steps:
+                steps[neighbor] = steps[position] + 1
+                queue.append(neighbor)
+    return None
+
+# Like map_height, but straight from the mapped grid of letters
+def parse(input):
+    return heights(Grid.from_input(input))
 
-    return (map_grid, start, end)
+# What is the fewest steps required to move from your current position to the location that should get the best signal?
+def part1(data):
+    (height_map, start, end) = data
+    return shortest_path_length(height_map, [start], end)
 
+# What is the fewest steps required to move starting from any square with elevation a to the location that should get the best signal?
+def part2(data):
+    (height_map, start, end) = data
+    starts = [(x, y) for (y, x) in height_map.find(0)]
+    return shortest_path_length(height_map, starts, end)
 
 def main():
     """Main program."""
@@ -119,16 +147,15 @@ def main():
     print("input\n","\n".join(" ".join(str(c) for c in row) for row in input_grid))
 
     # Print the path grid
-    height_map = [[x[:] for x in row] for row in input_grid]
-    (height_map, start, end) = map_height(height_map)
+    (height_map, start, end) = map_height(input_grid)
     print("height map")
-    print("\n".join("".join("%3s" % c for c in row) for row in height_map))
+    print("\n".join("".join("%3s" % c for c in row) for row in height_map.cells))
     print(start, end)
 
     shortest_path = None
     search_count = 0
     result_paths = []
-    for y, row in enumerate(height_map):
+    for y, row in enumerate(height_map.cells):
         for x, c in enumerate(row):
             if c == 0:
                 search_count += 1
@@ -1,24 +1,19 @@
 
-import numpy as py
-import pandas as pd
-import scipy.ndimage as nd
-import json
 import functools
+import sys
 
+from aoc.inputs import InputFile
 
 
 
-def load_input(filename):
-    with open(filename) as f:
-        lines = f.read().splitlines()
-    pairs = []
-    for i in range(0, len(lines), 3):
-        pairs.append((eval(lines[i]), eval(lines[i+1])))
-    return pairs
 
-pairs = load_input('day13-input.txt')
-pairs
+# Packets come in pairs separated by a blank line
+def parse(input):
+    packets = (eval(line) for line in input.text if line.strip())
+    return list(zip(packets, packets))
 
+def load_input(filename):
+    return parse(InputFile(filename))
 
 
 
@@ -67,24 +62,15 @@ def compare_items(pair, debug_print=False):
 
 
 
-correct_idx_sum = 0
-for idx,pair in enumerate(pairs):
-    if compare_items(pair):
-        correct_idx_sum += idx + 1
-    print(compare_items(pair))
-# print(compare_items(pairs[4], debug_print=True))
-
-print(correct_idx_sum)
-
-
-
-
-
-# flatten pairs = [(pair1, pair2), (pair3, pair4), ...] in to [pair1, pair2, pair3, pair4, ...]
-flat_list = [item for sublist in pairs for item in sublist]
-flat_list.append([[2]])
-flat_list.append([[6]])
-print(flat_list)
+# Determine which pairs of packets are already in the right order. What is the sum of the indices of those pairs?
+def part1(pairs):
+    correct_idx_sum = 0
+    for idx,pair in enumerate(pairs):
+        if compare_items(pair):
+            correct_idx_sum += idx + 1
+        # print(compare_items(pair))
+    # print(compare_items(pairs[4], debug_print=True))
+    return correct_idx_sum
 
 
 # comparison ordering
@@ -100,11 +86,20 @@ def compare(item1, item2):
     else:
         return 1
 
-sorted_list = sorted(flat_list, key=functools.cmp_to_key(compare))
-print(sorted_list)
-decoder_start = sorted_list.index([[2]]) + 1
-decoder_end = sorted_list.index([[6]]) + 1
-print(decoder_start, decoder_end, decoder_start * decoder_end)
+# Organize all of the packets into the correct order. What is the decoder key for the distress signal?
+def part2(pairs):
+    # flatten pairs = [(pair1, pair2), (pair3, pair4), ...] in to [pair1, pair2, pair3, pair4, ...]
+    flat_list = [item for sublist in pairs for item in sublist]
+    flat_list.append([[2]])
+    flat_list.append([[6]])
 
+    sorted_list = sorted(flat_list, key=functools.cmp_to_key(compare))
+    decoder_start = sorted_list.index([[2]]) + 1
+    decoder_end = sorted_list.index([[6]]) + 1
+    return decoder_start * decoder_end
 
 
+if __name__ == '__main__':
+    pairs = load_input(sys.argv[1] if len(sys.argv) > 1 else 'day13-input.txt')
+    print(part1(pairs))
+    print(part2(pairs))
@@ -1,8 +1,8 @@
 # %%
 import sys
-import numpy as np
-import pandas as pd
-import json
+
+from aoc.grid import Grid
+from aoc.inputs import InputFile
 
 
 # %%
@@ -12,46 +12,33 @@ import json
 # Example path input: "498,4 -> 498,6 -> 496,6"
 # Lines parsed from example: [498,4] -> [498,6], [498,6] -> [496,6]
 
-# Load a dataframe from a file with a default value of '.' and a value of '#' for every point in the paths
-def load_df_from_file(filename, default_value='.', path_value='#'):
-    with open(filename, 'r') as f:
-        paths = [path.split(' -> ') for path in f.read().splitlines()]
-        # Get all the points in the paths
-        points = [point for path in paths for point in path]
-        # Get the min and max x and y values
-        min_x = min([int(point.split(',')[0]) for point in points])
-        max_x = max([int(point.split(',')[0]) for point in points])
-        min_y = 0
-        # min_y = min([int(point.split(',')[1]) for point in points])
-        max_y = max([int(point.split(',')[1]) for point in points])
-        # Create a dataframe with the default value, maintaining coordinates as keys
-        df = pd.DataFrame(np.full((max_y - min_y + 1, max_x - min_x + 1), default_value), index=range(min_y, max_y + 1), columns=range(min_x, max_x + 1))
-        # Fill in the values for each path
-        for path in paths:
-            for i in range(len(path) - 1):
-                x1, y1 = path[i].split(',')
-                x2, y2 = path[i + 1].split(',')
-                x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
-                # If the line is vertical
-                if x1 == x2:
-                    # If the line goes down
-                    if y1 < y2:
-                        df.iloc[y1 - min_y:y2 - min_y + 1, x1 - min_x] = path_value
-                    # If the line goes up
-                    else:
-                        df.iloc[y2 - min_y:y1 - min_y + 1, x1 - min_x] = path_value
-                # If the line is horizontal
-                else:
-                    # If the line goes right
-                    if x1 < x2:
-                        df.iloc[y1 - min_y, x1 - min_x:x2 - min_x + 1] = path_value
-                    # If the line goes left
-                    else:
-                        df.iloc[y1 - min_y, x2 - min_x:x1 - min_x + 1] = path_value
-        return df
-
-input_df = load_df_from_file('day14-input.txt')
-input_sample_df = load_df_from_file('day14-inputsample.txt')
+# Load a grid from input lines with a default value of '.' and a value of '#' for every point in the paths
+# The grid keeps the puzzle's coordinates, (row, col) = (y, x), so the sand still enters at (0, 500)
+def load_grid(lines, default_value='.', path_value='#'):
+    paths = [path.strip().split(' -> ') for path in lines if path.strip()]
+    # Get all the points in the paths
+    points = [point for path in paths for point in path]
+    # Get the min and max x and y values
+    min_x = min([int(point.split(',')[0]) for point in points])
+    max_x = max([int(point.split(',')[0]) for point in points])
+    min_y = 0
+    # min_y = min([int(point.split(',')[1]) for point in points])
+    max_y = max([int(point.split(',')[1]) for point in points])
+    # Create a grid with the default value, with its origin at the top left point
+    grid = Grid.full((max_y - min_y + 1, max_x - min_x + 1), ord(default_value), origin=(min_y, min_x))
+    # Fill in the values for each path
+    for path in paths:
+        for i in range(len(path) - 1):
+            x1, y1 = path[i].split(',')
+            x2, y2 = path[i + 1].split(',')
+            x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+            # Lines are either vertical or horizontal, so one of these slices is a single row or column
+            grid[min(y1, y2):max(y1, y2) + 1, min(x1, x2):max(x1, x2) + 1] = ord(path_value)
+    return grid
+
+# Load a grid from a file, see load_grid
+def load_grid_from_file(filename, default_value='.', path_value='#'):
+    return load_grid(InputFile(filename).text, default_value, path_value)
 
 # %%
 
@@ -62,83 +49,80 @@ input_sample_df = load_df_from_file('day14-inputsample.txt')
 # 4. Otherwise, it stops moving and turns to a 'o'
 # 5. Once it becomes an 'o', it stops moving
 # 6. A '+' is created at the original coordinates of the '+' for each unit of sand
+# Moving off the edge of the grid raises IndexError: the sand has fallen into the abyss.
+
+EMPTY = ord('.')
+SAND = ord('o')
+FALLING = ord('+')
 
-def move_down(df, row, col):
+def move_down(grid, row, col):
     # If the block below is '.', it moves down and its previous location is replaced with '.'
-    if df.loc[row + 1, col] == '.':
-        # print("moved down from ({}, {}) to ({}, {})".format(row, col, row + 1, col))
-        df.loc[row, col] = '.'
-        df.loc[row + 1, col] = '+'
+    if grid[row + 1, col] == EMPTY:
+        grid[row, col] = EMPTY
+        grid[row + 1, col] = FALLING
         return row + 1, col
     # Otherwise, if the block down and to the left is '.', it moves down and to the left and its previous location is replaced with '.'
-    elif df.loc[row + 1, col - 1] == '.':
-        # print("moved down and left from ({}, {}) to ({}, {})".format(row, col, row + 1, col - 1))
-        df.loc[row, col] = '.'
-        df.loc[row + 1, col - 1] = '+'
+    elif grid[row + 1, col - 1] == EMPTY:
+        grid[row, col] = EMPTY
+        grid[row + 1, col - 1] = FALLING
         return row + 1, col - 1
     # Otherwise, if the block down and to the right is '.', it moves down and to the right
-    elif df.loc[row + 1, col + 1] == '.':
-        # print("moved down and right from ({}, {}) to ({}, {})".format(row, col, row + 1, col + 1))
-        df.loc[row, col] = '.'
-        df.loc[row + 1, col + 1] = '+'
+    elif grid[row + 1, col + 1] == EMPTY:
+        grid[row, col] = EMPTY
+        grid[row + 1, col + 1] = FALLING
         return row + 1, col + 1
     # Otherwise, it stops moving and turns to a 'o'
     else:
-        # print("stopped moving at ({}, {})".format(row, col))
-        df.loc[row, col] = 'o'
+        grid[row, col] = SAND
         return row, col
 
-def move_down_until_stopped(df, row, col):
+def move_down_until_stopped(grid, row, col):
     # Once it becomes an 'o', it stops moving
-    while df.loc[row, col] != 'o':
-        row, col = move_down(df, row, col)
+    while grid[row, col] != SAND:
+        row, col = move_down(grid, row, col)
     return row, col
 
-def drop_sand(df):
-    # create copy of input_df
-    input_df_copy = input_df.copy()
-    i = 0
+def drop_sand(grid):
     while True:
-        i += 1
         row, col = (0, 500)
-        df.loc[0, 500] = '+'
+        grid[0, 500] = FALLING
         try:
-            row, col = move_down_until_stopped(df, row, col)
+            row, col = move_down_until_stopped(grid, row, col)
             if (row, col) == (0, 500):
-                print("stopped at sand {}".format(i))
-                return df
-        except:
-            print("broke at sand {}".format(i - 1))
-            return df
+                return grid
+        except IndexError:
+            return grid
 
 
 # %%
+def add_floor(grid):
+    # height of grid
+    height = grid.shape[0]
 
-display(drop_sand(input_sample_df.copy()))
-display(drop_sand(input_df.copy()))
-
+    cols_to_add = height * 2 - grid.shape[1]
+    # add cols_to_add columns of '.' to each side, and the empty row and floor underneath
+    grid = grid.grow(bottom=2, left=cols_to_add, right=cols_to_add, fill=EMPTY)
+    grid[grid.rows[-1], :] = ord('#')
+    return grid
 
 # %%
-def add_floor(df):
-    # height of df
-    height = len(df.index)
+def parse(input):
+    return load_grid(input.text)
 
-    cols_to_add = height * 2 - len(df.columns)
-    # add cols_to_add number of columns to the left side all with values of '.'
-    df = pd.concat([pd.DataFrame(np.full((len(df.index), cols_to_add), '.'), index=df.index, columns=range(min(df.columns) - cols_to_add, min(df.columns))) , df], axis=1)
-    # do the same to the right
-    df = pd.concat([df, pd.DataFrame(np.full((len(df.index), cols_to_add), '.'), index=df.index, columns=range(max(df.columns) + 1, max(df.columns) + cols_to_add + 1))], axis=1)
+# count the sand that came to rest
+def count_sand(grid):
+    return int((grid.cells == SAND).sum())
 
-    df.loc[len(df.index)] = ['.' for i in range(len(df.columns))]
-    df.loc[len(df.index)] = ['#' for i in range(len(df.columns))]
-    return df
+# How many units of sand come to rest before sand starts flowing into the abyss below?
+def part1(grid):
+    return count_sand(drop_sand(grid.copy()))
 
-display(input_sample_df)
-display(add_floor(input_sample_df.copy()))
+# With a floor two below the lowest rock, how many units of sand come to rest before the source is blocked?
+def part2(grid):
+    return count_sand(drop_sand(add_floor(grid.copy())))
 
 # %%
-
-final = drop_sand(add_floor(input_df.copy()))
-display(final)
-
-
+if __name__ == '__main__':
+    input_grid = load_grid_from_file(sys.argv[1] if len(sys.argv) > 1 else 'day14-input.txt')
+    print(part1(input_grid))
+    print(part2(input_grid))
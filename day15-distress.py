@@ -0,0 +1,176 @@
+"""
+--- Day 15: Beacon Exclusion Zone ---
+
+Solver logic from day15-distress.ipynb, importable and headless.
+
+Each sensor reports the closest beacon by manhattan distance, so no other beacon can be
+inside the diamond of that radius around the sensor.
+
+1. In the row where y=2000000, how many positions cannot contain a beacon?
+2. The distress beacon is the only uncovered position with x and y between 0 and 4000000.
+   What is its tuning frequency (x * 4000000 + y)?
+
+    python3 day15-distress.py day15-inputsample.txt 10 20
+"""
+
+import re
+import sys
+
+from aoc.inputs import InputFile
+
+# Load the locations of a set of sensors and the closest beacon to each sensor
+# For the input file, the row number is the sensor index, and the other data follows this pattern:
+# "Sensor at x=<SENSOR X POSITION>, y=<SENSOR Y POSITION>: closest beacon is at x=<CLOSEST BEACON X POSITION>, y=<CLOSEST BEACON Y POSITION>"
+
+class Sensor:
+    def __init__(self, sensor, beacon):
+        self.sensor = sensor
+        self.beacon = beacon
+
+        # distance between sensor and beacon
+        distance = abs(sensor[0] - beacon[0]) + abs(sensor[1] - beacon[1])
+        self.distance = distance
+        self.min_x = sensor[0] - distance
+        self.max_x = sensor[0] + distance
+        self.min_y = sensor[1] - distance
+        self.max_y = sensor[1] + distance
+
+    def __str__(self):
+        return f"Sensor at x={self.sensor[0]}, y={self.sensor[1]}: closest beacon is at x={self.beacon[0]}, y={self.beacon[1]} distance={self.distance}, min/min x/y={self.min_x}/{self.min_y}, max/max x/y={self.max_x}/{self.max_y}"
+
+def parse_sensors(lines):
+    sensors = []
+    for line in lines:
+        line = line.strip()
+        # load the line using regex matching
+        m = re.match(r'Sensor at x=(-?\d+), y=(-?\d+): closest beacon is at x=(-?\d+), y=(-?\d+)', line)
+        if m:
+            sensors.append(Sensor((int(m.group(1)), int(m.group(2))), (int(m.group(3)), int(m.group(4)))))
+        elif line:
+            print(f'Error: {line}', file=sys.stderr)
+    return sensors
+
+def load_sensors(filename):
+    return parse_sensors(InputFile(filename).text)
+
+# create a grid from the sensors and beacons, marking sensors with an 'S', beacons with a 'B', and all other cells with '.'
+# (only practical for the sample input, the real one spans millions of cells in each direction)
+def create_grid(sensors : list[Sensor]):
+    from aoc.grid import Grid
+
+    # find the overall max x and y values, using the distance outward from the sensor position in all directions
+    max_x = max([s.max_x for s in sensors])
+    max_y = max([s.max_y for s in sensors])
+    min_x = min([s.min_x for s in sensors])
+    min_y = min([s.min_y for s in sensors])
+
+    # create a grid with the appropriate size, indexed by (y, x) in the puzzle's coordinates
+    grid = Grid.full((max_y - min_y + 1, max_x - min_x + 1), ord('.'), origin=(min_y, min_x))
+    # add the sensors and beacons to the grid
+    for s in sensors:
+        grid[s.sensor[1], s.sensor[0]] = ord('S')
+        grid[s.beacon[1], s.beacon[0]] = ord('B')
+    return grid
+
+# find the distance between a sensor and its closest beacon, and draw a diamond out from the sensor of that size
+def draw_diamond(grid, sensor, distance):
+    # draw a # for each cell within distance of the sensor, only if it is currently empty
+    rows, cols = grid.coordinates()
+    inside = abs(rows - sensor[1]) + abs(cols - sensor[0]) <= distance
+    grid.cells[inside & (grid.cells == ord('.'))] = ord('#')
+    return grid
+
+# at row Y, how many cells are marked with a "#" or "S"
+def count_unmarked(grid, y):
+    row = grid[y, :]
+    return int(((row == ord('#')) | (row == ord('S'))).sum())
+
+# for a given value of Y
+# 1. Test to see if the sensor is in range of that Y value. If it is:
+# 2. Distance to row = The number of rows between the sensor and that Y value
+# 2. Leading spaces for row = Distance to row
+# 3. Star count for row = (sensor count * 2 + 1) - distance to row
+# 4. Return the range of the star count (start:end)
+def get_star_range_for_row(y, sensor):
+    if y >= sensor.min_y and y <= sensor.max_y:
+        distance_to_row = abs(y - sensor.sensor[1])
+        leading_spaces = distance_to_row
+        star_count = ((sensor.distance * 2) + 1) - (leading_spaces * 2)
+        return (leading_spaces, leading_spaces + star_count - 1)
+    else:
+        return None
+
+def get_raw_ranges_for_row(y, sensors):
+    ranges = []
+    for s in sensors:
+        r = get_star_range_for_row(y, s)
+        if r is not None:
+            # shift r by the sensor's min X value
+            r = (r[0] + s.min_x, r[1] + s.min_x)
+            ranges.append(r)
+    return ranges
+
+def merge_ranges(ranges):
+    # merge overlapping ranges
+    ranges.sort()
+    merged_ranges = []
+    for r in ranges:
+        if len(merged_ranges) == 0:
+            merged_ranges.append(r)
+        else:
+            if r[0] <= merged_ranges[-1][1] + 1:
+                merged_ranges[-1] = (merged_ranges[-1][0], max(merged_ranges[-1][1], r[1]))
+            else:
+                merged_ranges.append(r)
+    return merged_ranges
+
+def get_range_size_for_row(y, sensors):
+    ranges = merge_ranges(get_raw_ranges_for_row(y, sensors))
+    size = 0
+    for r in ranges:
+        size += r[1] - r[0] + 1
+    return size
+
+def get_items_on_row(y, sensors):
+    items = set()
+    for s in sensors:
+        if y == s.sensor[1]:
+            items.add(s.sensor)
+        if y == s.beacon[1]:
+            items.add(s.beacon)
+    return items
+
+def parse(input):
+    return parse_sensors(input.text)
+
+# In the row where y=2000000, how many positions cannot contain a beacon?
+def part1(sensors, row=2000000):
+    # covered cells, less the sensors and beacons sitting on the row (they're inside the ranges)
+    ranges = merge_ranges(get_raw_ranges_for_row(row, sensors))
+    items = [x for (x, _) in get_items_on_row(row, sensors) if any(start <= x <= stop for start, stop in ranges)]
+    return get_range_size_for_row(row, sensors) - len(items)
+
+# Find the only position within 0..limit on both axes that no sensor covers, and return its tuning frequency
+def part2(sensors, limit=4000000):
+    min_y = min([s.min_y for s in sensors])
+    max_y = max([s.max_y for s in sensors])
+    def bound(i): return min(limit, max(0, i))
+
+    for y in range(bound(min_y), bound(max_y + 1)):
+        y_ranges = merge_ranges(get_raw_ranges_for_row(y, sensors))
+        if len(y_ranges) == 2:
+            # If there's only one spot available, then this will be the only gap
+            x = y_ranges[0][1] + 1
+            return x * 4000000 + y
+    return None
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 %s <input> [row] [limit]" % sys.argv[0])
+        sys.exit(1)
+
+    sensors = parse(InputFile(sys.argv[1]))
+    row = int(sys.argv[2]) if len(sys.argv) > 2 else 2000000
+    limit = int(sys.argv[3]) if len(sys.argv) > 3 else 4000000
+    print(part1(sensors, row))
+    print(part2(sensors, limit))
@@ -0,0 +1,237 @@
+"""
+--- Day 16: Proboscidea Volcanium ---
+
+Solver logic from day16-volcano.ipynb, importable and headless. The pyvis graph of the
+tunnels is still available through draw_graph(), which needs the optional pyvis package.
+
+Sample Input:
+Valve AA has flow rate=0; tunnels lead to valves DD, II, BB
+Valve BB has flow rate=13; tunnels lead to valves CC, AA
+Valve CC has flow rate=2; tunnels lead to valves DD, BB
+Valve DD has flow rate=20; tunnels lead to valves CC, AA, EE
+Valve EE has flow rate=3; tunnels lead to valves FF, DD
+Valve FF has flow rate=0; tunnels lead to valves EE, GG
+Valve GG has flow rate=0; tunnels lead to valves FF, HH
+Valve HH has flow rate=22; tunnel leads to valve GG
+Valve II has flow rate=0; tunnels lead to valves AA, JJ
+Valve JJ has flow rate=21; tunnel leads to valve II
+
+Rules:
+1. It takes 1 minute to open a valve.
+2. All valves start closed.
+3. It takes 1 minute to move to a new valve.
+4. You start at valve AA
+5. When a valve is open, it begins releasing pressure at its given flow rate once per minute
+6. There is 30 minutes to release as much pressure as possible.
+7. A valve does not have to be opened to move to a different tunnel
+8. A valve stays open once it is opened.
+
+Part 2: you spend 4 minutes teaching an elephant, then both of you open valves for the
+remaining 26 minutes.
+"""
+
+import re
+import sys
+from collections import deque
+
+import numpy as np
+
+from aoc.inputs import InputFile
+
+def parse_valves(lines):
+    """
+    Parses the input lines and returns a dictionary of valves.
+    """
+    valves = {}
+    for line in lines:
+        # Parse with regex:
+        # Valve AA has flow rate=0; tunnels lead to valves DD, II, BB
+        m = re.match(r'Valve (\w+) has flow rate=(\d+); tunnels? leads? to valves? (.*)', line)
+        if m:
+            valve_name = m.group(1)
+            flow_rate = int(m.group(2))
+            tunnels = m.group(3).strip().split(', ')
+            valves[valve_name] = {'flow_rate': flow_rate, 'tunnels': tunnels}
+        elif line.strip():
+            print('Error parsing line: {}'.format(line), file=sys.stderr)
+    return valves
+
+def load_input(filename):
+    """
+    Loads the input file and returns a dictionary of valves.
+    """
+    return parse_valves(InputFile(filename).text)
+
+def find_shortest_path(valves):
+    """
+    Returns the list of tunnels in the shortest paths between all valves.
+    """
+    valve_paths = {}
+    for valve in valves.keys():
+        queue = deque([(valve, [])])
+        visited = set()
+        shortest_paths = {}
+        while queue:
+            node, path = queue.popleft()
+            if node not in visited:
+                visited.add(node)
+                if len(path) > 0:
+                    shortest_paths[node] = path
+                for tunnel in valves[node]['tunnels']:
+                    queue.append((tunnel, path + [tunnel]))
+        valve_paths[valve] = shortest_paths
+    return valve_paths
+
+def build_distance(valves, valve_paths):
+    """
+    Returns a dataframe of the distance between each pair of valves, and drops the paths
+    that end at a valve with no flow (there's no point heading there to open it).
+    """
+    import pandas as pd
+
+    distance = pd.DataFrame(index=valve_paths.keys(), columns=valve_paths.keys())
+    for valve in valve_paths.keys():
+        for tunnel in valve_paths[valve].keys():
+            distance.loc[valve, tunnel] = len(valve_paths[valve][tunnel])
+
+    for valve in list(valve_paths.keys()):
+        for tunnel in list(valve_paths[valve].keys()):
+            if valves[tunnel]['flow_rate'] == 0:
+                valve_paths[valve].pop(tunnel)
+                distance.loc[valve, tunnel] = np.nan
+    return distance
+
+def flow_frame(current_valve, valve_paths, input_df, distance, minutes=30):
+    """
+    A frame of the valves reachable from current_valve, with the time taken to get there and
+    open the valve, and the pressure that would release over the remaining minutes.
+    """
+    relative_flow = distance.loc[current_valve, list(valve_paths[current_valve].keys())].to_frame().rename(columns={current_valve: 'time_taken'})
+    relative_flow['time_taken'] = relative_flow['time_taken'] + 1
+    relative_flow['flow_rate'] = input_df.loc[list(valve_paths[current_valve].keys()), 'flow_rate']
+    relative_flow = relative_flow.sort_values(by=['time_taken', 'flow_rate'], ascending=[True, False])
+    relative_flow = relative_flow.reset_index().rename(columns={'index': 'destination'})
+    relative_flow['source'] = current_valve
+    relative_flow['remaining_time'] = minutes - relative_flow['time_taken']
+    relative_flow['pressure_released'] = relative_flow['remaining_time'] * relative_flow['flow_rate']
+    return relative_flow.sort_values(by=['time_taken', 'pressure_released', 'flow_rate'], ascending=[True, False, False])
+
+def potential_path_segments(valves, minutes=30):
+    """
+    All of the path segments worth walking: every move out of AA, plus the six best moves
+    out of each valve with a flow rate.
+    """
+    import pandas as pd
+
+    input_df = pd.DataFrame(valves).T
+    valve_paths = find_shortest_path(valves)
+    distance = build_distance(valves, valve_paths)
+
+    frames = [flow_frame('AA', valve_paths, input_df, distance, minutes)]
+    non_zero_nodes = set(input_df[input_df['flow_rate'] > 0].index)
+    for current_valve in non_zero_nodes:
+        frames.append(flow_frame(current_valve, valve_paths, input_df, distance, minutes).head(6))
+
+    potential_paths = pd.concat(frames).sort_values(by=['time_taken', 'pressure_released', 'flow_rate'], ascending=[True, False, False])
+    potential_paths['path'] = ''
+    return potential_paths
+
+def walk_paths(potential_paths, current_valve='AA'):
+    """
+    Recurse the valve tree paths until the end is reached
+    Create a source frame from potential_paths for the current valve
+    Create a destination frame from potential_paths for each destination in the current valve source frame
+    Update the destination frame with a label of the source and destination path
+    Update the destination frame to have time_remaining updated to be the time remaining from the current valve source frame
+    Update the destination frame pressure_released based on updated time_remaining
+    """
+    import pandas as pd
+
+    start_path = potential_paths[potential_paths['source'] == current_valve].copy()
+    start_path['path'] = start_path.apply(lambda x: '"{}","{}"'.format(x['source'], x['destination']), axis=1)
+    start_path['total_pressure_released'] = start_path['pressure_released']
+    walked_paths = deque()
+    walking_paths = deque([start_path])
+    while len(walking_paths) > 0:
+        current_path = walking_paths.pop()
+        walked_paths.append(current_path)
+        for i in range(len(current_path)):
+            destination = current_path.iloc[i]['destination']
+            source_path = current_path.iloc[i]['path']
+            eval_list = 'list([{}])'.format(current_path.iloc[i]['path'])
+            visited_path = eval(eval_list)
+            destination_path = potential_paths[(potential_paths['source'] == destination) & (~potential_paths['destination'].isin(visited_path))].copy()
+            if len(destination_path) == 0:
+                continue
+            destination_path['path'] = destination_path.apply(lambda x: '{},"{}"'.format(source_path, x['destination']), axis=1)
+            destination_path['remaining_time'] = current_path.iloc[i]['remaining_time'] - destination_path['time_taken']
+            destination_path['pressure_released'] = destination_path['remaining_time'] * destination_path['flow_rate']
+            destination_path['total_pressure_released'] = destination_path['pressure_released'] + current_path.iloc[i]['total_pressure_released']
+            destination_path = destination_path[destination_path['remaining_time'] >= 0].copy()
+            if len(destination_path) > 0:
+                walking_paths.append(destination_path)
+
+    return pd.concat(walked_paths).sort_values(by='total_pressure_released', ascending=False)
+
+def draw_graph(valves, net_output='day16-graph.html'):
+    """
+    Writes an interactive pyvis graph of the valves and tunnels. Needs the optional pyvis package.
+    """
+    from pyvis.network import Network
+
+    net = Network(notebook=True, cdn_resources='remote', height='100%', width='100%')
+    # add the valves as labeled nodes
+    for valve in valves.keys():
+        if valve == 'AA':
+            net.add_node(valve, label=valve, shape='circle', color='red', borderWidth=20)
+        elif valves[valve]['flow_rate'] > 0:
+            net.add_node(valve, label=valve, shape='circle', color='lightblue')
+        else:
+            net.add_node(valve, label=valve, shape='text', borderWidth=valves[valve]['flow_rate'])
+    # add the tunnels as edges
+    for valve in valves.keys():
+        for tunnel in valves[valve]['tunnels']:
+            net.add_edge(valve, tunnel)
+
+    net.barnes_hut(spring_length=0, spring_strength=0.115, damping=0.17)
+    net.show(net_output)
+    return net
+
+def parse(input):
+    return parse_valves(input.text)
+
+# Work out the steps to release the most pressure in 30 minutes. What is the most pressure you can release?
+def part1(valves):
+    walked_paths = walk_paths(potential_path_segments(valves, 30))
+    return int(walked_paths['total_pressure_released'].max())
+
+# With you and an elephant working together for 26 minutes, what is the most pressure you could release?
+def part2(valves, path1_count=200, path2_count=1000):
+    short_time = walk_paths(potential_path_segments(valves, 26))
+    short_time['path_steps'] = short_time['path'].apply(lambda x: x.split(',')[1:])
+
+    options = list(zip(short_time['path_steps'].map(frozenset), short_time['total_pressure_released']))
+
+    # find 1 path from the best path1_count and 1 from the best path2_count that have non-overlapping path_steps
+    # (on small inputs the best paths visit every valve, so widen the search to all of them if nothing fits)
+    best = best_disjoint_pair(options[:path1_count], options[:path2_count])
+    if best is None:
+        best = best_disjoint_pair(options, options)
+    return int(best) if best is not None else None
+
+def best_disjoint_pair(path1_options, path2_options):
+    best = None
+    for path1, total1 in path1_options:
+        for path2, total2 in path2_options:
+            if path1.isdisjoint(path2) and (best is None or total1 + total2 > best):
+                best = total1 + total2
+    return best
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 %s <input>" % sys.argv[0])
+        sys.exit(1)
+
+    valves = parse(InputFile(sys.argv[1]))
+    print(part1(valves))
+    print(part2(valves))
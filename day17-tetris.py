@@ -0,0 +1,271 @@
+"""
+--- Day 17: Pyroclastic Flow ---
+
+Solver logic from day17-tetris.ipynb, importable and headless.
+
+Pseudo-tetris: rocks drop one at a time down a chamber 7 columns wide, in the order
+dash, plus, backwards L, pipe and box. Each rock spawns 2 columns from the left wall and
+3 empty rows above the highest rock. The input is a string of '<' and '>' jets of gas;
+each step the jet pushes the rock sideways (unless it would collide) and then the rock
+falls one row, stopping when it can't.
+
+The chamber is one big int, a row of num_columns bits with a wall bit on each side per
+row, so moving a rock is a shift and a collision is a change in the bit count of the OR.
+
+1. How tall is the tower after 2022 rocks have stopped falling?
+2. How tall is it after 1000000000000 rocks? The notebook found the repeating window by
+   plotting the height deltas; here it's found by spotting a repeated chamber state.
+"""
+
+import sys
+from enum import Enum
+
+from aoc.inputs import InputFile
+
+# Globals and helper functions
+
+num_columns = 7
+
+# bit wise representation of a chamber row num_columns wide with walls on each side - 100000001
+ROW = 0b1 << num_columns + 1 | 0b1
+row_width = ROW.bit_length()
+
+def chunkstring(string, length):
+    return (string[0+i:length+i] for i in range(0, len(string), length))
+
+def rows_count(bitwise, row_width = row_width):
+    return -(bitwise.bit_length() // -row_width)
+
+def render(bitwise, row_width = row_width):
+    output_rows = rows_count(bitwise, row_width)
+    chamber_str = format(bitwise, '0' + str(output_rows * row_width) + 'b')
+    return chunkstring(chamber_str, row_width)
+
+# somewhat surprisingly, this scales extraordinarily well compared to << and | operators
+def block_of_rows(row_count):
+    row_str = bin(ROW)[2:]
+    return int('0b' + row_str * row_count, 2)
+
+def cstr(chamber, joiner = "\n", affix='-' * row_width):
+    if affix != "": affix = "\n" + affix
+    return joiner.join(list(render(chamber)))+affix
+
+def cprt(chamber):
+    for row in render(chamber): print(row)
+    print('-'*row_width, end="\n\n")
+
+# Shapes, padded for ROW with 2 spaces from the left wall
+
+# ####
+DASH = 0b000111100
+
+# .#.
+# ###
+# .#.
+PLUS = 0b000010000000111000000010000
+
+# ..#
+# ..#
+# ###
+BACKWARDS_L = 0b000001000000001000000111000
+
+# #
+# #
+# #
+# #
+PIPE = 0b000100000000100000000100000000100000
+
+# ##
+# ##
+BOX = 0b000110000000110000
+
+ShapeDict = {
+    'DASH': DASH,
+    'PLUS': PLUS,
+    'BACKWARDS_L': BACKWARDS_L,
+    'PIPE': PIPE,
+    'BOX': BOX
+}
+
+class Direction(Enum):
+    LEFT = '<'
+    RIGHT = '>'
+    UP = '^'
+    DOWN = 'v'
+
+    def longdesc(self):
+        if self == Direction.LEFT:
+            return "left"
+        elif self == Direction.RIGHT:
+            return "right"
+        elif self == Direction.UP:
+            return "up"
+        elif self == Direction.DOWN:
+            return "down"
+
+class BlockSpawner:
+    def __init__(self, spawn_sequence):
+        self.spawn_sequence = spawn_sequence
+        self.spawn_index = 0
+        self.spawn_cycle_count = 0
+        self.last_block = 0
+
+    def next_block(self):
+        block = self.spawn_sequence[self.spawn_index]
+        self.spawn_index += 1
+        if self.spawn_index >= len(self.spawn_sequence):
+            self.spawn_index = 0
+            self.spawn_cycle_count += 1
+        self.last_block = block
+        return block
+
+class ChamberState:
+    def __init__(self, chamber = 0, stopped_blocks = 0, current_block = 0, block_spawner = None):
+        self.chamber = chamber
+        self.stopped_blocks = stopped_blocks
+        self.current_block = current_block
+        self.blocks_dropped = 0
+
+        self._stopped_rows = 0
+        self._forgotten_rows = 0
+
+        if block_spawner is None:
+            block_spawner = BlockSpawner([DASH, PLUS, BACKWARDS_L, PIPE, BOX])
+
+        self.block_spawner = block_spawner
+
+    def next_block(self):
+        self.current_block = self.block_spawner.next_block()
+        return self.current_block
+
+    def __str__(self):
+        return "ChamberState(chamber = {}, stopped_blocks = {}, current_block = {}, blocks_dropped = {})".format(self.chamber, self.stopped_blocks, self.current_block, self.blocks_dropped)
+
+    def __repr__(self):
+        return self.__str__()
+
+    def render(self):
+        return cstr(self.chamber | self.stopped_blocks | self.current_block)
+
+    def block_height(self):
+        return self._stopped_rows + self._forgotten_rows
+
+    def spawn_rock(self, block_type = 0):
+        if self.current_block != 0:
+            return self
+
+        if block_type == 0:
+            current_block = self.next_block()
+        else:
+            current_block = block_type
+
+        # keep our chamber short by removing rows from the bottom of stopped blocks, past the height of the shortest column
+        blocked_str = format(self.stopped_blocks, '0' + str(self._stopped_rows * row_width) + 'b')
+        last_1 = max([blocked_str[x::9].find('1') for x in range(1,8)]) + 1
+        if last_1 > 0:
+            short_blocks = int(blocked_str[0:last_1 * 9], 2)
+            short_rows = rows_count(short_blocks)
+            rows_removed = self._stopped_rows - short_rows
+            self._forgotten_rows += rows_removed
+            self.stopped_blocks = short_blocks
+            self._stopped_rows = short_rows
+
+        spawn_height = (self._stopped_rows + 3) + rows_count(self.current_block)
+        self.current_block <<= row_width * (spawn_height - rows_count(self.current_block))
+
+        # we *could* do a comparison here, but its not as fast as just blindly rebuilding an appropriately sized chamber
+        self.chamber = block_of_rows(spawn_height)
+        return self
+
+    def _move_block(self, direction: Direction, current_block):
+        if direction == Direction.LEFT:
+            return current_block << 1
+        elif direction == Direction.RIGHT:
+            return current_block >> 1
+        elif direction == Direction.UP:
+            return current_block << row_width
+        elif direction == Direction.DOWN:
+            return current_block >> row_width
+        else:
+            return current_block
+
+    def advance(self, direction: Direction):
+        self.spawn_rock()
+        current_count = (self.chamber | self.stopped_blocks | self.current_block).bit_count()
+        shifted_block = self._move_block(direction, self.current_block)
+        collision_check_count = (self.chamber | self.stopped_blocks | shifted_block).bit_count()
+        if current_count == collision_check_count:
+            self.current_block = shifted_block
+        elif direction == Direction.DOWN:
+            self.stopped_blocks = self.stopped_blocks | self.current_block
+            self._stopped_rows = rows_count(self.stopped_blocks)
+            self.current_block = 0
+            self.blocks_dropped += 1
+
+        return self
+
+# Drop rocks until drop_target have stopped, returning the height of the tower after each one
+def drop_rocks(commands, drop_target):
+    directions = [Direction(command) for command in commands]
+    current_chamber = ChamberState()
+    heights = [0]
+    step = 0
+    while current_chamber.blocks_dropped < drop_target:
+        current_chamber.advance(directions[step % len(directions)])
+        current_chamber.advance(Direction.DOWN)
+        step += 1
+        if current_chamber.current_block == 0:
+            heights.append(current_chamber.block_height())
+    return heights
+
+# Drop rocks until the chamber repeats: the same rock and jet are up next, and the top of the tower
+# (what's left after the chamber forgets the rows nothing can reach) is the same shape.
+# Returns the heights so far, and the rock count where the repeat started and its length.
+def find_cycle(commands):
+    directions = [Direction(command) for command in commands]
+    current_chamber = ChamberState()
+    heights = [0]
+    seen = {}
+    step = 0
+    while True:
+        if current_chamber.current_block == 0:
+            # spawn now so the chamber forgets its unreachable rows before we look at it
+            current_chamber.spawn_rock()
+            key = (current_chamber.block_spawner.spawn_index, step % len(directions), current_chamber.stopped_blocks)
+            if key in seen:
+                base = seen[key]
+                return heights, base, current_chamber.blocks_dropped - base
+            seen[key] = current_chamber.blocks_dropped
+        current_chamber.advance(directions[step % len(directions)])
+        current_chamber.advance(Direction.DOWN)
+        step += 1
+        if current_chamber.current_block == 0:
+            heights.append(current_chamber.block_height())
+
+def tower_height(commands, target):
+    heights, base, m = find_cycle(commands)
+    if target < len(heights):
+        return heights[target]
+    windows, end_stop_size = divmod(target - base, m)
+    range_rows = heights[base + m] - heights[base]
+    return heights[base + end_stop_size] + windows * range_rows
+
+def parse(input):
+    return bytes(input.first_line()).decode().strip()
+
+# How many units tall will the tower of rocks be after 2022 rocks have stopped falling?
+def part1(commands, drop_target=2022):
+    return drop_rocks(commands, drop_target)[drop_target]
+
+# How tall will the tower be after 1000000000000 rocks have stopped?
+def part2(commands, target=1000000000000):
+    return tower_height(commands, target)
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 %s <input>" % sys.argv[0])
+        sys.exit(1)
+
+    commands = parse(InputFile(sys.argv[1]))
+    print(part1(commands))
+    print(part2(commands))
@@ -0,0 +1,77 @@
+"""
+--- Day 18: Boiling Boulders ---
+
+Solver logic from day18-obsidian.ipynb, importable and headless. The notebook counted the
+faces matplotlib drew for the voxels; here the faces are counted straight off the numpy
+array, and draw_droplet() still renders the voxels if matplotlib is installed.
+
+The input is a list of 1x1x1 cubes in x,y,z form, a scan of a lava droplet.
+
+1. What is the surface area of the scanned droplet? (every face not touching another cube)
+2. What is the exterior surface area, ignoring air pockets trapped inside the droplet?
+"""
+
+import sys
+
+import numpy as np
+
+from aoc.inputs import InputFile
+
+# Parse the x,y,z lines in to a list of points
+def parse_points(lines):
+    points = []
+    for line in lines:
+        line = line.strip()
+        if line:
+            x, y, z = line.split(',')
+            points.append((int(x), int(y), int(z)))
+    return points
+
+# A boolean voxel array of the droplet
+def droplet(points):
+    d = max([max(x) for x in points])
+    n_drop = np.zeros((d+1, d+1, d+1), dtype=bool)
+    for point in points:
+        n_drop[point[0], point[1], point[2]] = True
+    return n_drop
+
+# Count the faces between a filled voxel and an empty one (or the edge of the array)
+def surface_area(n_drop):
+    padded = np.pad(n_drop, 1)
+    return int(sum(np.count_nonzero(np.diff(padded, axis=axis)) for axis in range(3)))
+
+def draw_droplet(n_drop, color='#EE0077FF'):
+    """
+    Plot the droplet's voxels with matplotlib, which is optional.
+    """
+    import matplotlib.pyplot as plt
+
+    colors = np.empty(n_drop.shape, dtype=object)
+    colors[n_drop] = color
+    fig = plt.figure(figsize=(10, 10))
+    ax = fig.add_subplot(projection='3d')
+    ax.voxels(n_drop, facecolors=colors)
+    plt.show()
+    return fig
+
+def parse(input):
+    return droplet(parse_points(input.text))
+
+# What is the surface area of your scanned lava droplet?
+def part1(n_drop):
+    return surface_area(n_drop)
+
+# What is the exterior surface area of your scanned lava droplet?
+def part2(n_drop):
+    from scipy import ndimage
+
+    return surface_area(ndimage.binary_fill_holes(n_drop))
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 %s <input>" % sys.argv[0])
+        sys.exit(1)
+
+    n_drop = parse(InputFile(sys.argv[1]))
+    print(part1(n_drop))
+    print(part2(n_drop))
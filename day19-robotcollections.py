@@ -0,0 +1,170 @@
+"""
+--- Day 19: Not Enough Minerals ---
+
+Solver logic from day19-robotcollections.ipynb, importable and headless. Each blueprint
+is solved as an integer program with pyomo and the glpk solver, both of which need to be
+installed.
+
+You start with 1 ore-collecting robot. Each robot collects 1 of its resource per minute,
+and the factory takes a minute to build a robot out of the resources on hand when it
+starts. Only one robot can be built at a time.
+
+Blueprint 1:
+  Each ore robot costs 4 ore.
+  Each clay robot costs 2 ore.
+  Each obsidian robot costs 3 ore and 14 clay.
+  Each geode robot costs 2 ore and 7 obsidian.
+
+1. The quality level of a blueprint is its ID times the most geodes it can open in 24
+   minutes. What is the sum of the quality levels of all the blueprints?
+2. Only the first 3 blueprints are left, but there's 32 minutes. What is the product of
+   the most geodes each of them can open?
+"""
+
+import re
+import sys
+from functools import reduce
+
+from aoc.inputs import InputFile
+
+def parse_blueprints(lines, limit=None):
+    # Parse lines of the following format:
+    # Blueprint (BLUEPRINT_ID): Each ore robot costs (ORE_ORE_COST) ore. Each clay robot costs (CLAY_ORE_COST) ore. Each obsidian robot costs (OBSIDIAN_ORE_COST) ore and (OBSIDIAN_CLAY_COST) clay. Each geode robot costs (GEODE_ORE_COST) ore and (GEODE_OBSIDIAN_COST) obsidian.
+    # Return a dict of blueprints by ID, where each blueprint maps a robot type to the resources it costs
+    blueprints = {}
+    for line in lines:
+        if line.startswith("Blueprint"):
+            matches = re.search(r"Blueprint (\d+): Each ore robot costs (\d+) ore. Each clay robot costs (\d+) ore. Each obsidian robot costs (\d+) ore and (\d+) clay. Each geode robot costs (\d+) ore and (\d+) obsidian.", line)
+            if matches:
+                blueprint = {
+                  "ore_robot": {
+                    "ore": int(matches.group(2)),
+                    "clay": 0, "obsidian": 0, "geode": 0
+                  },
+                  "clay_robot": {
+                    "ore": int(matches.group(3)),
+                    "clay": 0, "obsidian": 0, "geode": 0
+                  },
+                  "obsidian_robot": {
+                    "ore": int(matches.group(4)),
+                    "clay": int(matches.group(5)),
+                    "obsidian": 0, "geode": 0
+                  },
+                  "geode_robot": {
+                    "ore": int(matches.group(6)),
+                    "clay": 0,
+                    "obsidian": int(matches.group(7)),
+                    "geode": 0
+                  }
+                }
+                blueprints[int(matches.group(1))] = blueprint
+                if limit is not None and len(blueprints) >= limit:
+                    break
+            else:
+                print("Error: could not parse line: " + line, file=sys.stderr)
+    return blueprints
+
+def load_blueprints_from_file(filename, limit=None):
+    return parse_blueprints(InputFile(filename).text, limit)
+
+def build_model(robot_costs, time):
+    import pyomo.environ as pe
+
+    # Decision variables
+    model = pe.ConcreteModel()
+
+    # Time index for the model
+    model.time = pe.Set(initialize=range(0, time + 1))
+
+    # Whether to build a robot of each type at a given time (Constraint: only 1 can be built at a time, ore_build_robot is initialized to 1 at time 0)
+    model.ore_build_robot = pe.Var(model.time, domain=pe.Binary, initialize=0)
+    model.clay_build_robot = pe.Var(model.time, domain=pe.Binary, initialize=0)
+    model.obsidian_build_robot = pe.Var(model.time, domain=pe.Binary, initialize=0)
+    model.geode_build_robot = pe.Var(model.time, domain=pe.Binary, initialize=0)
+
+    # At each moment in time, we can calculate the total number of robots of each type by summing the number of robots of that type that have been built up to that time
+    model.ore_robots = pe.Expression(model.time, rule=lambda model, t: sum(model.ore_build_robot[i] for i in range(t)))
+    model.clay_robots = pe.Expression(model.time, rule=lambda model, t: sum(model.clay_build_robot[i] for i in range(t)))
+    model.obsidian_robots = pe.Expression(model.time, rule=lambda model, t: sum(model.obsidian_build_robot[i] for i in range(t)))
+    model.geode_robots = pe.Expression(model.time, rule=lambda model, t: sum(model.geode_build_robot[i] for i in range(t)))
+
+    # At each moment in time, we can calculate the number of resources of a type generated by taking the cumulative sum of the number of robots of that type that have been built up to that time
+    model.ore_generated = pe.Expression(model.time, rule=lambda model, t: sum(model.ore_robots[i] for i in range(t + 1)))
+    model.clay_generated = pe.Expression(model.time, rule=lambda model, t: sum(model.clay_robots[i] for i in range(t + 1)))
+    model.obsidian_generated = pe.Expression(model.time, rule=lambda model, t: sum(model.obsidian_robots[i] for i in range(t + 1)))
+    model.geode_generated = pe.Expression(model.time, rule=lambda model, t: sum(model.geode_robots[i] for i in range(t + 1)))
+
+    # At each moment in time, the resources of a type used are the cost in that resource of every robot built up to that time
+    def resource_used(resource_type):
+        return lambda model, t: (
+            (model.ore_robots[t] - 1 + model.ore_build_robot[t]) * robot_costs['ore_robot'][resource_type] +
+            (model.clay_robots[t] + model.clay_build_robot[t]) * robot_costs['clay_robot'][resource_type] +
+            (model.obsidian_robots[t] + model.obsidian_build_robot[t]) * robot_costs['obsidian_robot'][resource_type] +
+            (model.geode_robots[t] + model.geode_build_robot[t]) * robot_costs['geode_robot'][resource_type]
+        )
+    model.ore_used = pe.Expression(model.time, rule=resource_used('ore'))
+    model.clay_used = pe.Expression(model.time, rule=resource_used('clay'))
+    model.obsidian_used = pe.Expression(model.time, rule=resource_used('obsidian'))
+    model.geode_used = pe.Expression(model.time, rule=resource_used('geode'))
+
+    # At each moment in time, we can calculate the total number of resources of a type by subtracting the number of resources of that type used from the number of resources of that type generated
+    model.ore = pe.Expression(model.time, rule=lambda model, t: model.ore_generated[t] - model.ore_used[t])
+    model.clay = pe.Expression(model.time, rule=lambda model, t: model.clay_generated[t] - model.clay_used[t])
+    model.obsidian = pe.Expression(model.time, rule=lambda model, t: model.obsidian_generated[t] - model.obsidian_used[t])
+    model.geode = pe.Expression(model.time, rule=lambda model, t: model.geode_generated[t] - model.geode_used[t])
+
+    # Constraints
+    # Start with 1 ore robot built at time 0
+    model.c0 = pe.Constraint(expr=model.ore_build_robot[0] == 1)
+
+    # At any given time, only 1 robot can be built
+    model.c2 = pe.ConstraintList()
+    for t in model.time:
+        model.c2.add(sum([model.ore_build_robot[t], model.clay_build_robot[t], model.obsidian_build_robot[t], model.geode_build_robot[t]]) <= 1)
+    # At any given time, the number of resources of a type must be greater than or equal to the cost of the next robot of that type to be built
+    for robot_type in robot_costs.keys():
+        robot_resource_type = robot_type.split('_')[0]
+        for t in model.time:
+            if t == 0:
+                continue
+            mat_constraint_name = robot_type + '_build_robot_mats_' + str(t)
+            model.add_component(mat_constraint_name, pe.ConstraintList())
+            robot_build_mats = getattr(model, mat_constraint_name)
+            for resource_type in robot_costs[robot_type].keys():
+                robot_build_mats.add(getattr(model, resource_type)[t - 1] >= robot_costs[robot_type][resource_type] * getattr(model, robot_resource_type + '_build_robot')[t])
+
+    # Objective function
+    model.obj = pe.Objective(expr=model.geode[time], sense=pe.maximize)
+    return model
+
+# The most geodes a blueprint can open in the given time
+def max_geodes(robot_costs, time, solver='glpk'):
+    import pyomo.environ as pe
+
+    model = build_model(robot_costs, time)
+    pe.SolverFactory(solver).solve(model)
+    return int(round(model.obj()))
+
+def parse(input):
+    return parse_blueprints(input.text)
+
+# What do you get if you add up the quality level of all of the blueprints in your list?
+def part1(blueprints, time=24):
+    total_quality_levels = 0
+    for blueprint_id in blueprints:
+        total_quality_levels += blueprint_id * max_geodes(blueprints[blueprint_id], time)
+    return total_quality_levels
+
+# What do you get if you multiply together the largest number of geodes of the first three blueprints?
+def part2(blueprints, time=32, count=3):
+    geodes_collected = [max_geodes(blueprints[blueprint_id], time) for blueprint_id in list(blueprints)[:count]]
+    return reduce(lambda x, y: x * y, geodes_collected)
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 %s <input>" % sys.argv[0])
+        sys.exit(1)
+
+    blueprints = parse(InputFile(sys.argv[1]))
+    print(part1(blueprints))
+    print(part2(blueprints))
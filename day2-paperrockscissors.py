@@ -19,15 +19,28 @@ A Y = (2 points for playing Y, 6 points for winning = round score of 8)
 B X = (1 point for playing X, 0 points for losing = round score of 1)
 C Z = (3 points for playing Z, 3 points for a draw = round score 6)
 ----
+
+Part 2 reads the second column as the outcome instead: X means lose, Y draw and Z win, and
+your play is whatever gets that outcome.
+
+Either way a round's score only depends on the pair of letters, so there are just 9 possible
+rounds. The table-driven scorer looks each round up in a 9 entry table indexed by
+(opponent - 'A') * 3 + (column - 'X'); the numpy scorer counts how often each of the 9 rounds
+comes up straight from the file's bytes and takes the dot product with each rule's table, so
+both parts come from one pass over the input.
 """
 
+import sys
+
+from aoc.inputs import InputFile
+
 # Take in a list of pairs [opponent play, your play] and return the total score earned
 def total_score(list):
     score = 0
     
-    for i in range(len(list)): # Iterate through the list of pairs, one pair at a time
-        play = list[i][0]
-        choice = list[i][2]
+    for line in list: # Iterate through the list of pairs, one pair at a time
+        play = line[0]
+        choice = line[2]
         if choice == 'Y':
             if play == 'A': choice = 'X'
             if play == 'B': choice = 'Y'
@@ -53,8 +66,74 @@ def total_score(list):
         if (choice == 'Z'): score += 3
     return score
 
-with open("day2-input.txt") as f:
-    content = f.readlines()
-content = [x.strip() for x in content]
-print(total_score(content))
+# Score of one round, with shapes numbered ROCK=0, PAPER=1, SCISSORS=2
+def round_score(opponent, me):
+    outcome = (me - opponent + 1) % 3 # 0 lose, 1 draw, 2 win
+    return (me + 1) + outcome * 3
+
+# Score tables indexed by (opponent - 'A') * 3 + (column - 'X')
+# Part 1: the column is your play
+PLAY_SCORES = [round_score(opponent, column) for opponent in range(3) for column in range(3)]
+# Part 2: the column is the outcome, so your play is the shape that loses to, draws with or beats the opponent's
+OUTCOME_SCORES = [round_score(opponent, (opponent + column - 1) % 3) for opponent in range(3) for column in range(3)]
+
+# Total score of a list of rounds ("A Y" lines, str or bytes) through a score table
+def table_score(list, table):
+    score = 0
+    for line in list:
+        if line:
+            line = line.encode() if isinstance(line, str) else line
+            score += table[(line[0] - 65) * 3 + (line[2] - 88)]
+    return score
+
+# How many times each of the 9 rounds comes up in a bytes-like input, in table order
+def round_counts(data):
+    import numpy as np
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    # every line starts at the beginning of the file or after a newline; skip blank lines,
+    # and a last line too short to hold a round
+    starts = np.flatnonzero(raw == ord('\n')) + 1
+    starts = np.concatenate(([0], starts))
+    starts = starts[starts + 2 < len(raw)]
+    starts = starts[raw[starts] >= ord('A')]
+    index = (raw[starts].astype(np.intp) - ord('A')) * 3 + (raw[starts + 2] - ord('X'))
+    return np.bincount(index, minlength=9)
+
+# Both parts' totals from one count of the rounds
+def scores(data):
+    import numpy as np
+
+    counts = round_counts(data)
+    return int(counts @ np.array(PLAY_SCORES)), int(counts @ np.array(OUTCOME_SCORES))
+
+def parse(input):
+    return input
+
+# Reading X, Y and Z as your play, what would your total score be?
+def part1(input):
+    return scores(input.buffer)[0]
+
+# Reading X, Y and Z as the round outcome (lose, draw, win), what would your total score be?
+def part2(input):
+    return scores(input.buffer)[1]
+
+# Alternate engines for each part, timed against each other by `python -m aoc bench engines 2`
+ENGINES = {
+    'loop': {
+        2: lambda input: total_score(input.text),
+    },
+    'table': {
+        1: lambda input: table_score(input, PLAY_SCORES),
+        2: lambda input: table_score(input, OUTCOME_SCORES),
+    },
+    'numpy': {
+        1: part1,
+        2: part2,
+    },
+}
 
+if __name__ == '__main__':
+    content = parse(InputFile(sys.argv[1] if len(sys.argv) > 1 else "day2-input.txt"))
+    print(part1(content))
+    print(part2(content))
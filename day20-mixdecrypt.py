@@ -0,0 +1,178 @@
+"""
+--- Day 20: Grove Positioning System ---
+
+Solver logic from day20-mixdecrypt.ipynb, importable and headless.
+
+The input file is a list of numbers. To mix the file, move each number forward or backward
+in the file a number of positions equal to the value of the number being moved. The list
+is circular, and numbers are moved in the order they originally appear in the file.
+
+The grove coordinates are the 1000th, 2000th, and 3000th numbers after the value 0.
+
+1. Mix the file once. What is the sum of the three numbers that form the grove coordinates?
+2. Multiply each number by the decryption key 811589153 and mix the list 10 times.
+   What is the sum of the grove coordinates now?
+"""
+
+import sys
+
+from aoc.inputs import InputFile
+
+# create a circular linked list of the input numbers, and store an object reference to the nodes in the order they appear in the input file
+class Node:
+    def __init__(self, value, shift_amount, id):
+        self.id = id
+        self.value = value
+        self.next = None
+        self.prev = None
+        self.shift_amt = shift_amount
+
+    def move(self, n):
+        # move the node n positions forward or backward
+        if n == 0:
+            return
+        insert_after = self
+        if n > 0:
+            for i in range(n):
+                insert_after = insert_after.next
+                if insert_after == self:
+                    # skip over self on iterations
+                    insert_after = insert_after.next
+        else:
+            for i in range(abs(n) + 1):
+                insert_after = insert_after.prev
+                if insert_after == self:
+                    # skip over self on iterations
+                    insert_after = insert_after.prev
+        if self.prev == insert_after or self == insert_after:
+            return
+        self.remove()
+        self.insert_after(insert_after)
+
+    def remove(self):
+        # remove the node from the list
+        self.prev.next = self.next
+        self.next.prev = self.prev
+
+    def insert_after(self, node):
+        # insert the node after the given node
+        self.next = node.next
+        self.prev = node
+        node.next.prev = self
+        node.next = self
+
+    def neighbors(self, before_context, after_context):
+        # the nodes before and after the current node
+        current = self
+        neighbors = []
+        for i in range(before_context):
+            current = current.prev
+        for i in range(before_context + after_context + 1):
+            neighbors.append(current)
+            current = current.next
+        return neighbors
+
+    def lookahead(self, n):
+        # return the node n positions ahead
+        current = self
+        for i in range(n):
+            current = current.next
+        return current
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+class CircularDoublyLinkedList:
+
+    def __init__(self) -> None:
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def append(self, value, shift_amt, id):
+        node = Node(value, shift_amt, id)
+        if self.head is None:
+            self.head = node
+            self.tail = node
+            node.next = node
+            node.prev = node
+        else:
+            self.tail.next = node
+            node.prev = self.tail
+            node.next = self.head
+            self.head.prev = node
+            self.tail = node
+        self.size += 1
+        return node
+
+    def find(self, value):
+        current = self.head
+        for i in range(self.size):
+            if current.value == value:
+                return current
+            current = current.next
+        return None
+
+    def shift_to_head(self, value):
+        # move the node with the given value to the head of the list
+        node = self.find(value)
+        if node is not None:
+            self.head = node
+
+    def __str__(self) -> str:
+        current = self.head
+        output = []
+        for i in range(self.size):
+            output.append(str(current))
+            current = current.next
+        return '[' + ', '.join(output) + ']'
+
+    # iterator
+    def __iter__(self):
+        current = self.head
+        for i in range(self.size):
+            yield current
+            current = current.next
+
+def process_list(input_numbers, decrypt_key = 1, mix_count = 1):
+    # create a circular doubly linked list of the input numbers
+    numbers = CircularDoublyLinkedList()
+    sequence = []
+    list_len = len(input_numbers)
+    for i, number in enumerate(input_numbers):
+        keyed_number = number * decrypt_key
+
+        # moving list_len - 1 places brings a number back to where it started
+        shift_amount = keyed_number % (list_len - 1)
+        sequence.append(numbers.append(keyed_number, shift_amount, i))
+
+    # move each number forward or backward in the list a number of positions equal to the value of the number being moved
+    for x in range(mix_count):
+        for current in sequence:
+            current.move(current.shift_amt)
+
+    return numbers
+
+def grove_coordinates(numbers):
+    zero = numbers.find(0)
+    return [zero.lookahead(n).value for n in (1000, 2000, 3000)]
+
+def parse(input):
+    return [int(line) for line in input if line.strip()]
+
+# Mix the file once. What is the sum of the three numbers that form the grove coordinates?
+def part1(input_numbers):
+    return sum(grove_coordinates(process_list(input_numbers)))
+
+# Apply the decryption key and mix 10 times. What is the sum of the three numbers that form the grove coordinates?
+def part2(input_numbers, decrypt_key=811589153, mix_count=10):
+    return sum(grove_coordinates(process_list(input_numbers, decrypt_key, mix_count)))
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 %s <input>" % sys.argv[0])
+        sys.exit(1)
+
+    input_numbers = parse(InputFile(sys.argv[1]))
+    print(part1(input_numbers))
+    print(part2(input_numbers))
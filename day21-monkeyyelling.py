@@ -0,0 +1,174 @@
+"""
+--- Day 21: Monkey Math ---
+
+Solver logic from day21-monkeyyelling.ipynb, importable and headless. The pyvis dependency
+graph is still available through build_dependency_graph(), which needs the optional pyvis
+package. Part 2 solves the equation with sympy.
+
+Given a list in this format:
+---
+root: pppw + sjmn
+dbpl: 5
+cczh: sllz + lgvd
+zczc: 2
+ptdq: humn - dvpt
+dvpt: 3
+lfqf: 4
+humn: 5
+ljgn: 2
+sjmn: drzm * dbpl
+sllz: 4
+pppw: cczh / lfqf
+lgvd: ljgn * ptdq
+drzm: hmdt - zczc
+hmdt: 32
+---
+
+Where each line is [name]: [value] and the value is either a number or an expression,
+where the expression is a combination of the names of other lines, and the operators
+are +, -, *, /.
+
+1. What number will the monkey named root yell?
+2. root actually checks that its two numbers are equal, and humn is you. What number do
+   you yell to pass root's equality test?
+"""
+
+import re
+import sys
+
+from aoc.inputs import InputFile
+
+def parse_line(line):
+    """
+    Parse a line of the input file.
+    Returns a tuple of (name, value, dependencies)
+    """
+    try:
+        name, value = line.split(':')
+        dependencies = []
+        # if value is an int, we have no dependencies
+        if not value.strip().isdigit():
+            # find all the names in the value
+            dependencies = re.findall('[a-z]{4}', value)
+        return name.strip(), value.strip(), dependencies
+    except Exception as e:
+        print("Error parsing line: {}".format(line), file=sys.stderr)
+        raise e
+
+def parse_yelling_monkeys(lines):
+    """
+    Parses a set of lines in to dependent monkeys.
+    Returns a dictionary of {name: (value, dependencies)}
+    """
+    return {name: (value, dependencies) for name, value, dependencies in map(parse_line, (line for line in lines if line.strip()))}
+
+def parse_file(filename):
+    """
+    Parses a file of monkey yelling.
+    Returns a dictionary of {name: (value, dependencies)}
+    """
+    return parse_yelling_monkeys(InputFile(filename).text)
+
+# monkeys is a dict keyed on the name of the monkey, with the value being a tuple of (value, dependencies)
+# where value is either a number or an expression, and dependencies is a list of the names of the other monkeys referenced in the expression
+
+# start from the 'root' monkey, and work our way down the tree, evaluating the expressions as we go
+# we'll keep a dict of the values of the monkeys we've already evaluated, so we don't have to re-evaluate them
+
+def evaluate_monkey(monkey, monkeys, monkey_values):
+    """
+    Evaluates the value of a monkey, and returns the value.
+    """
+    # if we've already evaluated this monkey, return the value
+    if monkey in monkey_values:
+        return monkey_values[monkey]
+    # if the monkey has no dependencies, it's a number, so just return the value
+    if not monkeys[monkey][1]:
+        monkey_values[monkey] = int(monkeys[monkey][0])
+        return monkey_values[monkey]
+    # if we get here, we need to evaluate the expression
+    # we'll do this by replacing the names of the dependencies with their values
+    # and then evaluating the expression
+    expression = monkeys[monkey][0]
+    for dependency in monkeys[monkey][1]:
+        expression = expression.replace(dependency, str(evaluate_monkey(dependency, monkeys, monkey_values)))
+    # now we can evaluate the expression
+    monkey_values[monkey] = eval(expression)
+    return monkey_values[monkey]
+
+def build_dependency_graph(monkeys):
+    """
+    Builds a dependency graph of the monkeys. Needs the optional pyvis package.
+    Returns a pyvis.network.Network object
+    """
+    from pyvis.network import Network
+
+    g = Network(notebook=True, cdn_resources='remote', height='100%', width='100%')
+    for monkey in monkeys:
+        color = 'gray'
+        if monkey == 'root':
+            color = 'green'
+        elif monkey == 'humn':
+            color = 'yellow'
+        elif len(monkeys[monkey][1]) > 0:
+            color = 'blue'
+        g.add_node(monkey, label=monkey, color=color)
+    for monkey in monkeys:
+        for dependency in monkeys[monkey][1]:
+            g.add_edge(monkey, dependency)
+    return g
+
+"""
+Given a monkey, we want to recursively build an expression that we can evaluate by expanding the dependencies in the formula.
+
+For example:
+
+root: pppw + sjmn
+pppw: cczh / lfqf
+cczh: sllz + lgvd
+sllz: 4
+lfqf: 4
+lgvd: ljgn * sllz
+sjmn: sllz + lfqf
+
+pppw = cczh / lfqf = (sllz + lgvd) / lfqf = (sllz + (ljgn * sllz)) / lfqf
+"""
+
+def build_expression(monkey, monkeys):
+    """
+    Recursively builds an expression for a monkey.
+    """
+    # if the monkey has no dependencies, it's a number (or humn), so just return the value
+    if not monkeys[monkey][1]:
+        return monkeys[monkey][0]
+    expression = monkeys[monkey][0]
+    for dependency in monkeys[monkey][1]:
+        expression = expression.replace(dependency, build_expression(dependency, monkeys))
+    return '(' + expression + ')'
+
+def parse(input):
+    return parse_yelling_monkeys(input.text)
+
+# What number will the monkey named root yell?
+def part1(monkeys):
+    return int(evaluate_monkey('root', monkeys, {}))
+
+# What number do you yell to pass root's equality test?
+def part2(monkeys):
+    from sympy import solve
+
+    monkeys = dict(monkeys)
+    monkeys['humn'] = ('humn', [])
+
+    expr1 = build_expression(monkeys['root'][1][0], monkeys)
+    expr2 = build_expression(monkeys['root'][1][1], monkeys)
+    return int(solve(expr1 + ' - ' + expr2, 'humn')[0])
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 %s <input>" % sys.argv[0])
+        sys.exit(1)
+
+    monkeys = parse(InputFile(sys.argv[1]))
+    print(part1(monkeys))
+    print(part2(monkeys))
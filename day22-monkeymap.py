@@ -0,0 +1,330 @@
+"""
+--- Day 22: Monkey Map ---
+
+Solver logic from day22-monkeymap.ipynb, importable and headless.
+
+Example input from file:
+---
+        ...#
+        .#..
+        #...
+        ....
+...#.......#
+........#...
+..#....#....
+..........#.
+        ...#....
+        .....#..
+        .#......
+        ......#.
+
+10R5L5R10L4R5L5
+---
+
+The first half of the notes is a map of the board, with open tiles (.) and solid walls (#).
+The second half is the path to follow: a number is how many tiles to move forward (stopping
+at a wall), and R or L turns 90 degrees clockwise or counterclockwise.
+
+You begin in the leftmost open tile of the top row, facing right. The final password is the
+sum of 1000 times the row, 4 times the column, and the facing (0 for right, 1 for down, 2
+for left, and 3 for up), with rows and columns counted from 1.
+
+The input files also carry a map of the numbered cube faces, and the edges that join them
+("1 ^ 6 <" means leaving face 1 upwards enters face 6 from its left side), since the way the
+board folds up is different between the sample and the real input.
+
+1. Moving off the board wraps around to the other side of the row or column. What is the
+   final password?
+2. The board folds up in to a cube, so moving off a face continues on the adjoining face.
+   What is the final password?
+
+All indexing should be done with (row, col) tuples, which index the board Grid directly
+"""
+
+import re
+import sys
+from enum import Enum
+
+import numpy as np
+
+from aoc.grid import Grid
+from aoc.inputs import InputFile
+
+# board characters, as the bytes the Grid holds
+OPEN = ord('.')
+WALL = ord('#')
+VOID = ord(' ')
+
+# Direction enum
+class Direction(Enum):
+    RIGHT = 0
+    DOWN = 1
+    LEFT = 2
+    UP = 3
+
+    def symbols() -> list:
+        return ['>', 'v', '<', '^']
+
+    def tuples() -> list:
+        return [(0, 1), (1, 0), (0, -1), (-1, 0)]
+
+    def value_from(initial) -> 'Direction':
+        if isinstance(initial, str):
+            if initial == 'R':
+                initial = 0
+            elif initial == 'L':
+                initial = 2
+            else:
+                initial = Direction.symbols().index(initial)
+        elif isinstance(initial, tuple):
+            initial = Direction.tuples().index(initial)
+        elif isinstance(initial, Direction):
+            initial = initial.value
+        else:
+            raise ValueError("Invalid direction: {}".format(initial))
+        return Direction(initial)
+
+    def turn(self, direction):
+        direction = Direction.value_from(direction)
+        if direction == Direction.RIGHT:
+            return Direction((self.value + 1) % 4)
+        elif direction == Direction.LEFT:
+            return Direction((self.value - 1) % 4)
+        else:
+            raise ValueError("Invalid direction: {}".format(direction))
+
+    def symbol(self):
+        return Direction.symbols()[self.value]
+
+    def tuple(self):
+        return Direction.tuples()[self.value]
+
+    def __str__(self):
+        return self.symbol()
+
+    def __repr__(self):
+        return str(self)
+
+def parse_lines(lines):
+    """
+    Reads the lines of the notes and returns a Grid of the board's characters, a list of
+    instructions separated by number and letter, the cube map (the board with each tile replaced by
+    the number of its cube face) and the transitions between the cube faces.
+    """
+    lines = iter(lines)
+    board_lines = []
+    cube_map_lines = []
+    transitions = {}
+
+    for line in lines:
+        if line.strip() == '':
+            break
+        board_lines.append(line.rstrip('\n'))
+    instructions = re.findall(r'\d+|[RL]', next(lines, ''))
+    next(lines, None)
+    for line in lines:
+        if line.strip() == '':
+            break
+        cube_map_lines.append(line.rstrip('\n'))
+    for line in lines:
+        if line.strip() == '':
+            break
+        matches = re.match(r'(\d) ([<>^v]) (\d) ([<>^v])', line)
+        if not matches:
+            raise ValueError("Invalid transition: {}".format(line))
+        side1, side2 = int(matches[1]), int(matches[3])
+        dir1, dir2 = Direction.value_from(matches[2]), Direction.value_from(matches[4])
+        transitions[side1, dir1] = side2, dir2
+        transitions[side2, dir2] = side1, dir1
+
+    # a grid of the board's bytes, with the short lines padded out with ' '
+    board = Grid.from_bytes(board_lines, fill=b' ')
+
+    cube_map = board.copy()
+    for i, line in enumerate(cube_map_lines):
+        cube_map.cells[i, :len(line)] = np.frombuffer(line.encode(), dtype=np.uint8)
+
+    return board, instructions, cube_map, transitions
+
+def parse_input(filename):
+    return parse_lines(InputFile(filename).text)
+
+# find the upper left and lower right corners of each numbered cube face in the cube map
+def find_cube_corners(cube_map):
+    cube_corners = {}
+    for i in range(1, 7):
+        corners = np.where(cube_map.cells == ord(str(i)))
+        if len(corners[0]) == 0:
+            continue
+        cube_corners[i] = (corners[0][0], corners[1][0]), (corners[0][-1], corners[1][-1])
+    return cube_corners
+
+def print_board(board):
+    print(board.render())
+
+def move(t1, t2):
+    return tuple([t1[i] + t2[i] for i in range(len(t1))])
+
+# Returns the next position (X,Y) tuple in the given direction (X,Y) vector tuple from the pos (X,Y) tuple position on the game board Grid.
+def get_next_pos(pos, direction, board):
+    # We can only walk on '.' characters.
+    # If we would be moving on to a ' ' character, we instead need to wrap around to the other side of the board to the first '.' character.
+    # If we would be moving on to a '#' character, we need to stop.
+    next_pos = move(pos, direction.tuple())
+
+    # If the next position is a ' ' or off the board, we need to wrap around to the first non-blank character on the other side of the board
+    if next_pos not in board or board[next_pos] == VOID:
+        # find the first non-blank character in the direction we're moving, starting at the other side of the board
+        if direction == Direction.RIGHT:
+            # moving right, start at the left side of the board on this row
+            next_pos = (pos[0], 0)
+        elif direction == Direction.DOWN:
+            # moving down, start at the top of the board on this column
+            next_pos = (0, pos[1])
+        elif direction == Direction.LEFT:
+            # moving left, start at the right side of the board on this row
+            next_pos = (pos[0], board.shape[1] - 1)
+        elif direction == Direction.UP:
+            # moving up, start at the bottom of the board on this column
+            next_pos = (board.shape[0] - 1, pos[1])
+
+        while board[next_pos] == VOID: # keep moving until we find a non-blank character
+            next_pos = move(next_pos, direction.tuple())
+
+    # If the next position is a '#', we need to stop
+    if board[next_pos] == WALL:
+        return pos, direction
+    return next_pos, direction
+
+# Move local row/column in current face to local row/column in next face
+# Rules:
+# 1) If the current direction is pointing up and the entry side is ^, the new row is 0 and the column is the max column - current column
+# 2) If the current direction is pointing down and the entry side is v, the new row is the max row and the column is the max column - current column
+# 3) If the current direction is pointing left and the entry side is <, the new column is 0 0 and the row is the max row - current row
+# 4) If the current direction is pointing right right and the entry side is >, the new column is the max column and the row is the max row - current row
+# 5) If the current direction is pointing left and the entry side is ^, the new column is the current row and the new row is 0
+# 6) If the current direction is pointing left and the entry side is v, the new column is the current row and the new row is the max row
+# 7) If the current direction is pointing right right and the entry side is ^, the new column is the max column - the current row and the new row is 0
+# 8) If the current direction is pointing right right and the entry side is v, the new column is the max column - the current row and the new row is the max row
+# 9) If the current direction is pointing up and the entry side is <, the new row is the current column and the new column is 0
+# 10) If the current direction is pointing up and the entry side is >, the new row is the current column and the new column is the max column
+# 11) If the current direction is pointing down and the entry side is <, the new row is the max row - the current column and the new column is 0
+# 12) If the current direction is pointing down and the entry side is >, the new row is the max row - the current column and the new column is the max column
+def get_next_side_pos_dir(curr_side_pos, curr_direction, next_side, next_side_entry, cube_corners):
+    max_row = cube_corners[next_side][1][0] - cube_corners[next_side][0][0]
+    max_col = cube_corners[next_side][1][1] - cube_corners[next_side][0][1]
+
+    if curr_direction == Direction.UP:
+        if next_side_entry == Direction.UP:
+            next_pos = (0, max_col - curr_side_pos[1])
+        elif next_side_entry == Direction.LEFT:
+            next_pos = (curr_side_pos[1], 0)
+        elif next_side_entry == Direction.RIGHT:
+            next_pos = (max_row - curr_side_pos[1], max_col)
+        elif next_side_entry == Direction.DOWN:
+            next_pos = (max_row, curr_side_pos[1])
+    elif curr_direction == Direction.DOWN:
+        if next_side_entry == Direction.DOWN:
+            next_pos = (max_row, max_col - curr_side_pos[1])
+        elif next_side_entry == Direction.LEFT:
+            next_pos = (max_row - curr_side_pos[1], 0)
+        elif next_side_entry == Direction.RIGHT:
+            next_pos = (curr_side_pos[1], max_col)
+        elif next_side_entry == Direction.UP:
+            next_pos = (0, curr_side_pos[1])
+    elif curr_direction == Direction.LEFT:
+        if next_side_entry == Direction.LEFT:
+            next_pos = (max_row - curr_side_pos[0], 0)
+        elif next_side_entry == Direction.UP:
+            next_pos = (0, curr_side_pos[0])
+        elif next_side_entry == Direction.DOWN:
+            next_pos = (max_row, max_col - curr_side_pos[0])
+        elif next_side_entry == Direction.RIGHT:
+            next_pos = (curr_side_pos[0], max_col)
+    elif curr_direction == Direction.RIGHT:
+        if next_side_entry == Direction.RIGHT:
+            next_pos = (max_row - curr_side_pos[0], max_col)
+        elif next_side_entry == Direction.UP:
+            next_pos = (0, max_row - curr_side_pos[0])
+        elif next_side_entry == Direction.DOWN:
+            next_pos = (max_row, curr_side_pos[0])
+        elif next_side_entry == Direction.LEFT:
+            next_pos = (curr_side_pos[0], 0)
+
+    next_dir = next_side_entry.turn('R').turn('R')
+
+    return next_pos, next_dir
+
+# Returns the next position (X,Y) tuple in the given direction (X,Y) vector tuple from the pos (X,Y) tuple position on the game board Grid.
+def get_next_pos_cube(pos, direction, board, cube_map, transitions, cube_corners):
+    # If we would be moving on to a ' ' character or off the edge of the board, we instead need to wrap around to the adjoining side of the cube map.
+    # We can only walk on '.' characters.
+    # If we would be moving on to a '#' character, we need to stop.
+    next_pos = move(pos, direction.tuple())
+    next_direction = direction
+
+    # If the next position is a ' ' or off the board, we need to wrap around to the adjoining side of the cube map.
+    if next_pos not in board or board[next_pos] == VOID:
+        curr_side = int(cube_map[pos]) - ord('0')
+        curr_local_pos = (pos[0] - cube_corners[curr_side][0][0], pos[1] - cube_corners[curr_side][0][1])
+        next_side, next_side_entry = transitions[curr_side, direction]
+
+        next_local_pos, next_direction = get_next_side_pos_dir(curr_local_pos, direction, next_side, next_side_entry, cube_corners)
+        next_pos = (next_local_pos[0] + cube_corners[next_side][0][0], next_local_pos[1] + cube_corners[next_side][0][1])
+
+    # If the next position is a '#', we need to stop
+    if board[next_pos] == WALL:
+        return pos, direction
+    return next_pos, next_direction
+
+# Follow the instructions from the leftmost open tile of the top row, using next_pos(pos, direction)
+# to take each step. Returns the final position and direction, and the board with the path drawn on it.
+def follow_path(board, instructions, next_pos):
+    start_col = np.where(board.cells[0] == OPEN)[0][0]
+
+    pos = (0, start_col)
+    direction = Direction.RIGHT
+
+    path = board.copy()
+    for command in instructions:
+        path[pos] = ord(direction.symbol())
+        if command in ['R', 'L']:
+            direction = direction.turn(command)
+        else:
+            for i in range(int(command)):
+                old_pos = pos
+                pos, direction = next_pos(pos, direction)
+                if pos == old_pos:
+                    break
+                path[pos] = ord(direction.symbol())
+    return pos, direction, path
+
+def password(pos, direction):
+    final_row, final_col = move(pos, (1,1)) # offset for 0s
+    return (1000 * int(final_row)) + (4 * int(final_col)) + direction.value
+
+def parse(input):
+    return parse_lines(input.text)
+
+# Follow the path on the flat board. What is the final password?
+def part1(notes):
+    board, instructions, cube_map, transitions = notes
+    pos, direction, _ = follow_path(board, instructions, lambda pos, direction: get_next_pos(pos, direction, board))
+    return password(pos, direction)
+
+# Fold the map in to a cube, then follow the path. What is the final password?
+def part2(notes):
+    board, instructions, cube_map, transitions = notes
+    cube_corners = find_cube_corners(cube_map)
+    pos, direction, _ = follow_path(board, instructions,
+                                    lambda pos, direction: get_next_pos_cube(pos, direction, board, cube_map, transitions, cube_corners))
+    return password(pos, direction)
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 %s <input>" % sys.argv[0])
+        sys.exit(1)
+
+    notes = parse(InputFile(sys.argv[1]))
+    print(part1(notes))
+    print(part2(notes))
@@ -0,0 +1,180 @@
+"""
+--- Day 23: Unstable Diffusion ---
+
+Solver logic from day23-seedspotting.ipynb, importable and headless. The notebook let the
+rounds run for 35 minutes with the elves in a list; here the elves are a boolean Grid and
+each round is a handful of whole-grid shifts, which is the same rules in well under a second.
+
+The scan shows Elves # and empty ground .; outside your scan, more empty ground extends a
+long way in every direction.
+
+Round sequence:
+1. All Elves consider their 8 adjacent positions.
+1.a. If they are solo, they end their round
+1.b. If they are not solo, they propose a move to the first valid direction, in the following order:
+     N if no Elf in N, NE, NW
+     S if no Elf in S, SE, SW
+     W if no Elf in W, NW, SW
+     E if no Elf in E, NE, SE
+
+2. All Elves move to their proposed destination tile if they were the only Elf to propose moving to that position.
+
+3. The order of the decision is rotated by one, so that the first direction the Elves considered is moved to the end of the list of directions.
+
+1. After 10 rounds, how many empty ground tiles does the smallest rectangle containing
+   every Elf have?
+2. What is the number of the first round where no Elf moves?
+"""
+
+import enum
+import sys
+
+import numpy as np
+
+from aoc.grid import Grid, shift
+from aoc.inputs import InputFile
+
+def parse_lines_to_grid(lines):
+    return Grid.from_bytes(line.strip() for line in lines if line.strip())
+
+def parse_file_to_grid(filename):
+    return parse_lines_to_grid(InputFile(filename).text)
+
+def print_grid(grid):
+    print(grid.render())
+
+# A boolean Grid of where the elves are, in the scan's (row, col) coordinates
+def get_elves_from_grid(grid):
+    return Grid(grid.cells == ord('#'), grid.origin)
+
+def get_elf_positions(elves):
+    return elves.find(True)
+
+# The elves drawn on the smallest rectangle that holds them all
+def grid_for_elves(elves):
+    rows = np.flatnonzero(elves.cells.any(axis=1))
+    cols = np.flatnonzero(elves.cells.any(axis=0))
+    cells = elves.cells[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+    return Grid(np.where(cells, ord('#'), ord('.')).astype(np.uint8), elves.position((rows[0], cols[0])))
+
+def get_bounding_area(elves):
+    rows = np.flatnonzero(elves.cells.any(axis=1))
+    cols = np.flatnonzero(elves.cells.any(axis=0))
+    return (cols[-1] - cols[0] + 1) * (rows[-1] - rows[0] + 1)
+
+class Direction(enum.Enum):
+    NW = (-1, -1)
+    N = (-1, 0)
+    NE = (-1, 1)
+    W = (0, -1)
+    E = (0, 1)
+    SW = (1, -1)
+    S = (1, 0)
+    SE = (1, 1)
+
+    def offset_from(self, position):
+        row, col = position
+        return (row + self.value[0], col + self.value[1])
+
+class DecisionOrder:
+    NORTHWARD = [Direction.NW, Direction.N, Direction.NE]
+    SOUTHWARD = [Direction.SW, Direction.S, Direction.SE]
+    WESTWARD = [Direction.NW, Direction.W, Direction.SW]
+    EASTWARD = [Direction.NE, Direction.E, Direction.SE]
+
+    ALL_DIRECTIONS = NORTHWARD + SOUTHWARD + WESTWARD + EASTWARD
+
+    INITIAL_ORDER = NORTHWARD, SOUTHWARD, WESTWARD, EASTWARD
+
+    def __init__(self):
+        self.directions = DecisionOrder.INITIAL_ORDER
+
+    def rotate(self):
+        self.directions = self.directions[1:] + self.directions[:1]
+
+    def __str__(self):
+        return str(self.directions)
+
+# Make sure there's an empty row and column all around the elves, so none of them can step off the grid
+def with_margin(elves):
+    cells = elves.cells
+    if cells[0].any() or cells[-1].any() or cells[:, 0].any() or cells[:, -1].any():
+        return elves.grow(1, 1, 1, 1, fill=False)
+    return elves
+
+# For every elf at once, the direction it proposes to move in: a dict of Direction to a
+# boolean array of the elves proposing it. Elves with no neighbors, or no free direction, stay put.
+def get_proposals(elves, decision_order):
+    # occupied[d][r, c] is whether there's an elf in direction d from (r, c)
+    occupied = {d: elves.shift(-d.value[0], -d.value[1], fill=False) for d in Direction}
+    undecided = elves.cells & np.logical_or.reduce([occupied[d] for d in Direction])
+    proposals = {}
+    for directions in decision_order.directions:
+        free = ~(occupied[directions[0]] | occupied[directions[1]] | occupied[directions[2]])
+        proposals[directions[1]] = undecided & free
+        undecided = undecided & ~free
+    return proposals
+
+# The proposals for a list of (row, col) elf positions, as a dict keyed by current elf
+# position with a value of proposed position (the elf's own position if it stays put)
+def get_proposed_positions(elf_positions, decision_order):
+    rows = [row for row, _ in elf_positions]
+    cols = [col for _, col in elf_positions]
+    elves = Grid.full((max(rows) - min(rows) + 3, max(cols) - min(cols) + 3), False, dtype=bool,
+                      origin=(min(rows) - 1, min(cols) - 1))
+    for position in elf_positions:
+        elves[position] = True
+    proposed_positions = {position: position for position in elf_positions}
+    for d, proposing in get_proposals(elves, decision_order).items():
+        for index in np.argwhere(proposing):
+            position = elves.position(index)
+            proposed_positions[position] = d.offset_from(position)
+    return proposed_positions
+
+# Move every elf whose proposed position no other elf proposed. Returns the moved elves and the number of moves made.
+def move_to_proposals(elves, proposals):
+    arrivals = {d: shift(proposing, d.value[0], d.value[1], fill=False) for d, proposing in proposals.items()}
+    # only elves coming from opposite sides can propose the same position
+    proposal_counts = sum(arrived.astype(np.uint8) for arrived in arrivals.values())
+    cells = elves.cells.copy()
+    moves = 0
+    for d, arrived in arrivals.items():
+        arrived &= proposal_counts == 1
+        cells &= ~shift(arrived, -d.value[0], -d.value[1], fill=False)
+        cells |= arrived
+        moves += int(arrived.sum())
+    return Grid(cells, elves.origin), moves
+
+# Run rounds until max_rounds have passed or no elf moves. Returns the final elves and the number of rounds.
+def spread_out(elves, max_rounds=None):
+    decisions = DecisionOrder()
+    moves = int(elves.cells.sum())
+    round = 0
+    while moves != 0 and (max_rounds is None or round < max_rounds):
+        elves = with_margin(elves)
+        elves, moves = move_to_proposals(elves, get_proposals(elves, decisions))
+        decisions.rotate()
+        round += 1
+    return elves, round
+
+def parse(input):
+    return get_elves_from_grid(parse_lines_to_grid(input.text))
+
+# How many empty ground tiles are in the elves' bounding rectangle after 10 rounds?
+def part1(elves, rounds=10):
+    elves, _ = spread_out(elves, rounds)
+    return int(get_bounding_area(elves) - elves.cells.sum())
+
+# What is the number of the first round where no Elf moves?
+def part2(elves):
+    _, round = spread_out(elves)
+    return round
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 %s <input>" % sys.argv[0])
+        sys.exit(1)
+
+    elves = parse(InputFile(sys.argv[1]))
+    print(part1(elves))
+    print(part2(elves))
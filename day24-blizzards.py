@@ -0,0 +1,256 @@
+"""
+--- Day 24: Blizzard Basin ---
+
+Solver logic from day24-blizzards.ipynb, importable and headless. The notebook built a
+networkx graph of every open position at every minute of the blizzard loop and asked it
+for shortest paths; the same search is a breadth first walk over (row, col, minute of the
+loop), so networkx is only needed for the optional drawing helpers now.
+
+#.######
+#>>.<^<#
+#.<..<<#
+#>v.><>#
+#<^v^^>#
+######.#
+
+The walls of the valley are drawn as #; everything else is ground. Blizzards are drawn
+with an arrow for their direction of motion, move one position each minute, and wrap to
+the opposite side of the valley when they reach a wall.
+
+Your expedition begins in the only non-wall position in the top row and needs to reach the
+only non-wall position in the bottom row. On each minute, you can move up, down, left, or
+right, or you can wait in place. You and the blizzards act simultaneously, and you cannot
+share a position with a blizzard.
+
+1. What is the fewest number of minutes required to reach the goal?
+2. Someone forgot their snacks: go to the goal, back to the start, then to the goal again.
+   What is the fewest number of minutes for all three trips?
+"""
+
+import sys
+from collections import deque
+
+import numpy as np
+
+from aoc.grid import Grid
+from aoc.inputs import InputFile
+
+BLIZZARDS = {
+    '^': 1 << 0,
+    'v': 1 << 1,
+    '<': 1 << 2,
+    '>': 1 << 3
+}
+PERSON = {
+    'E': 0, #1 << 5,
+}
+BLIZZARDS['ANY'] = BLIZZARDS['^'] | BLIZZARDS['v'] | BLIZZARDS['<'] | BLIZZARDS['>']
+TERRAIN = {
+    '#': 1 << 8,
+    '.': 0,
+}
+
+# for less busy rendering
+TERRAIN_AND_BLIZZARDS = {v: k for k, v in {**TERRAIN, **BLIZZARDS, **PERSON}.items()}
+TERRAIN_AND_BLIZZARDS[0] = ' '
+TERRAIN_AND_BLIZZARDS[1 << 8] = ' '
+
+COLOR_MAP = {
+    0: 'ivory',
+    1 << 8: 'black',
+    1 << 5: 'red',
+    1 << 0: 'Aqua', # up
+    1 << 1: 'Aquamarine', # down
+    1 << 2: 'DarkTurquoise', # left
+    1 << 3: 'PowderBlue', # right
+    1 << 0 | 1 << 1: 'DodgerBlue',
+    1 << 0 | 1 << 2: 'DodgerBlue',
+    1 << 0 | 1 << 3: 'DodgerBlue',
+    1 << 1 | 1 << 2: 'DodgerBlue',
+    1 << 1 | 1 << 3: 'DodgerBlue',
+    1 << 2 | 1 << 3: 'DodgerBlue',
+    1 << 0 | 1 << 1 | 1 << 2: 'RoyalBlue',
+    1 << 0 | 1 << 1 | 1 << 3: 'RoyalBlue',
+    1 << 0 | 1 << 2 | 1 << 3: 'RoyalBlue',
+    1 << 1 | 1 << 2 | 1 << 3: 'RoyalBlue',
+    1 << 0 | 1 << 1 | 1 << 2 | 1 << 3: 'DarkBlue',
+}
+
+def parse_lines_to_grid(lines):
+    grid = Grid.from_bytes(line.strip() for line in lines if line.strip())
+    # translate each character to its bit value, through a lookup table over the bytes
+    cell_values = np.zeros(256, dtype=np.int16)
+    for c, value in {**BLIZZARDS, **TERRAIN, **PERSON}.items():
+        if len(c) == 1:
+            cell_values[ord(c)] = value
+    return Grid(cell_values[grid.cells])
+
+def parse_input_to_grid(filename):
+    return parse_lines_to_grid(InputFile(filename).text)
+
+# Each blizzard moves one step in its direction, wrapping around the inside of the walls
+def get_next_blizzards(grid):
+    inside = Grid(grid.cells[1:-1, 1:-1] & BLIZZARDS['ANY'])
+    next_blizzards = np.zeros_like(grid.cells)
+    next_blizzards[1:-1, 1:-1] = (
+        (inside.roll(0, 1) & BLIZZARDS['>']) |
+        (inside.roll(1, 0) & BLIZZARDS['v']) |
+        (inside.roll(0, -1) & BLIZZARDS['<']) |
+        (inside.roll(-1, 0) & BLIZZARDS['^'])
+    )
+    return next_blizzards
+
+def advance(grid):
+    return Grid((grid.cells & ~BLIZZARDS['ANY']) | get_next_blizzards(grid), grid.origin)
+
+# The blizzards wrap around the valley, so after some number of minutes they're back where they started.
+# Returns the frames of that loop, starting with grid.
+def find_loop(grid, iter_max=None):
+    loop = [grid]
+    test = advance(grid)
+    while not np.array_equal(test.cells, loop[0].cells):
+        loop.append(test)
+        if iter_max is not None and len(loop) > iter_max:
+            raise ValueError("No blizzard loop found in {} minutes".format(iter_max))
+        test = advance(test)
+    return loop
+
+def entry_and_exit(grid):
+    exit_row = grid.shape[0] - 1
+    exit_col = int(np.argmax(grid.cells[exit_row] == 0))
+    entry_row = 0
+    entry_col = int(np.argmax(grid.cells[entry_row] == 0))
+    return (entry_row, entry_col), (exit_row, exit_col)
+
+# The fewest minutes from start_point, leaving at start_time, to end_point.
+# open_maps[z] is a boolean array of the open positions at minute z of the blizzard loop.
+def shortest_trip(open_maps, start_point, end_point, start_time=0):
+    loop_len = len(open_maps)
+    rows, cols = open_maps[0].shape
+    queue = deque([(start_point[0], start_point[1], start_time)])
+    visited = {(start_point[0], start_point[1], start_time % loop_len)}
+    while queue:
+        x, y, t = queue.popleft()
+        if (x, y) == end_point:
+            return t - start_time
+        next_open = open_maps[(t + 1) % loop_len]
+        # wait, or move to one of the 4 cardinal neighbors
+        for nx, ny in ((x, y), (x-1, y), (x+1, y), (x, y-1), (x, y+1)):
+            if 0 <= nx < rows and 0 <= ny < cols and next_open[nx, ny]:
+                state = (nx, ny, (t + 1) % loop_len)
+                if state not in visited:
+                    visited.add(state)
+                    queue.append((nx, ny, t + 1))
+    return None
+
+# export each cell in the grid as a value in a dict keyed by its (row, col) position
+def grid_to_dict(grid):
+    d = {}
+    for row in grid.rows:
+        for col in grid.cols:
+            d[(row, col)] = int(grid[row, col])
+    return d
+
+class BoardDrawing:
+    """
+    Draws the valley as a grid graph, and can animate the blizzards. Needs the optional
+    networkx and matplotlib packages.
+    """
+    def __init__(self, grid) -> None:
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
+        self.nx = nx
+        self.grid = grid.copy()
+        self.G = nx.grid_2d_graph(self.grid.shape[0], self.grid.shape[1])
+        self.pos = {(x,y):(y,-x) for x,y in self.G.nodes()}
+        self.options = {
+            'pos': self.pos,
+            'edgecolors': 'lightgray',
+            'node_size': 600,
+            'with_labels': True,
+            'labels': {},
+            'node_color': []
+        }
+
+        plt.close('all')
+        self.fig, self.ax = plt.subplots(figsize=(6,4))
+
+    def update_node_options(self):
+        pos_dict = {pos: TERRAIN_AND_BLIZZARDS.get(v, v) for pos, v in grid_to_dict(self.grid).items()}
+        self.options['labels'] = pos_dict
+        self.options['node_color'] = [COLOR_MAP.get(v, 'lightgray') for v in self.grid.cells.flatten().tolist()]
+
+    def draw(self):
+        self.update_node_options()
+        self.nx.draw(self.G, ax=self.ax, **self.options)
+        self.ax.set_xticks([])
+        self.ax.set_yticks([])
+
+    def update(self, num):
+        self.ax.clear()
+        self.grid = advance(self.grid)
+        self.draw()
+
+    def animate(self, iter = 5):
+        import matplotlib.animation as animation
+        import matplotlib.pyplot as plt
+
+        self.ani = animation.FuncAnimation(self.fig, self.update, frames=iter, interval=500, repeat=False)
+        plt.show()
+
+def get_loop_graph(loop):
+    """
+    The notebook's graph of the loop: x,y,z nodes with z as the minute of the loop, with an edge
+    from every open node to the open nodes it can reach at z+1. Needs the optional networkx package.
+    """
+    import networkx as nx
+
+    G = nx.DiGraph()
+
+    # Add all the x,y,z nodes from the loop
+    for z, grid in enumerate(loop):
+        for x in range(grid.shape[0]):
+            for y in range(grid.shape[1]):
+                G.add_node((x,y,z), color=COLOR_MAP.get(int(grid[x,y]), 'fuschia'), value=int(grid[x,y]))
+
+    # Add all the edges (second, so that we can set up all the node attributes first
+    for z, grid in enumerate(loop):
+        next_z = (z + 1) % len(loop)
+        for x in range(grid.shape[0]):
+            for y in range(grid.shape[1]):
+                # If I'm a space, look around me at next_z for a space within the bounds of the grid
+                if grid[x,y] == 0:
+                    for nx_, ny_ in [(x, y)] + list(grid.neighbors((x, y))):
+                        if loop[next_z][nx_, ny_] == 0:
+                            G.add_edge((x,y,z), (nx_,ny_,next_z), color='lightgray')
+
+    return G
+
+def parse(input):
+    grid = parse_lines_to_grid(input.text)
+    loop = find_loop(grid)
+    open_maps = [frame.cells == 0 for frame in loop]
+    return open_maps, entry_and_exit(grid)
+
+# What is the fewest number of minutes required to avoid the blizzards and reach the goal?
+def part1(valley):
+    open_maps, (entry_point, exit_point) = valley
+    return shortest_trip(open_maps, entry_point, exit_point)
+
+# What is the fewest number of minutes required to reach the goal, go back to the start, then reach the goal again?
+def part2(valley):
+    open_maps, (entry_point, exit_point) = valley
+    there = shortest_trip(open_maps, entry_point, exit_point)
+    back = shortest_trip(open_maps, exit_point, entry_point, there)
+    back_again = shortest_trip(open_maps, entry_point, exit_point, there + back)
+    return there + back + back_again
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 %s <input>" % sys.argv[0])
+        sys.exit(1)
+
+    valley = parse(InputFile(sys.argv[1]))
+    print(part1(valley))
+    print(part2(valley))
@@ -0,0 +1,94 @@
+"""
+--- Day 25: Full of Hot Air ---
+
+Solver logic from day25-hotair.ipynb, importable and headless.
+
+Fuel requirements input file
+Provides a list of fuel requirements for each balloon burner
+Measured in Special Numeral-Analogue Fuel Units (SNAFUs)
+
+Format example:
+1=-0-2
+12111
+2=0=
+
+1. What SNAFU number do you supply to Bob's console? (the sum of the fuel requirements)
+2. There's no second puzzle on the last day.
+"""
+
+import sys
+
+from aoc.inputs import InputFile
+
+"""
+Converts a SNAFU string to a decimal integer
+
+Instead of 1s, 10s, 100s, 1000s, etc., SNAFU uses 1s, 5s, 25s, 125s, etc.
+
+SNAFU is a numeral system that uses the digits 2, 1, 0, "-", "=". "-" is worth -1 and called minus, and "=" is worth -2 and called double-minus.
+
+Example decimal to SNAFU translations:
+    Decimal     SNAFU
+    1           1
+    2           2
+    3           1=
+    4           1-
+    5           10
+    2022        1=11-2
+    12345       1-0---0
+    314159265   1121-1110-1=0
+"""
+def snafu_to_decimal(snafu: str) -> int:
+    # Convert SNAFU to decimal
+    decimal = 0
+    # Iterate over the digits in reverse order
+    for i, digit in enumerate(snafu[::-1]):
+        if digit == '1':
+            decimal += 1 * 5**i
+        elif digit == '2':
+            decimal += 2 * 5**i
+        elif digit == '0':
+            decimal += 0 * 5**i
+        elif digit == '-':
+            decimal += -1 * 5**i
+        elif digit == '=':
+            decimal += -2 * 5**i
+    return decimal
+
+def decimal_to_snafu(decimal: int) -> str:
+    # Convert decimal to SNAFU
+    snafu = ''
+    while decimal > 0:
+        remainder = decimal % 5
+        if remainder == 1:
+            snafu += '1'
+        elif remainder == 2:
+            snafu += '2'
+        elif remainder == 0:
+            snafu += '0'
+        elif remainder == 4:
+            snafu += '-'
+            decimal += 1
+        elif remainder == 3:
+            snafu += '='
+            decimal += 2
+        decimal //= 5
+    return snafu[::-1]
+
+# Read input file
+def load_balloon_fuel_requirements(filename) -> list:
+    return parse(InputFile(filename))
+
+def parse(input):
+    return [line.strip() for line in input.text if line.strip()]
+
+# What SNAFU number do you supply to Bob's console?
+def part1(snafu_list):
+    return decimal_to_snafu(sum(snafu_to_decimal(snafu) for snafu in snafu_list))
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 %s <input>" % sys.argv[0])
+        sys.exit(1)
+
+    print(part1(parse(InputFile(sys.argv[1]))))
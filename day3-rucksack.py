@@ -32,8 +32,10 @@ In the above example, the priority of the item type that appears in both compart
 
 import sys
 
+from aoc.inputs import InputFile
+
 # Find the item type that appears in both compartments of each rucksack. What is the sum of the priorities of those item types?
-def part1(input):
+def shared_item_priorities(input):
     total = 0
     for line in input:
         first = set(line[:len(line)//2])
@@ -70,24 +72,138 @@ Priorities for these items must still be found to organize the sticker attachmen
 """
 
 # Find the item type that corresponds to the badges of each three-Elf group. What is the sum of the priorities of those item types?
-def part2(input):
+def badge_priorities(input):
     total = 0
-    for i in range(0, len(input), 3):
-        first = set(input[i])
-        second = set(input[i+1])
-        third = set(input[i+2])
+    lines = iter(input)
+    # take the lines three at a time
+    for first, second, third in zip(lines, lines, lines):
+        first = set(first)
+        second = set(second)
+        third = set(third)
         common = first.intersection(second, third)
         for c in common:
             total += ord(c) - 96 if c.islower() else ord(c) - 38
     return total
 
+"""
+Bitmask version: a rucksack (or a compartment) is a 52-bit int with bit p-1 set for each item
+of priority p, built through a 256 entry table of each byte's bit. The items two compartments
+or a group of rucksacks share are then just a & b & c, and since only one item is shared its
+priority is the mask's bit_length(). No sets are built.
+"""
+
+# ITEM_BITS[byte] is the bit for that item's priority, 0 for anything that isn't an item
+ITEM_BITS = [0] * 256
+for priority, item in enumerate('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ', 1):
+    ITEM_BITS[ord(item)] = 1 << (priority - 1)
+
+def item_mask(items):
+    mask = 0
+    for byte in items:
+        mask |= ITEM_BITS[byte]
+    return mask
+
+# Sum of the priorities of the item in both compartments of each rucksack, from bytes lines
+def shared_item_masks(lines):
+    total = 0
+    for line in lines:
+        half = len(line) // 2
+        total += (item_mask(line[:half]) & item_mask(line[half:])).bit_length()
+    return total
+
+# Sum of the priorities of the item common to each group of n rucksacks, one line at a time,
+# so only the current group's mask is ever held
+def badge_masks(lines, n=3):
+    total = 0
+    common = -1
+    count = 0
+    for line in lines:
+        if not line:
+            continue
+        common &= item_mask(line)
+        count += 1
+        if count == n:
+            total += common.bit_length()
+            common = -1
+            count = 0
+    return total
+
+# The whole file at once with numpy: the bit of every byte through the same table, OR-ed
+# together over each compartment or rucksack with np.bitwise_or.reduceat. Returns the masks
+# of each line's first and second compartment, and of each whole line.
+def numpy_masks(data):
+    import numpy as np
+
+    bits = np.array(ITEM_BITS, dtype=np.uint64)
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if ord('\r') in raw:
+        raw = raw[raw != ord('\r')]
+    ends = np.flatnonzero(raw == ord('\n'))
+    if len(raw) and raw[-1] != ord('\n'):
+        ends = np.append(ends, len(raw))
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = ends[:-1] + 1
+    filled = ends > starts
+    starts, ends = starts[filled], ends[filled]
+    if len(starts) == 0:
+        empty = np.zeros(0, dtype=np.uint64)
+        return empty, empty, empty
+    values = bits[raw]
+    middles = starts + (ends - starts) // 2
+    # each line splits in to [start, middle) and [middle, end), and the newline after it only adds a 0
+    halves = np.bitwise_or.reduceat(values, np.stack((starts, middles), axis=1).ravel())
+    first, second = halves[0::2], halves[1::2]
+    return first, second, first | second
+
+# Priorities of single-bit masks, or 0 for an empty mask: the exponent numpy.frexp finds is the bit length
+def numpy_priorities(masks):
+    import numpy as np
+
+    return np.frexp(masks.astype(np.float64))[1]
+
+def numpy_shared_items(data):
+    first, second, _ = numpy_masks(data)
+    return int(numpy_priorities(first & second).sum())
+
+def numpy_badges(data, n=3):
+    import numpy as np
+
+    _, _, rucksacks = numpy_masks(data)
+    groups = rucksacks[:len(rucksacks) // n * n].reshape(-1, n)
+    return int(numpy_priorities(np.bitwise_and.reduce(groups, axis=1)).sum())
+
 # content = [
 #     "vJrwpWtwJgWrhcsFMMfFFhFp", "jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL", "PmmdzqPrVvPwwTWBwg",
 #     "wMqvLMZHhHMvwLHjbvcjnnSBnvTQFn", "ttgJtRGJQctTZtZT", "CrZsJsPPZsGzwwsLwLmpwMDw",
 #     ]
 
-with open("day3-input.txt") as f:
-    content = f.readlines()
+def parse(input):
+    return input
+
+def part1(input):
+    return numpy_shared_items(input.buffer)
 
-content = [x.strip() for x in content]
-print(part2(content))
\ No newline at end of file
+def part2(input):
+    return numpy_badges(input.buffer)
+
+# Alternate engines for each part, timed against each other by `python -m aoc bench engines 3`
+ENGINES = {
+    'sets': {
+        1: lambda input: shared_item_priorities(input.text),
+        2: lambda input: badge_priorities(input.text),
+    },
+    'masks': {
+        1: lambda input: shared_item_masks(input),
+        2: lambda input: badge_masks(input),
+    },
+    'numpy': {
+        1: part1,
+        2: part2,
+    },
+}
+
+if __name__ == '__main__':
+    content = parse(InputFile(sys.argv[1] if len(sys.argv) > 1 else "day3-input.txt"))
+    print(part1(content))
+    print(part2(content))
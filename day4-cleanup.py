@@ -42,8 +42,10 @@ Some of the pairs have noticed that one of their assignments fully contains the
 
 import sys
 
+from aoc.inputs import InputFile
+
 # In how many assignment pairs does one range fully contain the other?
-def part1(lines):
+def contained_pairs(lines):
     # Parse the input
     pairs = []
     for line in lines:
@@ -60,7 +62,7 @@ def part1(lines):
         elif pair[1][0] <= pair[0][0] and pair[1][1] >= pair[0][1]:
             fully_contained += 1
 
-    print(fully_contained)
+    return fully_contained
 
 """
 --- Part Two ---
@@ -77,7 +79,7 @@ So, in this example, the number of overlapping assignment pairs is 4.
 """    
 
 # In how many assignment pairs do the ranges overlap?
-def part2(lines):
+def overlapping_pairs(lines):
     # Parse the input
     pairs = []
     for line in lines:
@@ -94,11 +96,151 @@ def part2(lines):
         if overlap[0] <= overlap[1]:
             overlapping += 1
 
-    print(overlapping)
-    
+    return overlapping
+
+"""
+Array version: the whole list is parsed once in to an (N, 4) int32 array of
+[first start, first end, second start, second end] rows, and both counts are boolean
+reductions over its columns. For asking which assignments cover a section, or which pairs
+touch a range of sections, IntervalIndex keeps the assignments in a centered interval tree.
+"""
+
+# The (N, 4) int32 array of the pairs in a bytes-like input. Every number ends at a
+# separator ('-', ',' or a newline), so the numbers are read a digit column at a time
+# going back from the separators, like day 1's numpy parser.
+def parse_pairs(data):
+    import numpy as np
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    ends = np.flatnonzero(raw < ord('0'))
+    if len(raw) and raw[-1] >= ord('0'):
+        ends = np.append(ends, len(raw))
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts
+    # blank lines and '\r\n' line endings leave empty fields
+    filled = lengths > 0
+    ends, lengths = ends[filled], lengths[filled]
+    if len(ends) % 4:
+        raise ValueError("Expected 4 numbers per line, found %d numbers" % len(ends))
+    values = np.zeros(len(ends), dtype=np.int32)
+    place = 1
+    for column in range(int(lengths.max()) if len(lengths) else 0):
+        digits = raw[ends - (column + 1)] - np.uint8(ord('0'))
+        digits[lengths <= column] = 0
+        values += digits * np.int32(place)
+        place *= 10
+    return values.reshape(-1, 4)
+
+# How many pairs have one assignment fully containing the other, and how many overlap at all
+def pair_counts(pairs):
+    first_start, first_end, second_start, second_end = pairs.T
+    contained = ((first_start <= second_start) & (first_end >= second_end)) | \
+                ((second_start <= first_start) & (second_end >= first_end))
+    overlapping = (first_start <= second_end) & (second_start <= first_end)
+    return int(contained.sum()), int(overlapping.sum())
+
+class IntervalIndex:
+    """
+    The assignments of an (N, 4) pairs array in a centered interval tree. Assignment i is
+    elf i % 2 of pair i // 2, so pairs.reshape(-1, 2)[i] is its [start, end].
+
+    Each node takes the median start of its assignments as its center and keeps the ones
+    that cover the center twice, sorted by start and by end; the rest go to the left or
+    right child. A section below the center is covered by a prefix of the first order and
+    one above it by a suffix of the second, so a query does one bisect per level and
+    O(log n + k) work in all.
+    """
+    def __init__(self, pairs):
+        import numpy as np
+
+        assignments = np.asarray(pairs).reshape(-1, 2)
+        self.starts = assignments[:, 0]
+        self.ends = assignments[:, 1]
+        # assignments in order of start, for the ranges' "starts inside" half of overlapping()
+        self.by_start = np.argsort(self.starts, kind='stable')
+        self.sorted_starts = self.starts[self.by_start]
+
+        # nodes[i] = (center, left child, right child, ids by start, their starts, ids by end, their ends)
+        self.nodes = []
+        self.root = self._build(np.arange(len(assignments)))
+
+    def _build(self, ids):
+        import numpy as np
+
+        if len(ids) == 0:
+            return -1
+        starts, ends = self.starts[ids], self.ends[ids]
+        center = int(np.median(starts))
+        here = (starts <= center) & (ends >= center)
+        node = len(self.nodes)
+        self.nodes.append(None)
+        by_start = ids[here][np.argsort(starts[here], kind='stable')]
+        by_end = ids[here][np.argsort(ends[here], kind='stable')]
+        left = self._build(ids[ends < center])
+        right = self._build(ids[starts > center])
+        self.nodes[node] = (center, left, right,
+                            by_start, self.starts[by_start], by_end, self.ends[by_end])
+        return node
+
+    def __len__(self):
+        return len(self.starts)
+
+    # The ids of every assignment that covers section, grouped by tree node rather than sorted
+    def covering(self, section):
+        import numpy as np
+
+        found = []
+        node = self.root
+        while node >= 0:
+            center, left, right, by_start, starts, by_end, ends = self.nodes[node]
+            if section < center:
+                found.append(by_start[:np.searchsorted(starts, section, side='right')])
+                node = left
+            elif section > center:
+                found.append(by_end[np.searchsorted(ends, section, side='left'):])
+                node = right
+            else:
+                found.append(by_start)
+                break
+        return np.concatenate(found) if found else np.zeros(0, dtype=np.intp)
+
+    # The ids of every pair with an assignment that shares a section with start-stop, in ascending
+    # order (sorting them to drop pairs found through both elves adds O(k log k))
+    def overlapping(self, start, stop):
+        import numpy as np
+
+        # an assignment overlaps start-stop if it covers start, or it starts after start but not after stop
+        later = self.by_start[np.searchsorted(self.sorted_starts, start, side='right'):
+                              np.searchsorted(self.sorted_starts, stop, side='right')]
+        return np.unique(np.concatenate((self.covering(start), later)) // 2)
+
+def parse(input):
+    return parse_pairs(input.buffer)
+
+# In how many assignment pairs does one range fully contain the other?
+def part1(pairs):
+    return pair_counts(pairs)[0]
+
+# In how many assignment pairs do the ranges overlap?
+def part2(pairs):
+    return pair_counts(pairs)[1]
+
+# Alternate engines for each part, timed against each other by `python -m aoc bench engines 4`
+ENGINES = {
+    'lists': {
+        1: lambda input: contained_pairs(input.text),
+        2: lambda input: overlapping_pairs(input.text),
+    },
+    'numpy': {
+        1: lambda input: part1(parse(input)),
+        2: lambda input: part2(parse(input)),
+    },
+}
 
 if __name__ == '__main__':
     # Read in the input
-    with open(sys.argv[1]) as f:
-        lines = f.readlines()
-    part2(lines)
+    pairs = parse(InputFile(sys.argv[1]))
+    print(part1(pairs))
+    print(part2(pairs))
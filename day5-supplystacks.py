@@ -67,15 +67,19 @@ Step 4:
 The Elves just need to know which crate will end up on top of each stack; in this example, the top crates are C in stack 1, M in stack 2, and Z in stack 3, so you should combine these together and give the Elves the message CMZ.
 """
 
+import re
 import sys
 
+from aoc.inputs import InputFile
+
 # What are the top crates in each stack after the rearrangement procedure?
 # The input is in two sets, separated by a blank line.
 # The first set is in the format [x1] [x2] ... [x3] where xi is the label of the crate in stack i. The last line of the first set is a sequence of the label i and can be ignored.
 # The second set is in the format move x1 from x2 to x3 where x1 is the label of the crate to move, x2 is the stack to move it from, and x3 is the stack to move it to.
-def part1(lines):
+def top_crates_9000(lines):
     stacks = {}
-    col_count = len(lines[0]) // 4
+    # each stack takes 4 characters, the last one without the trailing space
+    col_count = (len(next(iter(lines)).rstrip('\n')) + 1) // 4
     for i in range(col_count):
         stacks[i+1] = []
     for line in lines:
@@ -159,9 +163,10 @@ In this example, the CrateMover 9001 has put the crates in a totally different o
 """
 
 # Before the rearrangement process finishes, update your simulation so that the Elves know where they should stand to be ready to unload the final supplies. After the rearrangement procedure completes, what crate ends up on top of each stack?
-def part2(lines):
+def top_crates_9001(lines):
     stacks = {}
-    col_count = len(lines[0]) // 4
+    # each stack takes 4 characters, the last one without the trailing space
+    col_count = (len(next(iter(lines)).rstrip('\n')) + 1) // 4
     for i in range(col_count):
         stacks[i+1] = []
     for line in lines:
@@ -183,8 +188,229 @@ def part2(lines):
     # return the first entry from each stack
     return "".join([stacks[i][0][1] for i in range(1, col_count+1)])
 
+"""
+Stack engine: each stack is a bytearray of crate letters from the bottom up, so the top
+crates are at the end. The CrateMover 9000 moves its crates one at a time, which leaves them
+reversed on the other stack: one reversed slice extended on to the destination. The
+CrateMover 9001 moves them in one go, in order: one plain slice. Either way a move costs
+O(crates moved) instead of shifting every crate in both stacks.
+"""
+
+MOVE = re.compile(rb'move (\d+) from (\d+) to (\d+)')
+BLANK_LINE = re.compile(rb'\n\r?\n')
+
+# The stacks in the drawing at the start of a bytes-like input, each a bytearray from the bottom up
+def parse_stacks(data):
+    # only the drawing, up to the first blank line, is copied out of the input
+    blank = BLANK_LINE.search(data)
+    drawing = bytes(data[:blank.start()] if blank else data).replace(b'\r\n', b'\n').split(b'\n')
+    drawing = [line for line in drawing if line.strip()]
+    # the last line of the drawing is the stack labels; each stack takes 4 characters
+    stack_count = (len(drawing[-1].rstrip()) + 2) // 4
+    stacks = [bytearray() for _ in range(stack_count)]
+    for line in reversed(drawing[:-1]):
+        for i, crate in enumerate(line[1::4]):
+            if crate != ord(' '):
+                stacks[i].append(crate)
+    return stacks
+
+# Every "move N from A to B" in a bytes-like input, as (N, A - 1, B - 1)
+def parse_moves(data):
+    return [(int(count), int(source) - 1, int(dest) - 1) for count, source, dest in MOVE.findall(data)]
+
+# Move the crates one at a time: the top count crates land on dest in reverse order
+def crate_mover_9000(stacks, moves):
+    for count, source, dest in moves:
+        crates = stacks[source]
+        bottom = len(crates) - count
+        stacks[dest] += crates[:bottom - 1 if bottom else None:-1]
+        del crates[bottom:]
+    return stacks
+
+# Move the crates all at once: the top count crates land on dest in the same order
+def crate_mover_9001(stacks, moves):
+    for count, source, dest in moves:
+        crates = stacks[source]
+        bottom = len(crates) - count
+        stacks[dest] += crates[bottom:]
+        del crates[bottom:]
+    return stacks
+
+def top_crates(stacks):
+    return "".join(chr(crates[-1]) for crates in stacks if crates)
+
+"""
+Segment stacks: for moves of thousands of crates even a slice copies every crate. A
+SegmentStack is a list of segments instead, each a (data, start, stop, flipped) view of
+an immutable bytes object, from the bottom up. A move splits at most one segment and hands
+the others over as they are, so it costs O(segments moved) whatever the crate count. The
+CrateMover 9000's reversal is only a flag flipped on each moved segment, and reading a
+reversed segment goes from stop down to start. So that moves of a few crates at a time
+don't leave a stack of tiny segments, a segment of fewer than MERGE_SIZE crates put on top
+of another one is joined with it, as long as the two come to at most MERGE_SIZE crates;
+a put copies at most that many crates, whatever the height of the stack.
+"""
+
+MERGE_SIZE = 64
+
+# The crates of a segment as bytes, from the bottom up
+def segment_crates(segment):
+    data, start, stop, flipped = segment
+    return data[start:stop][::-1] if flipped else data[start:stop]
+
+class SegmentStack:
+    def __init__(self, crates=b''):
+        crates = bytes(crates)
+        self.segments = [(crates, 0, len(crates), False)] if crates else []
+        self.size = len(crates)
+
+    def __len__(self):
+        return self.size
+
+    def __bytes__(self):
+        return b"".join(map(segment_crates, self.segments))
+
+    # The top crate, as a byte
+    def top(self):
+        data, start, stop, flipped = self.segments[-1]
+        return data[start] if flipped else data[stop - 1]
+
+    # Remove the top count crates, and return their segments from the bottom up
+    def take(self, count):
+        if count > self.size:
+            raise IndexError("Can't take %d crates from a stack of %d" % (count, self.size))
+        self.size -= count
+        taken = []
+        while count:
+            data, start, stop, flipped = self.segments[-1]
+            if stop - start <= count:
+                taken.append(self.segments.pop())
+                count -= stop - start
+            elif flipped:
+                # a reversed segment's top crates are at its start
+                self.segments[-1] = (data, start + count, stop, True)
+                taken.append((data, start, start + count, True))
+                count = 0
+            else:
+                self.segments[-1] = (data, start, stop - count, False)
+                taken.append((data, stop - count, stop, False))
+                count = 0
+        taken.reverse()
+        return taken
+
+    # Put segments on top of the stack, or upside down if reverse is set
+    def put(self, segments, reverse=False):
+        if reverse:
+            segments = [(data, start, stop, not flipped) for data, start, stop, flipped in reversed(segments)]
+        stack = self.segments
+        for segment in segments:
+            _, start, stop, _ = segment
+            self.size += stop - start
+            if stack and stop - start < MERGE_SIZE:
+                _, below_start, below_stop, _ = stack[-1]
+                if below_stop - below_start + stop - start <= MERGE_SIZE:
+                    crates = segment_crates(stack[-1]) + segment_crates(segment)
+                    stack[-1] = (crates, 0, len(crates), False)
+                    continue
+            stack.append(segment)
+
+def segment_mover_9000(stacks, moves):
+    for count, source, dest in moves:
+        stacks[dest].put(stacks[source].take(count), reverse=True)
+    return stacks
+
+def segment_mover_9001(stacks, moves):
+    for count, source, dest in moves:
+        stacks[dest].put(stacks[source].take(count))
+    return stacks
+
+def segment_tops(stacks):
+    return "".join(chr(stack.top()) for stack in stacks if len(stack))
+
+# Time moving count crates back and forth between two stacks of height crates with each
+# stack type, to find the move size where segments start to beat slices.
+def crossover(height=100000, counts=(1, 10, 100, 1000, 10000, 100000), moves=10000, repeat=3):
+    from aoc.bench import time_call
+
+    stack_types = {
+        'list': (list, crate_mover_9001),
+        'bytearray': (bytearray, crate_mover_9001),
+        'segments': (SegmentStack, segment_mover_9001),
+    }
+    for count in counts:
+        procedure = [(count, 0, 1), (count, 1, 0)] * (moves // 2)
+        timings = []
+        for name, (stack_type, mover) in stack_types.items():
+            def run(procedure):
+                stacks = [stack_type(b'A' * height), stack_type(b'B' * height)]
+                return mover(stacks, procedure)
+            elapsed, _ = time_call(run, procedure, repeat)
+            timings.append("%s %.3f us" % (name, elapsed / moves * 1e6))
+        print("%7d crates per move: %s" % (count, ", ".join(timings)))
+
+# Time moving one crate at a time from one stack of height crates on to another, so the
+# moved crates pile up on a tall stack, with each stack type.
+def pileup(heights=(10**5, 10**6, 10**7), moves=9000, repeat=3):
+    from aoc.bench import time_call
+
+    stack_types = {
+        'bytearray': (bytearray, crate_mover_9001),
+        'segments': (SegmentStack, segment_mover_9001),
+    }
+    procedure = [(1, 0, 1)] * moves
+    for height in heights:
+        timings = []
+        for name, (stack_type, mover) in stack_types.items():
+            stacks = [stack_type(b'A' * height) for _ in range(repeat * 2)]
+            def run(procedure):
+                return mover([stacks.pop(), stacks.pop()], procedure)
+            elapsed, _ = time_call(run, procedure, repeat)
+            timings.append("%s %.3f us" % (name, elapsed / moves * 1e6))
+        print("%9d crates high: %s" % (height, ", ".join(timings)))
+
+# The crate drawing depends on leading whitespace, so the stacks are read from the raw buffer
+def parse(input):
+    return parse_stacks(input.buffer), parse_moves(input.buffer)
+
+# What crate ends up on top of each stack after the CrateMover 9000 rearranges them?
+# With segments set the stacks are SegmentStacks, for procedures that move thousands of crates at a time.
+def part1(procedure, segments=False):
+    stacks, moves = procedure
+    if segments:
+        return segment_tops(segment_mover_9000([SegmentStack(crates) for crates in stacks], moves))
+    return top_crates(crate_mover_9000([bytearray(crates) for crates in stacks], moves))
+
+# What crate ends up on top of each stack after the CrateMover 9001 rearranges them?
+def part2(procedure, segments=False):
+    stacks, moves = procedure
+    if segments:
+        return segment_tops(segment_mover_9001([SegmentStack(crates) for crates in stacks], moves))
+    return top_crates(crate_mover_9001([bytearray(crates) for crates in stacks], moves))
+
+# Alternate engines for each part, timed against each other by `python -m aoc bench engines 5`
+ENGINES = {
+    'lists': {
+        1: lambda input: top_crates_9000(input.text),
+        2: lambda input: top_crates_9001(input.text),
+    },
+    'extend': {
+        1: lambda input: part1(parse(input)),
+        2: lambda input: part2(parse(input)),
+    },
+    'segments': {
+        1: lambda input: part1(parse(input), segments=True),
+        2: lambda input: part2(parse(input), segments=True),
+    },
+}
+
 if __name__ == '__main__':
+    if sys.argv[1] == '--crossover':
+        crossover()
+        sys.exit(0)
+    if sys.argv[1] == '--pileup':
+        pileup()
+        sys.exit(0)
     # Read in the input
-    with open(sys.argv[1]) as f:
-        lines = f.readlines()
-    print(part2(lines))
+    procedure = parse(InputFile(sys.argv[1]))
+    print(part1(procedure))
+    print(part2(procedure))
@@ -32,8 +32,10 @@ zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw: first marker after character 11
 
 import sys
 
+from aoc.inputs import InputFile
+
 # How many characters need to be processed before the first start-of-packet marker is detected?
-def part1(line):
+def start_of_packet(line):
     # find the first 4 characters that are all different
     for i in range(len(line)-3):
         if len(set(line[i:i+4])) == 4:
@@ -57,16 +59,114 @@ zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw: first marker after character 26
 """
 
 # How many characters need to be processed before the first start-of-message marker is detected?
-def part2(line):
+def start_of_message(line):
     # find the first 14 characters that are all different
     for i in range(len(line)-13):
         if len(set(line[i:i+14])) == 14:
             return i+14
     return -1
 
+"""
+Single pass version: a marker of w characters ends at the first position where the run of
+distinct characters ending there is w long. MarkerDetector keeps the last position each byte
+value was seen at and where the current distinct run starts; when a byte was last seen
+inside the run, the run restarts just after it. That is O(1) per byte whatever the window
+size, and one pass finds the first marker for every window size at once.
+
+The detector only holds those 256 positions, so a datastream can be fed to it a chunk at a
+time from a file, stdin or a socket (through sock.makefile('rb')), and a marker can straddle
+chunks.
+"""
+
+PACKET_WINDOW = 4
+MESSAGE_WINDOW = 14
+
+class MarkerDetector:
+    def __init__(self, windows=(PACKET_WINDOW, MESSAGE_WINDOW)):
+        self.windows = sorted(set(windows))
+        # markers[w] is the number of characters before the end of the first w character marker
+        self.markers = {}
+        self.last_seen = [-1] * 256
+        self.run_start = 0
+        self.position = 0
+
+    # Whether every window's marker has been found
+    @property
+    def done(self):
+        return len(self.markers) == len(self.windows)
+
+    # Read the next bytes of the datastream, and return the markers found so far
+    def feed(self, chunk):
+        if self.done:
+            return self.markers
+        last_seen = self.last_seen
+        run_start = self.run_start
+        position = self.position
+        pending = self.windows[len(self.markers):]
+        window = pending[0]
+        for byte in chunk:
+            seen = last_seen[byte]
+            if seen >= run_start:
+                run_start = seen + 1
+            last_seen[byte] = position
+            position += 1
+            if position - run_start >= window:
+                # the run can pass more than one window size at once
+                while pending and position - run_start >= pending[0]:
+                    self.markers[pending.pop(0)] = position
+                if not pending:
+                    break
+                window = pending[0]
+        self.run_start = run_start
+        self.position = position
+        return self.markers
+
+def read_chunks(stream, chunk_size=1 << 16):
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+# The first marker of each window size in a stream of byte chunks, -1 for any not found
+def find_markers(chunks, windows=(PACKET_WINDOW, MESSAGE_WINDOW)):
+    detector = MarkerDetector(windows)
+    for chunk in chunks:
+        detector.feed(chunk)
+        if detector.done:
+            break
+    return {window: detector.markers.get(window, -1) for window in detector.windows}
+
+# The datastream is the first line of the input, left as a memoryview of the mapped file.
+# Slicing it doesn't copy, and set() of a slice works the same as for a str.
+def parse(input):
+    return input.first_line()
+
+def part1(line):
+    return find_markers([line], [PACKET_WINDOW])[PACKET_WINDOW]
+
+def part2(line):
+    return find_markers([line], [MESSAGE_WINDOW])[MESSAGE_WINDOW]
+
+# Alternate engines for each part, timed against each other by `python -m aoc bench engines 6`
+ENGINES = {
+    'sets': {
+        1: lambda input: start_of_packet(input.first_line()),
+        2: lambda input: start_of_message(input.first_line()),
+    },
+    'detector': {
+        1: lambda input: part1(input.first_line()),
+        2: lambda input: part2(input.first_line()),
+    },
+}
+
 if __name__ == '__main__':
-    # Read in the input
-    with open(sys.argv[1]) as f:
-        lines = f.readlines()
-        for line in lines:
-            print(part2(line.strip()))
+    if len(sys.argv) > 1 and sys.argv[1] == '-':
+        # stream from stdin: print the first marker for each window size given (4 and 14 by default)
+        windows = [int(window) for window in sys.argv[2:]] or [PACKET_WINDOW, MESSAGE_WINDOW]
+        for window, marker in find_markers(read_chunks(sys.stdin.buffer), windows).items():
+            print("%d: %d" % (window, marker))
+    else:
+        # Read in the input
+        for line in InputFile(sys.argv[1]).views():
+            print(*find_markers([line]).values())
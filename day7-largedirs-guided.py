@@ -59,8 +59,11 @@ To begin, find all of the directories with a total size of at most 100000, then
 import json
 import sys
 
+from aoc.dirtree import DirTree
+from aoc.inputs import InputFile
 
-def part1(lines):
+
+def small_dirs_total(lines):
     # Create a dictionary to store the file system
     file_system = {}
     # Create a list to store the current directory
@@ -115,7 +118,7 @@ Amount of space needed is the size of the smallest directory that, if deleted, w
 """
 
 # Find the smallest directory that, if deleted, would free up enough space on the filesystem to run the update. What is the total size of that directory?
-def part2(lines):
+def dir_to_delete(lines):
     # Create a dictionary to store the file system
     file_system = {}
     # Create a list to store the current directory
@@ -161,9 +164,37 @@ def part2(lines):
     return min([value for key, value in file_system.items() if value > space_needed])
 
 
+SMALL_DIR_SIZE = 100000
+DISK_SIZE = 70000000
+UPDATE_SIZE = 30000000
+
+# The transcript is read once in to a DirTree (aoc/dirtree.py), and both parts are size queries on it
+def parse(input):
+    return DirTree.from_lines(input.text)
+
+# What is the sum of the total sizes of the directories of at most 100000?
+def part1(tree):
+    return tree.total_at_most(SMALL_DIR_SIZE)
+
+# What is the total size of the smallest directory larger than the space the update still needs?
+def part2(tree):
+    needed_size = UPDATE_SIZE - (DISK_SIZE - tree.sizes[DirTree.ROOT])
+    return tree.smallest_at_least(needed_size + 1)
+
+# Alternate engines for each part, timed against each other by `python -m aoc bench engines 7`
+ENGINES = {
+    'strings': {
+        1: lambda input: small_dirs_total(input.text),
+        2: lambda input: dir_to_delete(input.text),
+    },
+    'tree': {
+        1: lambda input: part1(parse(input)),
+        2: lambda input: part2(parse(input)),
+    },
+}
+
 if __name__ == '__main__':
     # Read in the input
-    with open(sys.argv[1]) as f:
-        lines = f.readlines()
-    print(part1(lines))
-    print(part2(lines))
+    tree = parse(InputFile(sys.argv[1]))
+    print(part1(tree))
+    print(part2(tree))
@@ -67,11 +67,14 @@ As the outermost directory, / contains every file. Its total size is 48381165, t
 To begin, find all of the directories with a total size of at most 100000, then calculate the sum of their total sizes. In the example above, these directories are a and e; the sum of their total sizes is 95437 (94853 + 584). (As in this example, this process can count files more than once!)
 """
 
-import sys
 import json
+import sys
+
+from aoc.dirtree import DirTree
+from aoc.inputs import InputFile
 
 # Find all of the directories with a total size of at most 100000. What is the sum of the total sizes of those directories?
-def part1(lines):
+def small_dirs_total(lines):
     # Create a dictionary to store the file system
     file_system = {}
     # Create a list to store the current directory
@@ -132,7 +135,7 @@ Directories e and a are both too small; deleting them would not free up enough s
 """
 
 # Find the smallest directory that, if deleted, would free up enough space on the filesystem to run the update. What is the total size of that directory?
-def part2(lines):
+def dir_to_delete(lines):
     # Create a dictionary to store the file system
     file_system = {'/': 0}
     # Create a list to store the current directory
@@ -177,9 +180,59 @@ def part2(lines):
     return min(filter(lambda x:  x >= needed_size, file_system.values()))
     
 
+SMALL_DIR_SIZE = 100000
+DISK_SIZE = 70000000
+UPDATE_SIZE = 30000000
+
+# The transcript is read once in to a DirTree (aoc/dirtree.py), and both parts are size queries on it
+def parse(input):
+    return DirTree.from_lines(input.text)
+
+# What is the sum of the total sizes of the directories of at most 100000?
+def part1(tree):
+    return tree.total_at_most(SMALL_DIR_SIZE)
+
+# What is the total size of the smallest directory at least the space the update still needs?
+def part2(tree):
+    needed_size = UPDATE_SIZE - (DISK_SIZE - tree.sizes[DirTree.ROOT])
+    return tree.smallest_at_least(needed_size)
+
+# Alternate engines for each part, timed against each other by `python -m aoc bench engines 7`
+ENGINES = {
+    'strings': {
+        1: lambda input: small_dirs_total(input.text),
+        2: lambda input: dir_to_delete(input.text),
+    },
+    'tree': {
+        1: lambda input: part1(parse(input)),
+        2: lambda input: part2(parse(input)),
+    },
+}
+
+# Follow a transcript that is still being written (python3 day7-largedirs.py - < crawl.log, or
+# tail -f crawl.log | python3 day7-largedirs.py -), printing both answers after each batch of lines
+def follow(stream, chunk_size=1 << 16):
+    tree = DirTree()
+    carry = b""
+    while True:
+        chunk = stream.read1(chunk_size)
+        if not chunk:
+            break
+        lines = (carry + chunk).split(b"\n")
+        # the last line may not be complete yet
+        carry = lines.pop()
+        tree.feed(line.decode() for line in lines)
+        print(part1(tree), part2(tree), flush=True)
+    if carry:
+        tree.feed([carry.decode()])
+        print(part1(tree), part2(tree), flush=True)
+    return tree
+
 if __name__ == '__main__':
+    if sys.argv[1] == '-':
+        follow(sys.stdin.buffer)
+        sys.exit(0)
     # Read in the input
-    with open(sys.argv[1]) as f:
-        lines = f.readlines()
-    print(part1(lines))
-    print(part2(lines))
+    tree = parse(InputFile(sys.argv[1]))
+    print(part1(tree))
+    print(part2(tree))
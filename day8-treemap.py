@@ -33,21 +33,27 @@ With 16 trees visible on the edge and another 5 visible in the interior, a total
 2. Call that function with input from a file passed in on the command line, which is a 2d list of numbers
 """
 
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy
-import pandas
+
+from aoc.grid import Grid
+from aoc.inputs import InputFile
 
 def count_visible_trees(map):
     """
     Count the number of trees visible from outside the grid.
     """
-    # Convert the map to a numpy array
-    map_array = numpy.array(map)
+    # The heights as a plain array, for slicing out the lines of sight
+    map_array = map.cells
     # Get the dimensions of the map
     map_height = map_array.shape[0]
     map_width = map_array.shape[1]
-    # Create a dataframe to hold the results
-    results = pandas.DataFrame(index=range(map_height), columns=range(map_width))
+    # A grid of the same shape to mark the visible trees in
+    results = Grid.full(map.shape, 0)
     # Loop through the rows
     for row in range(map_height):
         # Loop through the columns
@@ -63,19 +69,63 @@ def count_visible_trees(map):
             # Get the heights of the trees below
             below_heights = map_array[row+1:, col]
             # Check if the current tree is visible from the left
-            if len(left_heights) == 0 or tree_height > max(left_heights):
-                results.loc[row, col] = 1
+            if len(left_heights) == 0 or tree_height > left_heights.max():
+                results[row, col] = 1
             # Check if the current tree is visible from the right
-            if len(right_heights) == 0 or tree_height > max(right_heights):
-                results.loc[row, col] = 1
+            elif len(right_heights) == 0 or tree_height > right_heights.max():
+                results[row, col] = 1
             # Check if the current tree is visible from above
-            if len(above_heights) == 0 or tree_height > max(above_heights):
-                results.loc[row, col] = 1
+            elif len(above_heights) == 0 or tree_height > above_heights.max():
+                results[row, col] = 1
             # Check if the current tree is visible from below
-            if len(below_heights) == 0 or tree_height > max(below_heights):
-                results.loc[row, col] = 1
+            elif len(below_heights) == 0 or tree_height > below_heights.max():
+                results[row, col] = 1
     # Count the number of trees visible from outside the grid
-    return results.sum().sum()
+    return int(results.cells.sum())
+
+def mark_visible(heights, seen, above=None, below=None, block_rows=512):
+    """
+    Mark in seen the trees of a block of whole rows that are visible from outside the grid.
+    above and below are the tallest tree in each column above and below the block, or None
+    where the block is at the edge of the grid.
+
+    A tree is visible from the left if it's taller than the running maximum of the trees
+    before it in its row, which np.maximum.accumulate gives for a block of rows at once; from
+    the right it's the same on the flipped rows. Looking down the columns, the running maximum
+    is carried from one row to the next instead (starting from above or below), which keeps
+    every pass over contiguous rows. The temporary arrays are only block_rows rows.
+    """
+    rows = heights.shape[0]
+    # from the left and from the right
+    for view, marks in ((heights, seen), (heights[:, ::-1], seen[:, ::-1])):
+        for start in range(0, rows, block_rows):
+            block = view[start:start + block_rows]
+            tallest = numpy.maximum.accumulate(block, axis=1)
+            marks[start:start + block_rows, 0] = True
+            marks[start:start + block_rows, 1:] |= block[:, 1:] > tallest[:, :-1]
+    # from the top and from the bottom
+    for view, marks, outside in ((heights, seen, above), (heights[::-1], seen[::-1], below)):
+        if outside is None:
+            tallest = view[0].copy()
+            marks[0] = True
+            first = 1
+        else:
+            tallest = outside.copy()
+            first = 0
+        for row in range(first, rows):
+            marks[row] |= view[row] > tallest
+            numpy.maximum(tallest, view[row], out=tallest)
+    return seen
+
+def visible_trees(map):
+    """
+    The trees visible from outside the grid, as a boolean Grid, and how many there are.
+    """
+    heights = map.cells
+    visible = numpy.zeros(heights.shape, dtype=bool)
+    if visible.size:
+        mark_visible(heights, visible)
+    return Grid(visible, map.origin), int(numpy.count_nonzero(visible))
 
 """
 --- Part Two ---
@@ -125,14 +175,14 @@ def highest_scenic_score(map):
     """
     Consider each tree on your map. What is the highest scenic score possible for any tree?
     """
-    # Convert the map to a numpy array
-    map_array = numpy.array(map)
+    # The heights as a plain array, for walking out from each tree
+    map_array = map.cells
     # Get the dimensions of the map
     map_height = map_array.shape[0]
     map_width = map_array.shape[1]
 
-    # Create a dataframe to hold the results
-    results = pandas.DataFrame(index=range(map_height), columns=range(map_width))
+    # A grid of the same shape to hold the scores (the edges stay 0)
+    results = Grid.full(map.shape, 0, dtype=numpy.int64)
     # Loop through the rows (but not the edges, as they'll have a 0 that makes this pointless)
     for row in range(1, map_height - 1):
         # Loop through the columns (but not the edges, as they'll have a 0 that makes this pointless)
@@ -186,20 +236,220 @@ def highest_scenic_score(map):
             else:
                 distance_right = next_right - col
 
-            results.loc[row, col] = distance_up * distance_down * distance_left * distance_right
+            results[row, col] = distance_up * distance_down * distance_left * distance_right
 
     # Return the highest scenic score
-    return results.max().max()
+    return int(results.cells.max())
+
+"""
+Scenic scores for every tree at once: walking down a column, keep for each height h the
+last row holding a tree at least h tall (the edge, row 0, until there is one). A tree of
+height h at row r then sees r - last[h] trees above it, and becomes the last tree for every
+height up to its own. With only 10 heights that table is all the stack the walk needs, and
+it's kept for every column at once, so looking up is one pass down the rows. Looking down
+is the same walk on the flipped grid, and left and right are the walks on the transposed
+grid, so every step works on a contiguous row.
+"""
+
+HEIGHTS = 10
+# Grids smaller than this are scored in this process; starting workers costs more than it saves
+PARALLEL_CELLS = 1 << 22
+
+def viewing_distances(heights, last=None, first_row=0):
+    """
+    How many trees each tree in a 2d array of heights sees looking up its column. For a
+    block of rows that doesn't start at the top, first_row is the block's first row and last
+    is the table left by the rows above it; the table is updated in place.
+    """
+    rows, cols = heights.shape
+    distances = numpy.zeros((rows, cols), dtype=numpy.int32)
+    # last[h, c] is the last row so far in column c with a tree at least h tall
+    if last is None:
+        last = numpy.zeros((HEIGHTS, cols), dtype=numpy.int32)
+    levels = numpy.arange(HEIGHTS, dtype=heights.dtype)[:, numpy.newaxis]
+    columns = numpy.arange(cols)
+    covered = numpy.empty((HEIGHTS, cols), dtype=bool)
+    marks = numpy.empty((HEIGHTS, cols), dtype=numpy.int32)
+    for index in range(rows):
+        line = heights[index]
+        row = first_row + index
+        numpy.subtract(row, last.ravel().take(line.astype(numpy.intp) * cols + columns), out=distances[index])
+        # this tree is now the last one for every height up to its own; rows only go up, so a
+        # maximum sets those and leaves the others (a masked assignment is several times slower)
+        numpy.less_equal(levels, line, out=covered)
+        numpy.multiply(covered, row, out=marks)
+        numpy.maximum(last, marks, out=last)
+    return distances
+
+def column_scores(heights):
+    """
+    The product of the up and down viewing distances of each tree in a block of columns.
+    """
+    return viewing_distances(heights).astype(numpy.int64) * viewing_distances(heights[::-1])[::-1]
+
+def scenic_scores(map, top=10, workers=None):
+    """
+    The scenic score of every tree as a Grid, the position of the highest scoring tree, and
+    the positions and scores of the top best trees, highest first.
+
+    The columns (for looking up and down) and the rows (left and right, as the columns of
+    the transposed grid) are scored in blocks over a pool of workers processes,
+    os.cpu_count() by default, for grids of PARALLEL_CELLS trees or more. The workers are
+    forked, since they run column_scores from this script, which is loaded under a name
+    a spawned interpreter couldn't import; where fork isn't available it's all done here.
+    """
+    heights = numpy.ascontiguousarray(map.cells)
+    across = numpy.ascontiguousarray(heights.T)
+    workers = workers or os.cpu_count() or 1
+    try:
+        fork = multiprocessing.get_context('fork')
+    except ValueError:
+        fork = None
+    if workers == 1 or heights.size < PARALLEL_CELLS or fork is None:
+        scores = column_scores(heights) * column_scores(across).T
+    else:
+        def blocks(array):
+            step = -(-array.shape[1] // workers)
+            return [numpy.ascontiguousarray(array[:, start:start + step]) for start in range(0, array.shape[1], step)]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=fork) as pool:
+            vertical = pool.map(column_scores, blocks(heights))
+            horizontal = pool.map(column_scores, blocks(across))
+            scores = numpy.concatenate(list(vertical), axis=1) * numpy.concatenate(list(horizontal), axis=1).T
+    scores = Grid(scores, map.origin)
+    return scores, scores.position(numpy.unravel_index(scores.cells.argmax(), scores.shape)), best_trees(scores, top)
+
+def best_trees(scores, count):
+    """
+    The positions and scores of the count highest scoring trees in a Grid of scores, highest first.
+    """
+    flat = scores.cells.ravel()
+    count = min(count, flat.size)
+    if count <= 0:
+        return []
+    best = numpy.argpartition(flat, flat.size - count)[flat.size - count:]
+    best = best[numpy.argsort(flat[best], kind='stable')[::-1]]
+    return [(scores.position(numpy.unravel_index(index, scores.shape)), int(flat[index])) for index in best.tolist()]
+
+"""
+Tiled version, for maps too big to hold in memory: the digits are read through the mapped
+file (InputFile.grid()) a tile of whole rows at a time, so only a tile's heights and
+temporaries are ever in memory. Looking left and right stays inside a tile's rows. Looking
+up and down crosses tiles, so what each tile needs from the rest of its columns is carried
+in: a bottom up pass first records, for each tile, the state of everything below it (the
+tallest tree per column, or the last-taller table for the viewing distances), then a top down
+pass carries the same state from above while it does the work. The tables are 40 bytes a
+column per tile, so they're kept in a temporary file rather than in memory.
+"""
+
+# Trees per tile, when the tile size isn't given; the scenic scores need about 40 bytes a tree
+TILE_CELLS = 1 << 21
+
+def tile_height(digits, tile_rows=None):
+    return tile_rows or max(1, TILE_CELLS // max(digits.shape[1], 1))
+
+def height_tiles(digits, tile_rows=None, reverse=False):
+    """
+    Yield (first row, heights) for each tile of tile_rows rows (TILE_CELLS trees' worth by
+    default) of a uint8 array of digit characters, such as InputFile.grid().
+    """
+    tile_rows = tile_height(digits, tile_rows)
+    starts = range(0, digits.shape[0], tile_rows)
+    for start in reversed(starts) if reverse else starts:
+        yield start, digits[start:start + tile_rows] - numpy.uint8(ord('0'))
+
+def tiled_visible_trees(digits, tile_rows=None, out=None):
+    """
+    How many trees are visible from outside the grid, going through digits a tile at a
+    time. The visible trees are also marked in out, a boolean array (or numpy.memmap) of the
+    same shape, if it's given.
+    """
+    # the tallest tree in each column below each tile
+    below = {}
+    tallest = None
+    for start, heights in height_tiles(digits, tile_rows, reverse=True):
+        below[start] = tallest
+        tallest = heights.max(axis=0) if tallest is None else numpy.maximum(tallest, heights.max(axis=0))
+    count = 0
+    above = None
+    for start, heights in height_tiles(digits, tile_rows):
+        seen = mark_visible(heights, numpy.zeros(heights.shape, dtype=bool), above, below.pop(start))
+        count += int(numpy.count_nonzero(seen))
+        if out is not None:
+            out[start:start + len(heights)] = seen
+        above = heights.max(axis=0) if above is None else numpy.maximum(above, heights.max(axis=0))
+    return count
+
+def tiled_scenic_scores(digits, tile_rows=None, top=10, out=None):
+    """
+    The position of the highest scoring tree and the positions and scores of the top best
+    trees, going through digits a tile at a time. Every tree's score is also written to out,
+    an int64 array (or numpy.memmap) of the same shape, if it's given.
+    """
+    import heapq
+    import tempfile
+
+    rows, cols = digits.shape
+    tile_rows = tile_height(digits, tile_rows)
+    tiles = -(-rows // tile_rows)
+    with tempfile.TemporaryFile() as spill:
+        # the last-taller table for looking down, as it stands below each tile; rows are counted from the bottom
+        tables = numpy.memmap(spill, dtype=numpy.int32, mode='w+', shape=(max(tiles, 1), HEIGHTS, cols))
+        last = numpy.zeros((HEIGHTS, cols), dtype=numpy.int32)
+        for tile, (start, heights) in zip(reversed(range(tiles)), height_tiles(digits, tile_rows, reverse=True)):
+            tables[tile] = last
+            viewing_distances(heights[::-1], last, rows - start - len(heights))
+        best = []
+        last = numpy.zeros((HEIGHTS, cols), dtype=numpy.int32)
+        for tile, (start, heights) in enumerate(height_tiles(digits, tile_rows)):
+            up = viewing_distances(heights, last, start)
+            down = viewing_distances(heights[::-1], numpy.array(tables[tile]), rows - start - len(heights))[::-1]
+            sideways = column_scores(numpy.ascontiguousarray(heights.T)).T
+            scores = sideways * up * down
+            if out is not None:
+                out[start:start + len(heights)] = scores
+            best = heapq.nlargest(top, best + best_trees(Grid(scores, (start, 0)), top), key=lambda tree: tree[1])
+        del tables
+    return (best[0][0] if best else None), best
+
+def parse(input):
+    """
+    Turn the grid of digits into a Grid of tree heights, straight from the mapped file.
+    """
+    return Grid(input.grid() - ord('0'))
+
+def part1(map):
+    return visible_trees(map)[1]
+
+def part2(map):
+    scores, best, _ = scenic_scores(map, top=1)
+    return int(scores[best])
+
+# Alternate engines for each part, timed against each other by `python -m aoc bench engines 8`
+ENGINES = {
+    'loops': {
+        1: lambda input: count_visible_trees(parse(input)),
+        2: lambda input: highest_scenic_score(parse(input)),
+    },
+    'numpy': {
+        1: lambda input: part1(parse(input)),
+        2: lambda input: part2(parse(input)),
+    },
+}
 
 if __name__ == "__main__":
+    if sys.argv[1] == "--tiled":
+        # python3 day8-treemap.py --tiled <input> [tile rows]: for maps too big for memory
+        digits = InputFile(sys.argv[2]).grid()
+        tile_rows = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        print(tiled_visible_trees(digits, tile_rows))
+        best, top = tiled_scenic_scores(digits, tile_rows, top=1)
+        print(top[0][1])
+        sys.exit(0)
     # Get the input file from the command line
     input_file = sys.argv[1]
-    # Read the input file
-    with open(input_file, 'r') as f:
-        # Read the input file as a list of lists
-        map = [list(line.strip()) for line in f]
-    # Convert the map to a list of lists of integers
-    map = [[int(x) for x in row] for row in map]
+    # Read the input file as a 2d array of integers
+    map = parse(InputFile(input_file))
     # Count the number of trees visible from outside the grid
-    print(count_visible_trees(map))
-    print(highest_scenic_score(map))
\ No newline at end of file
+    print(part1(map))
+    # Find the best scenic score
+    print(part2(map))
\ No newline at end of file
@@ -250,7 +250,10 @@ So, there are 13 positions the tail visited at least once.
 
 import sys
 
-def part1(moves):
+from aoc.inputs import InputFile
+from aoc.visited import VisitedCells
+
+def two_knot_visits(moves):
     # Simulate rope
     # Use input moves to move the head of the rope
     # Keep the tail of the rope within 1 square of the head (in any direction, or overlapping)
@@ -325,7 +328,7 @@ Using the same series of motions as the above example, but with the knots marked
 2. Simulate your complete series of motions on a larger rope with ten knots. How many positions does the tail of the rope visit at least once?
 """
 
-def part2(moves):
+def ten_knot_visits(moves):
     # Simulate rope
     # Use input moves to move the head of the rope
     # Keep the tail of the rope within 1 square of the head (in any direction, or overlapping)
@@ -389,18 +392,136 @@ def part2(moves):
     return len(visited)
     
 
+"""
+One simulator for a rope of any length: the head steps along each motion, and each knot after
+it moves one step towards the knot in front (the sign of their difference on each axis)
+whenever the two stop touching. A knot that doesn't move leaves everything behind it where it
+was, so the rest of the rope is skipped for that step; on long ropes most steps only move
+the first few knots. Every knot's visited positions come out of the same run. A two knot
+rope is done a motion at a time, since its tail just trails the head once it starts moving.
+"""
+
+DIRECTIONS = {'R': (1, 0), 'L': (-1, 0), 'U': (0, 1), 'D': (0, -1)}
+
+# Each motion as (dx, dy, steps)
+def parse_motions(lines):
+    motions = []
+    for line in lines:
+        words = line.split()
+        if words:
+            motions.append(DIRECTIONS[words[0]] + (int(words[1]),))
+    return motions
+
+# Run the motions on a rope of knots knots. Returns the final x and y of each knot, head
+# first, and the VisitedCells of the positions each knot visited; only the knots in track
+# (all of them by default) have their positions recorded, the others get None.
+def run_rope(motions, knots=10, track=None):
+    # the knots are plain ints while the rope moves; numpy.sign on single elements is several times slower
+    xs = [0] * knots
+    ys = [0] * knots
+    track = range(knots) if track is None else [knot % knots for knot in track]
+    visited = [None] * knots
+    for knot in track:
+        visited[knot] = VisitedCells()
+        visited[knot].add(0, 0)
+    head_visits = visited[0]
+    if knots == 2:
+        return run_short_rope(motions, xs, ys, visited)
+    followers = range(1, knots)
+    for dx, dy, steps in motions:
+        for _ in range(steps):
+            x = xs[0] + dx
+            y = ys[0] + dy
+            xs[0] = x
+            ys[0] = y
+            if head_visits is not None:
+                head_visits.add(x, y)
+            for knot in followers:
+                delta_x = x - xs[knot]
+                delta_y = y - ys[knot]
+                if -1 <= delta_x <= 1 and -1 <= delta_y <= 1:
+                    break
+                x = xs[knot] + (delta_x > 0) - (delta_x < 0)
+                y = ys[knot] + (delta_y > 0) - (delta_y < 0)
+                xs[knot] = x
+                ys[knot] = y
+                seen = visited[knot]
+                if seen is not None:
+                    seen.add(x, y)
+    return xs, ys, visited
+
+# run_rope for a rope of two knots, a motion at a time: the tail starts moving on the step
+# that takes the head two away from it along the motion, lands right behind the head, and
+# trails it for the rest of the motion
+def run_short_rope(motions, xs, ys, visited):
+    head_visits, tail_visits = visited
+    x, y = xs[0], ys[0]
+    tail_x, tail_y = xs[1], ys[1]
+    for dx, dy, steps in motions:
+        if head_visits is not None:
+            head_visits.add_line(x + dx, y + dy, dx, dy, steps)
+        # how far the head is ahead of the tail along the motion, -1 to 1
+        ahead = (x - tail_x) * dx + (y - tail_y) * dy
+        x += dx * steps
+        y += dy * steps
+        moves = steps + ahead - 1
+        if moves > 0:
+            if tail_visits is not None:
+                tail_visits.add_line(x - dx * moves, y - dy * moves, dx, dy, moves)
+            tail_x, tail_y = x - dx, y - dy
+    return [x, tail_x], [y, tail_y], visited
+
+# run_rope with the final positions as an (N, 2) numpy array
+def simulate(motions, knots=10, track=None):
+    import numpy
+
+    xs, ys, visited = run_rope(motions, knots, track)
+    return numpy.array([xs, ys], dtype=numpy.int64).T, visited
+
+# How many positions each knot of the rope (or each knot in track) visits, head first
+def visit_counts(motions, knots=10, track=None):
+    _, _, visited = run_rope(motions, knots, track)
+    return [len(positions) for positions in visited if positions is not None]
+
+# Each move is a direction and a distance, e.g. "R 4"
+def parse(input):
+    return parse_motions(input.text)
+
+# How many positions does the tail of a 2 knot rope visit at least once?
+def part1(motions):
+    return visit_counts(motions, 2, track=[-1])[0]
+
+# How many positions does the tail of a 10 knot rope visit at least once?
+def part2(motions):
+    return visit_counts(motions, 10, track=[-1])[0]
+
+# Alternate engines for each part, timed against each other by `python -m aoc bench engines 9`
+ENGINES = {
+    'loop': {
+        1: lambda input: two_knot_visits(input.text),
+        2: lambda input: ten_knot_visits(input.text),
+    },
+    'rope': {
+        1: lambda input: part1(parse(input)),
+        2: lambda input: part2(parse(input)),
+    },
+}
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
-        print("Usage: python3 %s <input>" % sys.argv[0])
+        print("Usage: python3 %s <input> [knots [--draw]]" % sys.argv[0])
         sys.exit(1)
 
-    with open(sys.argv[1]) as f:
-        lines = f.readlines()
-
     # Parse input
-    moves = []
-    for line in lines:
-        moves.append(line.strip())
-
-    # print(part1(moves))
-    print(part2(moves))
\ No newline at end of file
+    motions = parse(InputFile(sys.argv[1]))
+    if len(sys.argv) > 3 and sys.argv[3] == '--draw':
+        # where the tail of the rope went, and the box it stayed in
+        _, visited = simulate(motions, int(sys.argv[2]), track=[-1])
+        print(visited[-1].render())
+        print(len(visited[-1]), visited[-1].bounds())
+    elif len(sys.argv) > 2:
+        # the visited count of every knot of a longer rope, head first
+        print(*visit_counts(motions, int(sys.argv[2])))
+    else:
+        print(part1(motions))
+        print(part2(motions))